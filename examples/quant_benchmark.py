@@ -59,6 +59,16 @@ def main():
         import traceback
         traceback.print_exc()
 
+    print("\n--- Compiling to Python, record-batch mode (Free Lane) ---")
+    try:
+        batch = eidos.run(flow, engine="columnar")()
+        # Indicators append columns; rows are never copied
+        print(f"Columnar Result: {batch}")
+    except Exception as e:
+        print(f"Columnar Failed: {e}")
+        import traceback
+        traceback.print_exc()
+
     print("\n--- Compiling to DolphinDB (Pushdown Lane) ---")
     try:
         from eidos.zero.compiler import Compiler
@@ -3,8 +3,9 @@ Eidos: The Neuro-Symbolic Logic Operating System.
 """
 
 from .zero.symbolism import (
-    Source, Map, Filter, Sink,
+    Source, Map, Filter, WithColumn, Select, Window, Sink,
     Operator, SymbolicStream,
+    col, lit, when,
     Graph, Node, OpType
 )
 from .quant import indicators as quant
@@ -24,6 +25,13 @@ def run(flow, engine=None):
     logger.debug("Running flow", engine=engine)
     if hasattr(flow, "compile"):
         graph = flow.compile()
+        if engine == "auto":
+            from .zero.compiler.planner import Planner
+            planner = Planner()
+            target = planner.choose(graph)
+            result = Compiler.compile(graph, target=target)
+            return planner.timed(graph, target, result) if callable(result) else result
+
         # Detect available backends
         target = engine
         if target == "polars":
@@ -55,8 +63,9 @@ def expose(route=None, method="POST"):
 
 # Expose the DSL as the main entry point
 __all__ = [
-    "Source", "Map", "Filter", "Sink",
+    "Source", "Map", "Filter", "WithColumn", "Select", "Window", "Sink",
     "Operator", "SymbolicStream",
+    "col", "lit", "when",
     "quant", "run", "mcp_tool", "expose"
 ]
 
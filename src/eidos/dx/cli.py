@@ -67,6 +67,7 @@ if __name__ == "__main__":
 def run(
     script: Annotated[str, typer.Argument(help="Path to the pipeline script")],
     cluster: Annotated[Optional[str], typer.Option(help="Ray cluster address (e.g. ray://localhost:6379)")] = None,
+    engine: Annotated[Optional[str], typer.Option(help="Backend to run on (polars, ray, python, auto)")] = None,
     verbose: Annotated[bool, typer.Option(help="Enable verbose logging")] = False
 ):
     """
@@ -102,7 +103,17 @@ def run(
                 console.print("[info]Compiling and executing flow...[/info]")
                 from eidos.zero.compiler import Compiler
                 
-                target = "ray" if cluster else "polars"
+                graph = res.compile()
+                planner = None
+                if cluster:
+                    target = "ray"
+                elif engine == "auto":
+                    from eidos.zero.compiler.planner import Planner
+                    planner = Planner()
+                    target = planner.choose(graph)
+                    console.print(f"[info]Planner selected the [bold]{target}[/bold] backend[/info]")
+                else:
+                    target = engine or "polars"
                 
                 # Check if backend is installed, else fallback
                 if target == "ray":
@@ -119,10 +130,11 @@ def run(
                         console.print("[warning]Polars not installed, falling back to Python Native Execution (Free Lane).[/warning]")
                         target = "python"
                 
-                graph = res.compile()
                 result = Compiler.compile(graph, target=target)
                 
                 if callable(result):
+                    if planner is not None:
+                        result = planner.timed(graph, target, result)
                     result()
                 elif hasattr(result, "collect"): # Polars
                     print(result.collect())
@@ -1,25 +1,49 @@
 import json
 import sys
 import io
+import hashlib
 import contextlib
 import traceback
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
 # Assuming eidos is in path
 from ..zero.symbolism.ast import Graph
+from ..zero.compiler.incremental import IncrementalCompiler
+
+# Open documents whose topology state is kept (least recently analyzed are dropped)
+MAX_DOCUMENTS = 32
+
+class _Document:
+    """Per-document state: the last analyzed text and one compiler per variable."""
+    __slots__ = ("digest", "result", "compilers")
+
+    def __init__(self):
+        self.digest: Optional[str] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.compilers: Dict[str, IncrementalCompiler] = {}
 
 class TopologyExtractor:
     """
     Core logic for the Eidos Language Server.
     Extracts topology from Python code containing Eidos DSL.
+    State is kept per document URI for the `MAX_DOCUMENTS` most recently
+    analyzed documents: the result for the current text, and an incremental
+    compiler per variable so an edit only re-serializes the changed subgraph.
     """
-    
-    @staticmethod
-    def extract_from_source(source_code: str) -> Dict[str, Any]:
+    _documents: "OrderedDict[str, _Document]" = OrderedDict()
+
+    @classmethod
+    def extract_from_source(cls, source_code: str, uri: str = "untitled") -> Dict[str, Any]:
         """
         Executes the provided source code in a sandbox and extracts
         any Eidos Graphs generated.
         """
+        document = cls._document(uri)
+        digest = hashlib.blake2b(source_code.encode("utf-8"), digest_size=16).hexdigest()
+        if document.digest == digest:
+            return document.result
+
         # Capture variables
         local_scope = {}
         
@@ -49,20 +73,37 @@ class TopologyExtractor:
                     if isinstance(g, Graph):
                         graphs.append({
                             "variable": name,
-                            "topology": g.to_json()
+                            "topology": cls._topology(document, name, g)
                         })
                 except Exception:
                     pass
             elif isinstance(value, Graph):
                 graphs.append({
                     "variable": name,
-                    "topology": value.to_json()
+                    "topology": cls._topology(document, name, value)
                 })
-                
-        return {
+
+        result = {
             "graphs": graphs,
             "logs": capture_io.getvalue()
         }
+        # Variables that no longer hold a graph release their compilers
+        variables = {g["variable"] for g in graphs}
+        document.compilers = {k: v for k, v in document.compilers.items() if k in variables}
+        document.digest, document.result = digest, result
+        return result
+
+    @classmethod
+    def _document(cls, uri: str) -> _Document:
+        document = cls._documents.pop(uri, None) or _Document()
+        cls._documents[uri] = document
+        while len(cls._documents) > MAX_DOCUMENTS:
+            cls._documents.popitem(last=False)
+        return document
+
+    @staticmethod
+    def _topology(document: _Document, variable: str, graph: Graph) -> Dict[str, Any]:
+        return document.compilers.setdefault(variable, IncrementalCompiler()).topology(graph)
 
 class EidosLSP:
     """
@@ -73,8 +114,8 @@ class EidosLSP:
         params = request.get("params", {})
         
         if method == "eidos/extractTopology":
-            content = params.get("textDocument", {}).get("text", "")
-            return TopologyExtractor.extract_from_source(content)
+            document = params.get("textDocument", {})
+            return TopologyExtractor.extract_from_source(document.get("text", ""), document.get("uri", "untitled"))
         
         return {"error": "Method not found"}
 
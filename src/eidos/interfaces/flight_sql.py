@@ -3,6 +3,7 @@ import time
 from typing import Any, Dict, Optional, Generator
 from ..system.logging import get_logger
 from ..zero.compiler import Compiler
+from ..zero.compiler.schema import output_schema
 from ..zero.symbolism.dsl import SymbolicStream
 
 logger = get_logger(__name__)
@@ -27,8 +28,7 @@ class EidosFlightServer(BaseServer):
         self.pipelines = pipelines
 
     def get_flight_info_statement(self, context, descriptor, descriptor_sql):
-        # In a real implementation, we'd parse the SQL to determine the output schema
-        # For now, we assume a generic schema or try to compile the target pipeline
+        # The output schema comes from schema inference over the pipeline's plan
         query = descriptor_sql.command.decode('utf-8')
         # simplistic parser: "SELECT * FROM pipeline_name"
         table_name = query.split("FROM")[-1].strip().split(" ")[0]
@@ -36,13 +36,23 @@ class EidosFlightServer(BaseServer):
         if table_name in self.pipelines:
             # Return a ticket that contains the query
             ticket = flight.Ticket(query.encode('utf-8'))
-            # Mock schema for now, in reality derive from pipeline.compile().schema
-            schema = pa.schema([("result", pa.string())])
+            schema = self._schema_for(table_name)
             endpoints = [flight.FlightEndpoint(ticket, [self.location])]
             return flight.FlightInfo(schema, descriptor, endpoints, -1, -1)
         
         raise flight.FlightServerError(f"Table {table_name} not found")
 
+    def _schema_for(self, table_name: str) -> "pa.Schema":
+        """Output schema inferred from the plan, without executing it."""
+        pipeline = self.pipelines[table_name]
+        try:
+            flow = pipeline() if callable(pipeline) else pipeline
+            if hasattr(flow, "compile") and (schema := output_schema(flow.compile())) is not None:
+                return schema
+        except Exception as e:
+            logger.warning("Schema inference failed", table=table_name, error=str(e))
+        return pa.schema([("result", pa.string())])
+
     def do_get_statement(self, context, ticket):
         query = ticket.ticket.decode('utf-8')
         table_name = query.split("FROM")[-1].strip().split(" ")[0]
@@ -95,7 +105,7 @@ class EidosFlightServer(BaseServer):
         for name in self.pipelines:
             # Yield flight info for each registered pipeline
             yield flight.FlightInfo(
-                pa.schema([("result", pa.string())]),
+                self._schema_for(name),
                 flight.FlightDescriptor.for_path(name),
                 [flight.FlightEndpoint(name.encode('utf-8'), [self.location])],
                 -1, -1
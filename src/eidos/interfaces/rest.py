@@ -6,16 +6,20 @@ from typing import Any, Dict, Callable
 
 try:
     from fastapi import FastAPI, Request
+    from fastapi.encoders import jsonable_encoder
     from fastapi.responses import JSONResponse
     import uvicorn
 except ImportError:
     FastAPI = None
+    jsonable_encoder = None
     Request = Any
     JSONResponse = Any
     uvicorn = None
 
 from ..system.logging import get_logger
+from ..system.config import settings
 from ..zero.compiler import Compiler
+from ..zero.compiler.planner import Planner
 
 logger = get_logger(__name__)
 
@@ -27,6 +31,7 @@ class RestPort:
         self.host = host
         self.port = port
         self.app = FastAPI(title="Eidos Logic Service")
+        self.planner = Planner()
         
     def load_module(self, script_path: str):
         """Loads a python script and registers exposed pipelines."""
@@ -83,8 +88,15 @@ class RestPort:
                 if hasattr(flow, "compile"):
                     graph = flow.compile()
                     
-                    # Default to Polars for synchronous REST
-                    result = Compiler.compile(graph, target="polars")
+                    # Polars for synchronous REST, unless the planner is enabled
+                    if settings.default_backend == "auto":
+                        target = self.planner.choose(graph)
+                        result = Compiler.compile(graph, target=target)
+                        if callable(result):
+                            # Sink actions return rows (Python lane) or a DataFrame (Polars)
+                            result = self.planner.timed(graph, target, result)()
+                    else:
+                        result = Compiler.compile(graph, target="polars")
                     
                     # Execute if it's a LazyFrame
                     try:
@@ -96,7 +108,9 @@ class RestPort:
                             return JSONResponse(content=result.to_dicts())
                     except ImportError:
                         pass
-                        
+
+                    if isinstance(result, list):
+                        return JSONResponse(content=jsonable_encoder(result))
                     return JSONResponse(content={"result": str(result)})
                 else:
                     return JSONResponse(content={"result": str(flow)})
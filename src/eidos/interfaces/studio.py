@@ -1,6 +1,9 @@
 import json
+import importlib
 import importlib.util
 import importlib.machinery
+import sys
+import types
 from pathlib import Path
 from typing import Any
 import uvicorn
@@ -15,6 +18,7 @@ except ImportError:
 from ..system.logging import get_logger
 from ..system.evolution import EvolutionarySupervisor
 from ..system.governance import LineageRegistry
+from ..zero.compiler.incremental import IncrementalCompiler
 
 logger = get_logger(__name__)
 
@@ -31,6 +35,36 @@ if app:
 
 # State
 CURRENT_SCRIPT: Path | None = None
+# Per script: the last response with the file versions it was built from, and
+# an incremental compiler so edits only re-serialize the changed subgraph
+_RESPONSES: dict[str, tuple[tuple, dict[str, Any]]] = {}
+_COMPILERS: dict[str, IncrementalCompiler] = {}
+# Per script: project modules it imports (name -> source path), found on each run
+_DEPENDENCIES: dict[str, dict[str, str]] = {}
+
+def _stat(path: Path | str) -> tuple[int, int] | None:
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _project_modules(root: Path, names: set[str], namespace: dict[str, Any]) -> dict[str, str]:
+    """
+    Modules with source under `root` that the script uses: the ones it
+    imported for the first time (`names`) and the ones its globals come from.
+    """
+    for value in namespace.values():
+        names.add(value.__name__ if isinstance(value, types.ModuleType) else getattr(value, "__module__", None))
+    found = {}
+    for name in names:
+        file = getattr(sys.modules.get(name), "__file__", None)
+        if file and Path(file).resolve().is_relative_to(root):
+            found[name] = file
+    return found
+
+def _version(stat: tuple[int, int], dependencies: dict[str, str]) -> tuple:
+    return (stat, tuple(sorted((name, _stat(file)) for name, file in dependencies.items())))
 
 if app:
     @app.get("/api/graph")
@@ -46,19 +80,40 @@ if app:
             p = Path(target)
             if not p.exists():
                 return {"error": f"File not found: {p}"}
-                
+
+            # Unchanged file and imported project modules: skip re-executing the script
+            key = str(p.resolve())
+            dependencies = _DEPENDENCIES.get(key, {})
+            version = _version(_stat(p), dependencies)
+            cached = _RESPONSES.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            # Edited project modules are reloaded, or the script would import the stale copy
+            if cached is not None:
+                before = dict(cached[0][1])
+                for name, stat in version[1]:
+                    if stat != before.get(name) and name in sys.modules:
+                        importlib.reload(sys.modules[name])
+
             # Load module dynamically
             # We use a unique name to avoid caching issues during hot-reload
             loader = importlib.machinery.SourceFileLoader(f"studio_target_{p.stem}", str(p))
             spec = importlib.util.spec_from_loader(loader.name, loader)
             mod = importlib.util.module_from_spec(spec)
+            imported = set(sys.modules)
             loader.exec_module(mod)
+            dependencies = _DEPENDENCIES[key] = _project_modules(
+                p.resolve().parent, set(sys.modules) - imported, vars(mod)
+            )
+            version = _version(version[0], dependencies)
             
             if hasattr(mod, "main"):
                 flow = mod.main()
                 if hasattr(flow, "compile"):
                     graph = flow.compile()
-                    return graph.to_json()
+                    response = _COMPILERS.setdefault(key, IncrementalCompiler()).topology(graph)
+                    _RESPONSES[key] = (version, response)
+                    return response
             
             return {"error": "No main() returning a flow found"}
             
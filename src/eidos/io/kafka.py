@@ -1,4 +1,6 @@
-from typing import Iterator, Any
+from typing import Iterator, AsyncIterator, Any
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
 import json
 from urllib.parse import urlparse
 from ..system.logging import get_logger
@@ -11,6 +13,12 @@ except ImportError:
     KafkaConsumer = None
     KafkaProducer = None
 
+try:
+    from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+except ImportError:
+    AIOKafkaConsumer = None
+    AIOKafkaProducer = None
+
 class KafkaConnector:
     """
     Universal Kafka Adapter.
@@ -75,3 +83,55 @@ class KafkaConnector:
         finally:
             producer.flush()
             logger.info("Kafka Sink flushed", count=count)
+
+    # --- asyncio (aiokafka), used by target="async" ---
+
+    @staticmethod
+    async def aread(uri: str) -> AsyncIterator[dict]:
+        if AIOKafkaConsumer is None:
+            logger.error("aiokafka dependency missing")
+            raise ImportError("aiokafka not installed. Run 'pip install eidos-framework[io]'")
+
+        parsed = urlparse(uri)
+        broker = parsed.netloc
+        topic = parsed.path.strip("/")
+
+        logger.info("Connecting to Kafka Source (async)", broker=broker, topic=topic)
+        consumer = AIOKafkaConsumer(
+            topic,
+            bootstrap_servers=broker,
+            value_deserializer=lambda x: json.loads(x.decode('utf-8')),
+            auto_offset_reset='earliest',
+            enable_auto_commit=True,
+            group_id='eidos-consumer-group'
+        )
+        await consumer.start()
+        try:
+            async for message in consumer:
+                yield message.value
+        finally:
+            await consumer.stop()
+
+    @staticmethod
+    @asynccontextmanager
+    async def asink(uri: str) -> AsyncIterator[Callable[[Any], Awaitable[Any]]]:
+        """Yields an async `send(item)`; the producer is flushed on exit."""
+        if AIOKafkaProducer is None:
+            logger.error("aiokafka dependency missing")
+            raise ImportError("aiokafka not installed. Run 'pip install eidos-framework[io]'")
+
+        parsed = urlparse(uri)
+        broker = parsed.netloc
+        topic = parsed.path.strip("/")
+
+        logger.info("Connecting to Kafka Sink (async)", broker=broker, topic=topic)
+        producer = AIOKafkaProducer(
+            bootstrap_servers=broker,
+            value_serializer=lambda x: json.dumps(x).encode('utf-8')
+        )
+        await producer.start()
+        try:
+            yield lambda item: producer.send_and_wait(topic, value=item)
+        finally:
+            await producer.stop()
+            logger.info("Kafka Sink flushed (async)")
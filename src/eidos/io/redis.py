@@ -1,4 +1,7 @@
-from typing import Iterator, Any
+from typing import Iterator, AsyncIterator, Any
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+import importlib
 import json
 from urllib.parse import urlparse, parse_qs
 from ..system.logging import get_logger
@@ -17,7 +20,7 @@ class RedisConnector:
     """
     
     @staticmethod
-    def _connect(uri: str):
+    def _connect(uri: str, use_async: bool = False):
         if redis is None:
             logger.error("Redis dependency missing")
             raise ImportError("redis not installed. Run 'pip install eidos-framework[io]'")
@@ -29,9 +32,31 @@ class RedisConnector:
         params = parse_qs(parsed.query)
         mode = params.get("mode", ["list"])[0]
         
-        client = redis.Redis(host=host, port=port, decode_responses=True)
+        if use_async:
+            client_cls = importlib.import_module("redis.asyncio").Redis
+            client = client_cls(host=host, port=port, decode_responses=True)
+        else:
+            client = redis.Redis(host=host, port=port, decode_responses=True)
         return client, key, mode
 
+    @staticmethod
+    def _decode(data: str) -> Any:
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return {"raw": data}
+
+    @staticmethod
+    def _send(client, key: str, mode: str, item: Any) -> Any:
+        """Issues the write for one item (an awaitable on asyncio clients)."""
+        data = json.dumps(item)
+        if mode == "list":
+            return client.rpush(key, data)
+        elif mode == "stream":
+            return client.xadd(key, item if isinstance(item, dict) else {"data": data})
+        elif mode == "channel":
+            return client.publish(key, data)
+
     @staticmethod
     def read(uri: str) -> Iterator[Any]:
         client, key, mode = RedisConnector._connect(uri)
@@ -81,18 +106,54 @@ class RedisConnector:
         
         count = 0
         for item in stream:
-            data = json.dumps(item)
-            if mode == "list":
-                client.rpush(key, data)
-            elif mode == "stream":
-                if isinstance(item, dict):
-                    client.xadd(key, item)
-                else:
-                    client.xadd(key, {"data": data})
-            elif mode == "channel":
-                client.publish(key, data)
-            
+            RedisConnector._send(client, key, mode, item)
             count += 1
             yield item
             
         logger.info("Redis Sink finished", count=count)
+
+    # --- asyncio (redis.asyncio), used by target="async" ---
+
+    @staticmethod
+    async def aread(uri: str) -> AsyncIterator[Any]:
+        client, key, mode = RedisConnector._connect(uri, use_async=True)
+        logger.info("Connecting to Redis Source (async)", uri=uri, mode=mode)
+
+        try:
+            if mode == "list":
+                while True:
+                    result = await client.blpop(key, timeout=1)
+                    if result:
+                        yield RedisConnector._decode(result[1])
+
+            elif mode == "stream":
+                last_id = "$"
+                while True:
+                    resp = await client.xread({key: last_id}, count=100, block=1000)
+                    for _, messages in resp or ():
+                        for msg_id, data in messages:
+                            last_id = msg_id
+                            yield data
+
+            elif mode == "channel":
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(key)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            yield RedisConnector._decode(message["data"])
+        except Exception as e:
+            logger.error("Redis read error", error=str(e))
+            raise
+        finally:
+            await client.aclose()
+
+    @staticmethod
+    @asynccontextmanager
+    async def asink(uri: str) -> AsyncIterator[Callable[[Any], Awaitable[Any]]]:
+        """Yields an async `send(item)`; the connection is closed on exit."""
+        client, key, mode = RedisConnector._connect(uri, use_async=True)
+        logger.info("Connecting to Redis Sink (async)", uri=uri, mode=mode)
+        try:
+            yield lambda item: RedisConnector._send(client, key, mode, item)
+        finally:
+            await client.aclose()
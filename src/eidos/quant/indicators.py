@@ -150,3 +150,35 @@ class VWAP(Indicator):
     def __init__(self, field_price: str = "price", field_vol: str = "volume"):
         cfg = VWAPConfig(price=field_price, vol=field_vol)
         super().__init__(config=cfg.model_dump())
+
+# --- Schema ---
+
+# Config keys that name the input columns an indicator reads
+_INPUT_KEYS = ("field", "high", "low", "close", "vol", "price")
+
+def input_columns(config: dict[str, Any]) -> list[str]:
+    """Columns an indicator reads, derived from its config."""
+    return [config[key] for key in _INPUT_KEYS if config.get(key)]
+
+def output_columns(config: dict[str, Any]) -> list[str]:
+    """Columns an indicator appends to every row, derived from its config."""
+    match config.get("kind"):
+        case "ATR":
+            # The seeding row also carries the seed value (see `calculate_atr`)
+            return [f"atr_{config['window']}", "_prev_atr"]
+        case "SMA" | "EMA" | "WMA" | "RSI" | "ADX" as kind:
+            return [f"{kind.lower()}_{config['window']}"]
+        case "MACD":
+            return ["macd", "macd_signal", "macd_hist"]
+        case "BBands":
+            return ["bb_mid", "bb_upper", "bb_lower"]
+        case "Stoch":
+            return ["stoch_k", "stoch_d"]
+        case "CCI":
+            return ["cci"]
+        case "OBV":
+            return ["obv"]
+        case "VWAP":
+            return ["vwap"]
+        case _:
+            return []
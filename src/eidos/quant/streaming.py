@@ -0,0 +1,433 @@
+"""
+Streaming (stateful) versions of the `python_impl` indicators.
+Each indicator consumes one row per `step()` and emits the enriched row
+immediately, keeping only bounded ring buffers (proportional to the
+window) as state, so indicators run over unbounded sources such as Kafka.
+Outputs match the batch implementations row for row.
+"""
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Any, Dict
+import math
+
+class _Window:
+    """
+    Ring buffer of the last `size` values with a running sum (and sum of squares).
+    `None` values are counted rather than summed. The sums are rebuilt from
+    the buffer once per `size` steps, which keeps float drift bounded at
+    amortized O(1) cost.
+    """
+    __slots__ = ("size", "values", "total", "squares", "missing", "_steps")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque(maxlen=size)
+        self.total = 0.0
+        self.squares = 0.0
+        self.missing = 0
+        self._steps = 0
+
+    def push(self, value: Any) -> None:
+        if len(self.values) == self.size:
+            self._drop(self.values[0])
+        self.values.append(value)
+        if value is None:
+            self.missing += 1
+        else:
+            self.total += value
+            self.squares += value * value
+
+        self._steps += 1
+        if self._steps >= self.size:
+            self._steps = 0
+            present = [v for v in self.values if v is not None]
+            self.total = math.fsum(present)
+            self.squares = math.fsum(v * v for v in present)
+
+    def _drop(self, value: Any) -> None:
+        if value is None:
+            self.missing -= 1
+        else:
+            self.total -= value
+            self.squares -= value * value
+
+    @property
+    def full(self) -> bool:
+        """Holds `size` values, none of them missing."""
+        return len(self.values) == self.size and not self.missing
+
+class _MonotonicWindow:
+    """Sliding max (or min) over the last `size` pushes, O(1) amortized."""
+    __slots__ = ("size", "largest", "_candidates", "_index")
+
+    def __init__(self, size: int, largest: bool):
+        self.size = size
+        self.largest = largest
+        self._candidates: deque = deque()  # (index, value), monotonic in value
+        self._index = 0
+
+    def push(self, value: Any) -> None:
+        if value is not None:
+            while self._candidates and (
+                self._candidates[-1][1] <= value if self.largest else self._candidates[-1][1] >= value
+            ):
+                self._candidates.pop()
+            self._candidates.append((self._index, value))
+        while self._candidates and self._candidates[0][0] <= self._index - self.size:
+            self._candidates.popleft()
+        self._index += 1
+
+    @property
+    def value(self) -> Any:
+        return self._candidates[0][1] if self._candidates else None
+
+class _EMA:
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, window: int):
+        self.alpha = 2 / (window + 1)
+        self.value = None
+
+    def push(self, val: Any) -> Any:
+        """Updates with `val`; returns the EMA for this row (None if `val` is missing)."""
+        if val is None:
+            return None
+        self.value = val if self.value is None else self.alpha * val + (1 - self.alpha) * self.value
+        return self.value
+
+class StreamingIndicator:
+    """
+    Base class: `step(row)` returns the row enriched with the indicator's columns.
+    Subclasses implement `fill`, which writes those columns into a given dict.
+    """
+    # Columns read when the configured ones are absent (e.g. VWAP falls back to close)
+    fallback_inputs: tuple[str, ...] = ()
+
+    def fill(self, row: Dict[str, Any], out: Dict[str, Any]) -> None:
+        """Advances the state by `row` and writes this row's outputs into `out`."""
+        raise NotImplementedError
+
+    def step(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        out = row.copy()
+        self.fill(row, out)
+        return out
+
+    def __call__(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        return map(self.step, rows)
+
+    def extend(self, columns: Dict[str, Any], num_rows: int, inputs: list[str], outputs: list[str]) -> Dict[str, list]:
+        """
+        Columnar form of `step` for record batches: feeds only the `inputs`
+        columns through the indicator and returns just the `outputs` columns,
+        so the rest of the batch is never copied.
+        """
+        names = [n for n in dict.fromkeys([*inputs, *self.fallback_inputs]) if n in columns]
+        vectors = [columns[n].tolist() if hasattr(columns[n], "tolist") else columns[n] for n in names]
+        fill = self.fill
+        rows = []
+        for values in zip(*vectors) if vectors else [()] * num_rows:
+            row = dict(zip(names, values))
+            fill(row, row)  # the row is private here, so outputs can go into it
+            rows.append(row)
+        return {name: [row.get(name) for row in rows] for name in outputs}
+
+class StreamingSMA(StreamingIndicator):
+    def __init__(self, window: int, field: str):
+        self.field = field
+        self.column = f"sma_{window}"
+        self.window = _Window(window)
+
+    def fill(self, row, out):
+        self.window.push(row.get(self.field))
+        out[self.column] = self.window.total / self.window.size if self.window.full else None
+
+class StreamingEMA(StreamingIndicator):
+    def __init__(self, window: int, field: str):
+        self.field = field
+        self.column = f"ema_{window}"
+        self.ema = _EMA(window)
+
+    def fill(self, row, out):
+        out[self.column] = self.ema.push(row.get(self.field))
+
+class StreamingWMA(StreamingIndicator):
+    """
+    The weighted sum is updated in O(1) while the window holds no missing
+    values (`WS' = WS - S + n * x`), and rebuilt from the buffer otherwise
+    and whenever the window resyncs its running sum.
+    """
+    def __init__(self, window: int, field: str):
+        self.field = field
+        self.size = window
+        self.column = f"wma_{window}"
+        self.denominator = window * (window + 1) // 2
+        self.window = _Window(window)
+        self.weighted: float | None = None
+
+    def fill(self, row, out):
+        value = row.get(self.field)
+        window = self.window
+        previous_total = window.total
+        was_full = window.full
+        window.push(value)
+
+        if not window.full:
+            self.weighted = None
+        elif was_full and self.weighted is not None and window._steps:
+            self.weighted += self.size * value - previous_total
+        else:
+            self.weighted = sum(w * v for w, v in enumerate(window.values, start=1))
+        out[self.column] = self.weighted / self.denominator if self.weighted is not None else None
+
+class StreamingRSI(StreamingIndicator):
+    """Simple-average RSI over the last `window` price changes (as in `calculate_rsi`)."""
+    def __init__(self, window: int, field: str):
+        self.field = field
+        self.size = window
+        self.column = f"rsi_{window}"
+        self.gains = _Window(window)
+        self.losses = _Window(window)
+        self.previous = None
+        self.index = 0
+
+    def fill(self, row, out):
+        value = row[self.field]
+        index, self.index = self.index, self.index + 1
+        previous, self.previous = self.previous, value
+        if index == 0:
+            out[self.column] = None
+            return
+
+        change = value - previous
+        self.gains.push(max(0, change))
+        self.losses.push(max(0, -change))
+        if index < self.size:
+            out[self.column] = None
+            return
+
+        avg_gain = self.gains.total / self.size
+        avg_loss = self.losses.total / self.size
+        out[self.column] = 100 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+class StreamingMACD(StreamingIndicator):
+    def __init__(self, fast: int, slow: int, signal: int, field: str):
+        self.field = field
+        self.fast = _EMA(fast)
+        self.slow = _EMA(slow)
+        self.k = 2 / (signal + 1)
+        self.signal = None  # the previous row's signal
+
+    def fill(self, row, out):
+        value = row.get(self.field)
+        fast, slow = self.fast.push(value), self.slow.push(value)
+        if fast is None or slow is None:
+            out["macd"] = out["macd_signal"] = out["macd_hist"] = None
+            self.signal = None
+            return
+
+        macd = fast - slow
+        self.signal = macd if self.signal is None else macd * self.k + self.signal * (1 - self.k)
+        out["macd"] = macd
+        out["macd_signal"] = self.signal
+        out["macd_hist"] = macd - self.signal
+
+class StreamingBBands(StreamingIndicator):
+    def __init__(self, window: int, std_dev: int, field: str):
+        self.field = field
+        self.std_dev = std_dev
+        self.window = _Window(window)
+
+    def fill(self, row, out):
+        window = self.window
+        window.push(row.get(self.field))
+        if len(window.values) < window.size:
+            out["bb_mid"] = out["bb_upper"] = out["bb_lower"] = None
+        elif window.missing:
+            out["bb_mid"] = None
+        else:
+            mean = window.total / window.size
+            std = math.sqrt(max(window.squares / window.size - mean * mean, 0.0))
+            out["bb_mid"] = mean
+            out["bb_upper"] = mean + self.std_dev * std
+            out["bb_lower"] = mean - self.std_dev * std
+
+class StreamingStoch(StreamingIndicator):
+    def __init__(self, window: int, smooth: int, high: str, low: str, close: str):
+        self.high, self.low, self.close = high, low, close
+        self.size = window
+        self.highs = _MonotonicWindow(window, largest=True)
+        self.lows = _MonotonicWindow(window, largest=False)
+        self.missing = _Window(window)  # only counts missing highs/lows
+        self.k_values = _Window(smooth)
+        self.index = 0
+
+    def fill(self, row, out):
+        h, l, c = row[self.high], row[self.low], row[self.close]
+        self.highs.push(h)
+        self.lows.push(l)
+        self.missing.push(None if h is None or l is None else 0)
+        index, self.index = self.index, self.index + 1
+
+        k = None
+        if index >= self.size - 1 and not self.missing.missing and c is not None:
+            h_max, l_min = self.highs.value, self.lows.value
+            k = 100 if h_max == l_min else (c - l_min) / (h_max - l_min) * 100
+        out["stoch_k"] = k
+
+        self.k_values.push(k)
+        out["stoch_d"] = self.k_values.total / self.k_values.size if self.k_values.full else None
+
+class StreamingCCI(StreamingIndicator):
+    """
+    The mean absolute deviation depends on the current mean, so it is
+    recomputed over the buffer: O(window) time per row, O(window) memory.
+    """
+    def __init__(self, window: int, high: str, low: str, close: str):
+        self.high, self.low, self.close = high, low, close
+        self.window = _Window(window)
+
+    def fill(self, row, out):
+        h, l, c = row[self.high], row[self.low], row[self.close]
+        tp = (h + l + c) / 3 if h is not None and l is not None and c is not None else None
+        window = self.window
+        window.push(tp)
+
+        if len(window.values) < window.size or window.missing:
+            out["cci"] = None
+            return
+        sma_tp = window.total / window.size
+        mean_dev = sum(abs(x - sma_tp) for x in window.values) / window.size
+        out["cci"] = 0 if mean_dev == 0 else (tp - sma_tp) / (0.015 * mean_dev)
+
+class StreamingATR(StreamingIndicator):
+    """
+    Wilder's ATR, seeded with the mean of the first `window` true ranges.
+    Like `calculate_atr`, the seeding row also carries `_prev_atr`.
+    """
+    def __init__(self, window: int, high: str = "high", low: str = "low", close: str = "close"):
+        self.high, self.low, self.close = high, low, close
+        self.size = window
+        self.column = f"atr_{window}"
+        self.seed: list = []  # the first `window` true ranges, dropped once used
+        self.previous: Dict[str, Any] | None = None  # the previous input row
+        self.last: tuple[Any, Any] = (None, None)  # previous output's (atr, _prev_atr)
+        self.index = 0
+
+    def fill(self, row, out):
+        h, l = row.get(self.high), row.get(self.low)
+        c_prev = self.previous.get(self.close) if self.previous is not None else None
+        self.previous = row
+        tr = None
+        if h is not None and l is not None:
+            tr = h - l if c_prev is None else max(h - l, abs(h - c_prev), abs(l - c_prev))
+
+        index, self.index = self.index, self.index + 1
+        if index < self.size:
+            self.seed.append(tr)
+            atr = None
+        elif index == self.size:
+            seed, self.seed = self.seed, []
+            atr = sum(seed) / self.size if all(x is not None for x in seed) else None
+            if atr is not None:
+                out["_prev_atr"] = atr
+        else:
+            prev_atr = self.last[0] or self.last[1]
+            atr = (prev_atr * (self.size - 1) + tr) / self.size if prev_atr is not None and tr is not None else None
+
+        out[self.column] = atr
+        self.last = (atr, out.get("_prev_atr"))
+
+class StreamingADX(StreamingIndicator):
+    def __init__(self, window: int, high: str = "high", low: str = "low", close: str = "close"):
+        self.high, self.low, self.close = high, low, close
+        self.size = window
+        self.column = f"adx_{window}"
+        self.previous: Dict[str, Any] | None = None
+        # Running sums of TR/+DM/-DM until the first smoothed value, then Wilder-smoothed
+        self.tr = self.dm_plus = self.dm_minus = 0.0
+        self.dxs = _Window(window)
+        self.index = 0
+
+    def fill(self, row, out):
+        h, l = row.get(self.high), row.get(self.low)
+        prev, self.previous = self.previous, row
+
+        tr = dp = dm = 0
+        if prev and h is not None and l is not None:
+            c_prev = prev.get(self.close)
+            tr = max(h - l, abs(h - c_prev), abs(l - c_prev))
+            up_move = h - prev.get(self.high)
+            down_move = prev.get(self.low) - l
+            dp = up_move if up_move > down_move and up_move > 0 else 0
+            dm = down_move if down_move > up_move and down_move > 0 else 0
+
+        index, self.index = self.index, self.index + 1
+        n = self.size
+        if index <= n:
+            self.tr += tr
+            self.dm_plus += dp
+            self.dm_minus += dm
+        else:
+            self.tr = self.tr - self.tr / n + tr
+            self.dm_plus = self.dm_plus - self.dm_plus / n + dp
+            self.dm_minus = self.dm_minus - self.dm_minus / n + dm
+
+        if index < n:
+            out[self.column] = None
+            return
+
+        di_plus = 100 * (self.dm_plus / self.tr) if self.tr else 0
+        di_minus = 100 * (self.dm_minus / self.tr) if self.tr else 0
+        sum_di = di_plus + di_minus
+        self.dxs.push(100 * abs(di_plus - di_minus) / sum_di if sum_di else 0)
+        out[self.column] = self.dxs.total / n if len(self.dxs.values) >= n else None
+
+class StreamingOBV(StreamingIndicator):
+    def __init__(self, close: str = "close", vol: str = "volume"):
+        self.close, self.vol = close, vol
+        self.obv = 0
+        self.previous = None
+        self.started = False
+
+    def fill(self, row, out):
+        c, v = row.get(self.close), row.get(self.vol, 0)
+        if not self.started:
+            self.obv, self.started = v, True
+        elif c > self.previous:
+            self.obv += v
+        elif c < self.previous:
+            self.obv -= v
+        self.previous = c
+        out["obv"] = self.obv
+
+class StreamingVWAP(StreamingIndicator):
+    fallback_inputs = ("close",)
+
+    def __init__(self, price: str = "price", vol: str = "volume"):
+        self.price, self.vol = price, vol
+        self.cum_pv = 0
+        self.cum_vol = 0
+
+    def fill(self, row, out):
+        p, v = row.get(self.price, row.get("close")), row.get(self.vol, 0)
+        if p is None or v is None:
+            out["vwap"] = None
+            return
+        self.cum_pv += p * v
+        self.cum_vol += v
+        out["vwap"] = self.cum_pv / self.cum_vol if self.cum_vol != 0 else p
+
+STREAMING_INDICATORS: Dict[str, type[StreamingIndicator]] = {
+    "SMA": StreamingSMA,
+    "EMA": StreamingEMA,
+    "WMA": StreamingWMA,
+    "RSI": StreamingRSI,
+    "MACD": StreamingMACD,
+    "BBands": StreamingBBands,
+    "Stoch": StreamingStoch,
+    "CCI": StreamingCCI,
+    "ADX": StreamingADX,
+    "ATR": StreamingATR,
+    "OBV": StreamingOBV,
+    "VWAP": StreamingVWAP
+}
@@ -1,3 +1,4 @@
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -18,7 +19,27 @@ class EidosSettings(BaseSettings):
     json_logs: bool = Field(False, description="Output logs in JSON format")
     
     # Runtime
-    default_backend: str = Field("polars", description="Default execution backend (polars, ray)")
+    default_backend: str = Field("polars", description="Default execution backend (polars, ray, python, auto)")
+    plan_cache_size: int = Field(128, description="Max compiled plans kept by Compiler (0 disables caching)")
+    stats_path: str = Field(".eidos/stats.json", description="Planner statistics file (source row counts, run times)")
+    planner_small_bytes: int = Field(1_000_000, description="Inputs up to this size run on the Python lane with engine=auto")
+    planner_small_rows: int = Field(10_000, description="Inputs up to this many rows run on the Python lane with engine=auto")
+    planner_large_bytes: int = Field(2_000_000_000, description="Inputs from this size run on Ray with engine=auto")
+    planner_explore_after: int = Field(3, description="Runs on the estimated lane before engine=auto times the other in-process lane once (0 disables)")
+    stats_flush_seconds: float = Field(5.0, description="Delay before planner statistics are written to disk in the background")
+    stats_max_plans: int = Field(1000, description="Plans whose run times are kept in the stats file (least recently run are dropped)")
+    branch_workers: int = Field(os.cpu_count() or 1, description="Threads running independent branches on the Python lane (0 runs them serially)")
+    branch_queue_size: int = Field(8, description="Row chunks buffered per concurrently running branch")
+    async_queue_size: int = Field(64, description="Rows buffered between two stages of a target=\"async\" pipeline (backpressure)")
+    async_sink_concurrency: int = Field(16, description="Kafka/Redis writes in flight per target=\"async\" sink")
+    parallel_workers: int = Field(os.cpu_count() or 1, description="Workers for Map/Filter(parallel=True) on the Python lane")
+    batch_max_delay: float = Field(0.1, description="Seconds a Python-lane batch (column expressions, batch UDFs) waits for more rows before it is cut short (0 waits for a full batch)")
+    parallel_chunk_size: int = Field(64, description="Rows sent to a parallel Map/Filter worker at a time")
+    parallel_window: int = Field(0, description="Max chunks in flight per parallel Map/Filter (0 = twice the workers)")
+    process_workers: int = Field(os.cpu_count() or 1, description="Worker processes for target=\"process\"")
+    process_chunk_size: int = Field(1024, description="Rows per chunk shipped to a target=\"process\" or \"interpreter\" worker")
+    interpreter_workers: int = Field(os.cpu_count() or 1, description="Subinterpreters for target=\"interpreter\" (Python 3.14+)")
+    parallel_executor: str = Field("auto", description="Parallel Map/Filter pool: auto (threads when free-threaded, else processes), thread, process")
     
     # Intelligence
     openai_api_key: str | None = Field(None, description="OpenAI API Key for Nous/Sidecar")
@@ -0,0 +1,335 @@
+import asyncio
+import inspect
+import itertools
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from typing import Any
+from ..symbolism.ast import Node, OpType
+from ..runtime.exchange import ArrowExchange
+from ...system.config import settings
+from ...system.logging import get_logger
+from .fusion import DROP
+from .python_backend import PythonBackend
+
+logger = get_logger(__name__)
+
+# End-of-stream marker passed down the queues
+_END = object()
+# How often a bridged (thread) stage re-checks for cancellation
+_POLL_SECONDS = 0.05
+
+Body = Callable[[list[asyncio.Queue], Callable[[Any], Awaitable[None]]], Awaitable[None]]
+
+class _Stopped(Exception):
+    """Raised inside a bridge thread once its pipeline was cancelled."""
+
+async def _on_own_thread(fn: Callable[[], Any], name: str) -> Any:
+    """
+    Runs blocking `fn` on a dedicated thread and awaits its result.
+    Bridges block for the lifetime of their pipeline, so they must not hold
+    the loop's default executor, which short source reads depend on.
+    """
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+
+    def settle(result: Any, error: BaseException | None) -> None:
+        if done.done():
+            return
+        if error is not None:
+            done.set_exception(error)
+        else:
+            done.set_result(result)
+
+    def target() -> None:
+        try:
+            outcome = (fn(), None)
+        except BaseException as e:
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # the loop is already closed; nobody is waiting
+
+    threading.Thread(target=target, name=name, daemon=True).start()
+    return await done
+
+class AsyncStage:
+    """
+    One operator of an async pipeline, run as a task.
+    It reads its inputs from bounded `asyncio.Queue`s and puts every output
+    row on one queue per consumer, so a slow consumer suspends its
+    producers (backpressure) instead of letting rows pile up.
+    `async for row in stage` runs the pipeline up to this stage.
+    """
+    def __init__(self, name: str, body: Body, parents: Iterable["AsyncStage"] = ()):
+        self.name = name
+        self.body = body
+        self.parents = tuple(parents)
+        self.inputs = [parent.subscribe() for parent in self.parents]
+        self.outputs: list[asyncio.Queue] = []
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(settings.async_queue_size)
+        self.outputs.append(queue)
+        return queue
+
+    async def emit(self, item: Any) -> None:
+        for queue in self.outputs:
+            await queue.put(item)
+
+    async def run(self) -> None:
+        await self.body(self.inputs, self.emit)
+        await self.emit(_END)
+
+    def lineage(self) -> list["AsyncStage"]:
+        """This stage and everything upstream of it, each once."""
+        seen: dict[int, AsyncStage] = {}
+        pending = [self]
+        while pending:
+            stage = pending.pop()
+            if id(stage) not in seen:
+                seen[id(stage)] = stage
+                pending.extend(stage.parents)
+        return list(seen.values())
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        queue = self.subscribe()
+        async with asyncio.TaskGroup() as tg:
+            for stage in self.lineage():
+                tg.create_task(stage.run(), name=f"eidos:{stage.name}")
+            while (item := await queue.get()) is not _END:
+                yield item
+
+class AsyncPlan:
+    """
+    A compiled async pipeline (one or more sinks).
+    `await plan` (or `await plan.run()`) executes it on the running event
+    loop, so many small pipelines can share one loop:
+    `await asyncio.gather(plan_a.run(), plan_b.run())`.
+    Calling `plan()` runs it to completion with `asyncio.run`. Like the
+    generators of the Python lane, a plan runs once.
+    """
+    def __init__(self, sinks: list[Callable[[asyncio.Queue], Awaitable[Any]]], tips: list[AsyncStage]):
+        self.sinks = sinks
+        self.tips = tips
+        self.queues = [tip.subscribe() for tip in tips]
+
+    async def run(self) -> Any:
+        stages = {id(s): s for tip in self.tips for s in tip.lineage()}
+        async with asyncio.TaskGroup() as tg:
+            for stage in stages.values():
+                tg.create_task(stage.run(), name=f"eidos:{stage.name}")
+            results = [tg.create_task(sink(queue)) for sink, queue in zip(self.sinks, self.queues)]
+        match [r.result() for r in results]:
+            case [single]: return single
+            case values: return values
+
+    def __await__(self):
+        return self.run().__await__()
+
+    def __call__(self) -> Any:
+        return asyncio.run(self.run())
+
+class AsyncBackend(PythonBackend):
+    """
+    `target="async"`: the Free Lane on asyncio, for I/O-bound streaming.
+    Kafka and Redis sources are async iterators (aiokafka, redis.asyncio),
+    their sinks are awaited with at most `async_sink_concurrency` writes
+    in flight, and stages are tasks connected by bounded queues. Row
+    operators (Map/Filter, fused runs, Select, WithColumn, streaming
+    indicators) run on the loop; `async def` UDFs are awaited. Other
+    operators run the Python-lane generators on a thread of their own, and
+    other sources are read in batches off the loop.
+    """
+    def compile_node(self, node: Node, inputs: list[AsyncStage]) -> Any:
+        config = node.config
+        match node.op_type:
+            case OpType.SOURCE:
+                return AsyncStage(node.short_id, self._source(node))
+            case OpType.SINK:
+                return AsyncPlan([self._sink(node)], inputs)
+            case OpType.MERGE if len(inputs) > 1 and not config.get("on"):
+                return AsyncStage(node.short_id, self._interleave, inputs)
+            case _ if (fn := self._row_function(node)) is not None:
+                return AsyncStage(node.short_id, self._rows(fn), inputs)
+            case _:
+                return AsyncStage(node.short_id, self._bridge(node), inputs)
+
+    @staticmethod
+    def finalize(results: list[Any]) -> Any:
+        plans = [r for r in results if isinstance(r, AsyncPlan)]
+        if len(plans) != len(results):
+            return results
+        combined = AsyncPlan([], [])
+        for plan in plans:
+            combined.sinks += plan.sinks
+            combined.tips += plan.tips
+            combined.queues += plan.queues
+        return combined
+
+    # --- Sources ---
+
+    def _source(self, node: Node) -> Body:
+        uri = node.config.get("uri", "")
+
+        async def body(_, emit):
+            if uri.startswith(("kafka://", "redis://")):
+                if uri.startswith("kafka://"):
+                    from ...io.kafka import KafkaConnector as connector
+                else:
+                    from ...io.redis import RedisConnector as connector
+                async for row in connector.aread(uri):
+                    await emit(row)
+                return
+            # Files and in-memory data: read in batches on a worker thread
+            rows = iter(PythonBackend.compile_node(self, node, []))
+            while batch := await asyncio.to_thread(lambda: list(itertools.islice(rows, self.batch_size))):
+                for row in batch:
+                    await emit(row)
+        return body
+
+    # --- Row operators ---
+
+    def _row_function(self, node: Node) -> Callable[[Any], Any] | None:
+        """Per-row form of a node (returning DROP for filtered rows), or None."""
+        config = node.config
+        if config.get("batch"):
+            return None
+        match node.op_type:
+            case OpType.MAP:
+                return config.get("fn") or (lambda row: row)
+            case OpType.FILTER:
+                predicate = config.get("predicate")
+                if predicate is None:
+                    return lambda row: row
+                if inspect.iscoroutinefunction(predicate):
+                    async def keep(row):
+                        return row if await predicate(row) else DROP
+                    return keep
+                return lambda row: row if predicate(row) else DROP
+            case OpType.FUSED:
+                return config["fn"]
+            case OpType.PROJECT:
+                columns = config["columns"]
+                return lambda row: {c: row[c] for c in columns}
+            case OpType.WITH_COLUMN:
+                name, expr = config["name"], config["expr"]
+                return lambda row: {**row, name: expr(row)}
+            case OpType.CUSTOM if config.get("kind") in self._custom_handlers:
+                kwargs = {k: v for k, v in config.items() if k not in ("kind", "engine")}
+                if config["kind"] == "BBands" and "std" in kwargs:
+                    kwargs["std_dev"] = kwargs.pop("std")
+                return self._custom_handlers[config["kind"]](**kwargs).step
+        return None
+
+    @staticmethod
+    def _rows(fn: Callable[[Any], Any]) -> Body:
+        async def body(inputs, emit):
+            queue = inputs[0]
+            while (row := await queue.get()) is not _END:
+                out = fn(row)
+                if inspect.isawaitable(out):
+                    out = await out
+                if out is not DROP:
+                    await emit(out)
+        return body
+
+    @staticmethod
+    async def _interleave(inputs: list[asyncio.Queue], emit) -> None:
+        """`+` of live streams: rows are forwarded as they arrive on any input."""
+        async def pump(queue):
+            while (row := await queue.get()) is not _END:
+                await emit(row)
+        async with asyncio.TaskGroup() as tg:
+            for queue in inputs:
+                tg.create_task(pump(queue))
+
+    def _bridge(self, node: Node) -> Body:
+        """Runs the Python-lane generator of `node` on a thread, fed from the queues."""
+        async def body(inputs, emit):
+            loop = asyncio.get_running_loop()
+            stopped = threading.Event()
+
+            def wait(coroutine):
+                future = asyncio.run_coroutine_threadsafe(coroutine, loop)
+                while True:
+                    try:
+                        return future.result(_POLL_SECONDS)
+                    except TimeoutError:
+                        if stopped.is_set():
+                            future.cancel()
+                            raise _Stopped from None
+
+            def pull(queue) -> Iterator[Any]:
+                while (row := wait(queue.get())) is not _END:
+                    yield row
+
+            def drive():
+                try:
+                    for row in PythonBackend.compile_node(self, node, [pull(q) for q in inputs]):
+                        wait(emit(row))
+                except _Stopped:
+                    pass
+
+            try:
+                await _on_own_thread(drive, f"eidos-bridge:{node.short_id}")
+            finally:
+                stopped.set()
+        return body
+
+    # --- Sinks ---
+
+    def _sink(self, node: Node) -> Callable[[asyncio.Queue], Awaitable[Any]]:
+        uri = node.config.get("uri", "")
+
+        async def drain(queue) -> AsyncIterator[Any]:
+            while (row := await queue.get()) is not _END:
+                yield row
+
+        async def sink(queue):
+            if uri.startswith(("kafka://", "redis://")):
+                if uri.startswith("kafka://"):
+                    from ...io.kafka import KafkaConnector as connector
+                else:
+                    from ...io.redis import RedisConnector as connector
+                return await self._send_all(connector, uri, drain(queue))
+            rows = [row async for row in drain(queue)]
+            match uri:
+                case "arrow://":
+                    return ArrowExchange.from_rows(rows)
+                case "memory" | "collect":
+                    return rows
+                case "stdout" | "console":
+                    print(f"--- Sink: {node.config.get('name', 'Result')} ---")
+                    for row in rows:
+                        print(row)
+                    print("----------------")
+                    return rows
+                case _:
+                    def write():
+                        with open(uri, "w") as f:
+                            for row in rows:
+                                f.write(str(row) + "\n")
+                    try:
+                        await asyncio.to_thread(write)
+                    except OSError:
+                        pass  # not a file path: just collect, like the Python lane
+                    return rows
+        return sink
+
+    @staticmethod
+    async def _send_all(connector: Any, uri: str, rows: AsyncIterator[Any]) -> int:
+        """
+        Writes every row, with at most `async_sink_concurrency` sends in
+        flight, and returns how many were written (rows are not retained,
+        so unbounded streams run in constant memory).
+        """
+        slots = asyncio.Semaphore(settings.async_sink_concurrency)
+        written = 0
+        async with connector.asink(uri) as send, asyncio.TaskGroup() as tg:
+            async for row in rows:
+                await slots.acquire()
+                task = tg.create_task(send(row))
+                task.add_done_callback(lambda _: slots.release())
+                written += 1
+        return written
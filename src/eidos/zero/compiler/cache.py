@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+@dataclass
+class CacheStats:
+    """Counters exposed for monitoring the plan cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    max_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+@dataclass(frozen=True)
+class CompiledPlan:
+    """
+    A cache entry.
+    Backends whose artifacts can be executed repeatedly (LazyFrames, scripts)
+    store the artifact itself; single-shot artifacts (Python generators) store
+    a factory that re-wires them on every lookup.
+    """
+    artifact: Any = None
+    factory: Callable[[], Any] | None = None
+
+    def materialize(self) -> Any:
+        if self.factory is not None:
+            return self.factory()
+        return self.artifact
+
+class PlanCache:
+    """
+    Thread-safe bounded LRU cache of compiled plans.
+    Keyed by (graph fingerprint, target, backend version).
+    """
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, CompiledPlan] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> CompiledPlan | None:
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return plan
+
+    def put(self, key: Hashable, plan: CompiledPlan) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = plan
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self.max_size
+            )
@@ -1,5 +1,6 @@
 from typing import Any, List
 from ..symbolism.ast import Node, OpType
+from ..symbolism.expr import Expr
 
 class DolphinDBScript:
     def __init__(self, code: str, var: str):
@@ -13,6 +14,8 @@ class DolphinDBBackend:
     """
     Compiles Eidos AST into DolphinDB Script (.dos).
     """
+    reusable_plans = True
+
     def compile_node(self, node: Node, inputs: List[DolphinDBScript]) -> DolphinDBScript:
         
         if node.op_type == OpType.SOURCE:
@@ -29,9 +32,26 @@ class DolphinDBBackend:
         var = f"t_{node.short_id}"
         
         if node.op_type == OpType.FILTER:
-            pred = node.config.get("predicate_sql", "true") 
+            predicate = node.config.get("predicate")
+            if isinstance(predicate, Expr):
+                pred = predicate.to_sql()
+            else:
+                pred = node.config.get("predicate_sql", "true") 
             code = f'{prev.code}\n{var} = select * from {prev.var} where {pred}'
             return DolphinDBScript(code, var)
+
+        if node.op_type == OpType.MAP and isinstance(node.config.get("fn"), Expr):
+            code = f'{prev.code}\n{var} = select {node.config["fn"].to_sql()} as payload from {prev.var}'
+            return DolphinDBScript(code, var)
+
+        if node.op_type == OpType.PROJECT:
+            code = f'{prev.code}\n{var} = select {", ".join(node.config["columns"])} from {prev.var}'
+            return DolphinDBScript(code, var)
+
+        if node.op_type == OpType.WITH_COLUMN:
+            expr, name = node.config["expr"], node.config["name"]
+            code = f'{prev.code}\n{var} = select *, {expr.to_sql()} as {name} from {prev.var}'
+            return DolphinDBScript(code, var)
             
         if node.op_type == OpType.CUSTOM:
             kind = node.config.get("kind")
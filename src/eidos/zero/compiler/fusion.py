@@ -0,0 +1,157 @@
+import inspect
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+from ..symbolism.ast import Graph, Node, NodeID, OpType
+from ..symbolism.expr import Expr
+from ..symbolism.fingerprint import fingerprint, structural_id
+from ...system.telemetry import trace_span
+
+class _Drop:
+    """Sentinel returned by a fused stage for rows removed by a filter."""
+    def __repr__(self) -> str:
+        return "DROP"
+
+    def __reduce__(self):
+        # Keep the sentinel a singleton across pickling (Ray / process workers)
+        return "DROP"
+
+DROP = _Drop()
+
+class FusedStages:
+    """
+    A run of Map/Filter functions applied in one pass.
+    Calling it on a row returns the transformed row, or DROP if any filter
+    rejected it, so a backend needs a single UDF boundary per row.
+    """
+    def __init__(self, stages: Iterable[tuple[str, Callable]]):
+        self.stages = tuple(stages)
+
+    @property
+    def has_map(self) -> bool:
+        return any(kind == "map" for kind, _ in self.stages)
+
+    @property
+    def name(self) -> str:
+        return " >> ".join(getattr(fn, "__name__", str(fn)) for _, fn in self.stages)
+
+    def __call__(self, row: Any) -> Any:
+        for kind, fn in self.stages:
+            if kind == "map":
+                row = fn(row)
+            elif not fn(row):
+                return DROP
+        return row
+
+    def test(self, row: Any) -> bool:
+        """Filter-only view: True if the row survives every stage."""
+        return self(row) is not DROP
+
+    def flat(self, row: Any) -> list[Any]:
+        """flat_map view: zero or one output rows."""
+        result = self(row)
+        return [] if result is DROP else [result]
+
+    def iterate(self, rows: Iterable[Any]) -> Iterator[Any]:
+        stages = self.stages
+        for row in rows:
+            for kind, fn in stages:
+                if kind == "map":
+                    row = fn(row)
+                elif not fn(row):
+                    break
+            else:
+                yield row
+
+    def __fingerprint__(self) -> tuple:
+        return tuple((kind, fingerprint(fn)) for kind, fn in self.stages)
+
+def _stage(node: Node) -> tuple[str, Callable] | None:
+    """
+    Returns the fusible (kind, fn) of a node, or None if it must stay separate.
+    Column expressions and batch UDFs are left alone: backends lower them natively.
+    """
+    if node.config.get("batch"):
+        return None
+    match node.op_type:
+        case OpType.MAP if _is_udf(node.config.get("fn")):
+            return ("map", node.config["fn"])
+        case OpType.FILTER if _is_udf(node.config.get("predicate")):
+            return ("filter", node.config["predicate"])
+    return None
+
+def _mode(node: Node) -> dict:
+    """Execution flags a fused run must share: parallel runs stay parallel."""
+    return {k: node.config[k] for k in ("parallel", "ordered") if k in node.config}
+
+def _is_udf(fn: Any) -> bool:
+    # `async def` UDFs are awaited one by one by the async lane
+    return callable(fn) and not isinstance(fn, Expr) and not inspect.iscoroutinefunction(fn)
+
+@trace_span("optimizer.fuse")
+def fuse_map_filter(graph: Graph) -> Graph:
+    """
+    Collapses linear runs of Map/Filter nodes into one FUSED node.
+    A node joins its parent's run only if it is that parent's sole consumer
+    and runs in the same mode (serial, or parallel with the same ordering).
+    """
+    consumers: Counter = Counter(p for n in graph.nodes.values() for p in n.parents)
+
+    # run head -> list of nodes; member -> head
+    runs: dict[NodeID, list[Node]] = {}
+    head_of: dict[NodeID, NodeID] = {}
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        if _stage(node) is None:
+            continue
+        parent = node.parents[0] if len(node.parents) == 1 else None
+        if parent in head_of and consumers[parent] == 1 and _mode(graph.nodes[parent]) == _mode(node):
+            head = head_of[parent]
+            runs[head].append(node)
+        else:
+            head = node_id
+            runs[head] = [node]
+        head_of[node_id] = head
+
+    fused_runs = {head: run for head, run in runs.items() if len(run) > 1}
+    if not fused_runs:
+        return graph
+
+    tails = {run[-1].id: run for run in fused_runs.values()}
+    members = {n.id for run in fused_runs.values() for n in run}
+
+    renamed: dict[NodeID, NodeID] = {}
+    result = Graph(id=graph.id)
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        if node_id in tails:
+            run = tails[node_id]
+            stages = FusedStages(_stage(n) for n in run)
+            parents = [renamed.get(p, p) for p in run[0].parents]
+            config = {"fn": stages, "fn_name": stages.name, **_mode(run[0])}
+            new = Node(
+                id=structural_id(OpType.FUSED, config, parents),
+                op_type=OpType.FUSED,
+                config=config,
+                parents=parents,
+                schema_in=run[0].schema_in,
+                schema_out=node.schema_out
+            )
+        elif node_id in members:
+            continue
+        else:
+            parents = [renamed.get(p, p) for p in node.parents]
+            if tuple(parents) == node.parents:
+                new = node
+            else:
+                new = Node(
+                    id=structural_id(node.op_type, node.config, parents),
+                    op_type=node.op_type,
+                    config=node.config,
+                    parents=parents,
+                    schema_in=node.schema_in,
+                    schema_out=node.schema_out
+                )
+        renamed[node_id] = new.id
+        result.add_node(new)
+    return result
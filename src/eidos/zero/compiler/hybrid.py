@@ -0,0 +1,194 @@
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+from ..symbolism.ast import Graph, NodeID, OpType
+from ..symbolism.builder import GraphBuilder
+from ..symbolism.params import bind, bindings
+from ..runtime.exchange import ArrowExchange
+from ...system.config import settings
+from ...system.logging import get_logger
+from ...system.telemetry import trace_span
+from .planner import Planner, _installed
+
+logger = get_logger(__name__)
+
+# Lane used for nodes without a pin or a placement rule
+DEFAULT_LANE = "polars"
+
+@dataclass
+class Segment:
+    """A connected run of nodes executed on one backend lane."""
+    lane: str
+    nodes: list[NodeID] = field(default_factory=list)
+    upstream: set[int] = field(default_factory=set)  # segments feeding this one directly
+
+def place(graph: Graph, planner: Planner | None = None) -> dict[NodeID, str]:
+    """
+    Assigns a lane to every node.
+    Explicit pins (`Source(..., engine=)`, `op.on(engine)`) win. Otherwise
+    multi-GB scans go to Ray, indicators run on the Polars vector lane, and
+    every other node stays on its first parent's lane.
+    """
+    lanes: dict[NodeID, str] = {}
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        match node.op_type:
+            case _ if node.config.get("engine"):
+                lane = node.config["engine"]
+            case OpType.SOURCE:
+                estimate = (planner or Planner()).estimate(node)
+                large = estimate.bytes is not None and estimate.bytes >= settings.planner_large_bytes
+                lane = "ray" if large and _installed("ray") else DEFAULT_LANE
+            case OpType.CUSTOM:
+                lane = "polars"
+            case _:
+                lane = lanes[node.parents[0]] if node.parents else DEFAULT_LANE
+        lanes[node_id] = lane
+    return lanes
+
+def _depends_on(segments: list[Segment], start: int, target: int) -> bool:
+    stack, seen = [start], set()
+    while stack:
+        current = stack.pop()
+        if current == target:
+            return True
+        if current not in seen:
+            seen.add(current)
+            stack.extend(segments[current].upstream)
+    return False
+
+def partition(graph: Graph, lanes: dict[NodeID, str]) -> tuple[list[Segment], dict[NodeID, int]]:
+    """
+    Groups nodes into segments, returned in executable (topological) order.
+    A node joins a same-lane parent's segment only when none of its other
+    inputs depend on that segment, which keeps the segment graph acyclic.
+    """
+    segments: list[Segment] = []
+    segment_of: dict[NodeID, int] = {}
+    for node_id in graph.topological_order():
+        lane = lanes[node_id]
+        parent_segments = {segment_of[p] for p in graph.nodes[node_id].parents}
+
+        chosen = next((
+            candidate for candidate in sorted(parent_segments)
+            if segments[candidate].lane == lane and not any(
+                _depends_on(segments, other, candidate) for other in parent_segments - {candidate}
+            )
+        ), None)
+        if chosen is None:
+            chosen = len(segments)
+            segments.append(Segment(lane))
+        segments[chosen].nodes.append(node_id)
+        segments[chosen].upstream |= parent_segments - {chosen}
+        segment_of[node_id] = chosen
+
+    # A segment can gain inputs from segments created after it: re-sort (Kahn).
+    indegree = {i: len(s.upstream) for i, s in enumerate(segments)}
+    ready = [i for i, d in indegree.items() if d == 0]
+    order = []
+    while ready:
+        current = ready.pop(0)
+        order.append(current)
+        for i, s in enumerate(segments):
+            if current in s.upstream:
+                indegree[i] -= 1
+                if indegree[i] == 0:
+                    ready.append(i)
+
+    remap = {old: new for new, old in enumerate(order)}
+    ordered = [segments[i] for i in order]
+    for s in ordered:
+        s.upstream = {remap[u] for u in s.upstream}
+    return ordered, {nid: remap[i] for nid, i in segment_of.items()}
+
+class HybridPlan:
+    """
+    A graph split into per-lane segments joined by Arrow hand-offs.
+    Nothing runs until the plan is called. Each call executes the segments
+    in dependency order, compiling each one on its own backend with its
+    cross-lane inputs bound to `arrow://` sources, and publishes the
+    segment's cross-lane outputs as Arrow tables through `ArrowExchange`.
+    Parameter values bound when the plan is wired are re-bound on each call.
+    """
+    def __init__(self, graph: Graph, lanes: dict[NodeID, str]):
+        self.graph = graph
+        self.lanes = lanes
+        self.params = bindings()
+        self.segments, self._segment_of = partition(graph, lanes)
+
+    def __repr__(self) -> str:
+        parts = ", ".join(f"{s.lane}[{len(s.nodes)}]" for s in self.segments)
+        return f"HybridPlan({parts})"
+
+    @trace_span("hybrid.execute")
+    def __call__(self) -> Any:
+        from .transpiler import Compiler
+
+        run = uuid.uuid4().hex
+        graph = self.graph
+        has_sinks = bool(graph.sinks)
+        outputs = {n.id for n in (graph.sinks or graph.leaves)}
+        results: dict[NodeID, Any] = {}
+        try:
+            for index, segment in enumerate(self.segments):
+                members = set(segment.nodes)
+                builder = GraphBuilder()
+                local: dict[NodeID, NodeID] = {}
+                # (segment sink id, original node id, kind)
+                exits: list[tuple[NodeID, NodeID, str]] = []
+
+                for node_id in segment.nodes:
+                    node = graph.nodes[node_id]
+                    parents = []
+                    for p in node.parents:
+                        if p not in members and p not in local:
+                            local[p] = builder.source(ArrowExchange.uri(run, p))
+                        parents.append(local[p])
+                    config = {k: v for k, v in node.config.items() if k != "engine"}
+                    local[node_id] = builder.add(node.op_type, config, parents)
+
+                    if node_id in outputs:
+                        if has_sinks:
+                            exits.append((local[node_id], node_id, "result"))
+                        else:
+                            exits.append((builder.sink(local[node_id], "arrow://"), node_id, "result"))
+                    if any(self._segment_of[c] != index for c in graph.children_of(node_id)):
+                        exits.append((builder.sink(local[node_id], "arrow://"), node_id, "handoff"))
+
+                segment_graph = builder.build()
+                with bind(self.params):
+                    compiled = Compiler.compile(segment_graph, target=segment.lane, use_cache=False)
+                sink_ids = [n.id for n in (segment_graph.sinks or segment_graph.leaves)]
+
+                logger.debug("Running hybrid segment", lane=segment.lane, nodes=len(segment.nodes))
+                if len(sink_ids) > 1 and callable(compiled):
+                    # A sink group: every exit of the segment in one pass
+                    values = dict(zip(sink_ids, compiled()))
+                else:
+                    artifacts = dict(zip(sink_ids, compiled if len(sink_ids) > 1 else [compiled]))
+                    values = {k: a() if callable(a) else a for k, a in artifacts.items()}
+                for sink_id, node_id, kind in exits:
+                    value = values[sink_id]
+                    if kind == "handoff":
+                        ArrowExchange.put(ArrowExchange.uri(run, node_id), value)
+                    else:
+                        results[node_id] = value
+        finally:
+            ArrowExchange.release(run)
+
+        ordered = [results[n.id] for n in (graph.sinks or graph.leaves)]
+        match ordered:
+            case [single]: return single
+            case _: return ordered
+
+class HybridBackend:
+    """
+    `target="hybrid"`: places each node on a lane and returns a HybridPlan.
+    Unlike node-level backends it compiles the whole graph at once
+    (`compile_graph`), since each segment is lowered by another backend.
+    """
+    reusable_plans = True
+    passes = ("cse",)
+
+    def compile_graph(self, graph: Graph) -> HybridPlan:
+        return HybridPlan(graph, place(graph))
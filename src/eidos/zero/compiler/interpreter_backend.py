@@ -0,0 +1,107 @@
+import functools
+from collections.abc import Iterator
+from typing import Any
+from ..symbolism.ast import Node, OpType
+from ..symbolism.expr import Expr
+from ..runtime.interpreters import load_stages, run_stages, subinterpreters_available
+from ..runtime.parallel import ParallelExecutor
+from ..runtime.store import publish
+from ...system.config import settings
+from ...system.logging import get_logger
+from .process_backend import ProcessBackend, Segment
+
+logger = get_logger(__name__)
+
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle = None
+
+@functools.cache
+def interpreter_pool() -> ParallelExecutor:
+    """Process-wide subinterpreter pool shared by every segment (started on first use)."""
+    return ParallelExecutor(settings.interpreter_workers, settings.process_chunk_size,
+                            settings.parallel_window or None, kind="interpreter")
+
+@functools.lru_cache(maxsize=256)
+def _loadable(path: str) -> bool:
+    """
+    Whether a subinterpreter can decode the stages published at `path`.
+    cloudpickle pickles functions from importable modules by reference, and
+    importing such a module there fails once it pulls in eidos or Polars.
+    """
+    try:
+        interpreter_pool().executor.submit(load_stages, path).result()
+    except Exception as e:
+        logger.debug("UDFs cannot be loaded in a subinterpreter, running inline", error=str(e))
+        return False
+    return True
+
+class InterpreterSegment(Segment):
+    """
+    A run of Map/Filter UDFs executed on the shared subinterpreter pool.
+    Only the UDFs travel: one cloudpickled blob, published once
+    (`store.publish`) and decoded once per interpreter; chunks carry its
+    path, and the stages run there as plain Python loops. Stages that
+    cannot be pickled, or cannot be loaded in a subinterpreter, run inline.
+    """
+    def stages(self) -> tuple[tuple[str, Any], ...]:
+        stages = []
+        for node in self.nodes:
+            match node.op_type:
+                case OpType.FUSED:
+                    stages.extend(node.config["fn"].stages)
+                case OpType.MAP:
+                    stages.append(("map", node.config["fn"]))
+                case OpType.FILTER:
+                    stages.append(("filter", node.config["predicate"]))
+        return tuple(stages)
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            blob = cloudpickle.dumps(self.stages())
+        except Exception as e:
+            logger.debug("UDFs cannot be shipped to subinterpreters, running inline", error=str(e))
+            return self._inline()
+        path = publish(blob)
+        if not _loadable(path):
+            return self._inline()
+        return self._distributed(path)
+
+    def _distributed(self, path: str) -> Iterator[Any]:
+        pool = interpreter_pool()
+        logger.debug("Running UDFs on subinterpreters", stages=len(self.nodes), workers=pool.workers)
+        return pool.stream(run_stages, path, self.upstream)
+
+class InterpreterBackend(ProcessBackend):
+    """
+    `target="interpreter"`: Python 3.14 subinterpreters, one GIL each.
+    A middle ground between threads (free-threading safe UDFs only) and
+    processes (higher start and IPC cost) for pipelines whose UDFs are not
+    free-threading safe. Runs of row UDFs (Map/Filter and fused runs of
+    them) go to the pool; everything else, including column expressions and
+    stateful indicators, runs in the main interpreter, since subinterpreters
+    cannot import Polars, NumPy or PyArrow.
+    """
+    segment_cls = InterpreterSegment
+
+    def __init__(self):
+        if not subinterpreters_available():
+            raise RuntimeError(
+                'target="interpreter" needs Python 3.14+ (concurrent.futures.InterpreterPoolExecutor); '
+                'use target="process" on older interpreters'
+            )
+        if cloudpickle is None:
+            raise ImportError("cloudpickle is required for target=\"interpreter\". Please pip install cloudpickle.")
+        super().__init__()
+
+    @staticmethod
+    def _segmentable(node: Node) -> bool:
+        config = node.config
+        match node.op_type:
+            case OpType.FUSED:
+                return True
+            case OpType.MAP | OpType.FILTER if not config.get("batch"):
+                fn = config.get("fn", config.get("predicate"))
+                return callable(fn) and not isinstance(fn, Expr)
+        return False
@@ -0,0 +1,117 @@
+from collections.abc import Callable, Iterable
+from ..symbolism.ast import Graph, Node, NodeID, OpType, intern_config
+from ..symbolism.fingerprint import structural_id
+from ...system.telemetry import trace_span
+from .fusion import fuse_map_filter
+from .pushdown import push_down_projections
+from .schema import infer_schemas
+
+type Pass = Callable[[Graph], Graph]
+
+@trace_span("optimizer.cse")
+def eliminate_common_subexpressions(graph: Graph) -> Graph:
+    """
+    Merges structurally identical subtrees into a single node.
+    IDs are recomputed bottom-up from (op type, config, canonical parents), so
+    graphs assembled from hand-made or deserialized nodes are canonicalized the
+    same way the DSL canonicalizes nodes at construction time.
+    """
+    canonical: dict[NodeID, NodeID] = {}
+    rewritten: dict[NodeID, Node] = {}
+
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        parents = [canonical.get(pid, pid) for pid in node.parents]
+        new_id = structural_id(node.op_type, node.config, parents)
+        canonical[node.id] = new_id
+        if new_id not in rewritten:
+            rewritten[new_id] = Node(
+                id=new_id,
+                op_type=node.op_type,
+                config=node.config,
+                parents=parents,
+                schema_in=node.schema_in,
+                schema_out=node.schema_out
+            )
+
+    if all(old == new for old, new in canonical.items()):
+        return graph
+
+    result = Graph(id=graph.id)
+    for node in rewritten.values():
+        result.add_node(node)
+    return result
+
+@trace_span("optimizer.expand")
+def expand_operator_algebra(graph: Graph) -> Graph:
+    """
+    Rewrites operator-level `A | B` / `A & B` (one parent, the branches stored
+    in config) into stream-level Choice/Ensemble nodes with one branch node
+    per operand, so backends only see the two-input form.
+    """
+    def branch(spec: dict, parent: NodeID) -> NodeID:
+        op = OpType(spec["type"])
+        config = spec["config"]
+        if op in (OpType.CHOICE, OpType.ENSEMBLE) and "left" in config:
+            parents = (branch(config["left"], parent), branch(config["right"], parent))
+            return add(op, {}, parents)
+        return add(op, config, (parent,))
+
+    def add(op: OpType, config: dict, parents: tuple[NodeID, ...], like: Node | None = None) -> NodeID:
+        shared, config_hash = intern_config(config)
+        node_id = structural_id(op, shared, parents, config_hash)
+        result.add_node(Node(
+            id=node_id, op_type=op, config=shared, parents=parents,
+            schema_in=like.schema_in if like else None,
+            schema_out=like.schema_out if like else None
+        ))
+        return node_id
+
+    def expandable(node: Node) -> bool:
+        return (
+            node.op_type in (OpType.CHOICE, OpType.ENSEMBLE)
+            and len(node.parents) == 1 and "left" in node.config
+        )
+
+    if not any(expandable(n) for n in graph.nodes.values()):
+        return graph
+
+    renamed: dict[NodeID, NodeID] = {}
+    result = Graph(id=graph.id)
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        parents = tuple(renamed.get(p, p) for p in node.parents)
+        if expandable(node):
+            pair = (branch(node.config["left"], parents[0]), branch(node.config["right"], parents[0]))
+            renamed[node_id] = add(node.op_type, {}, pair, like=node)
+        elif parents == node.parents:
+            result.add_node(node)
+        else:
+            renamed[node_id] = add(node.op_type, node.config, parents, like=node)
+    return result
+
+PASSES: dict[str, Pass] = {
+    "cse": eliminate_common_subexpressions,
+    "expand": expand_operator_algebra,
+    "fuse": fuse_map_filter,
+    "pushdown": push_down_projections,
+    "schema": infer_schemas,
+}
+
+DEFAULT_PASSES: tuple[str, ...] = ("cse",)
+
+class Optimizer:
+    """
+    Runs logical-plan rewrite passes before backend lowering.
+    Backends choose their pipeline through a `passes` class attribute.
+    """
+    def __init__(self, passes: Iterable[str] = DEFAULT_PASSES):
+        unknown = [name for name in passes if name not in PASSES]
+        if unknown:
+            raise ValueError(f"Unknown optimizer passes: {unknown}")
+        self.passes = tuple(passes)
+
+    def optimize(self, graph: Graph) -> Graph:
+        for name in self.passes:
+            graph = PASSES[name](graph)
+        return graph
@@ -0,0 +1,211 @@
+import atexit
+import functools
+import importlib.util
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from ..symbolism.ast import Graph, Node, OpType
+from ..symbolism.params import bound
+from ...system.config import settings
+from ...system.logging import get_logger
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+logger = get_logger(__name__)
+
+# Rough on-disk bytes per CSV row; CSV files carry no row count
+_CSV_BYTES_PER_ROW = 64
+# In-process lanes the planner may time against each other
+_EXPLORABLE = ("python", "polars")
+
+@dataclass(frozen=True)
+class SourceEstimate:
+    rows: int | None
+    bytes: int | None
+
+class StatsStore:
+    """
+    Persistent planner statistics in `.eidos/stats.json`:
+    row counts per source file (invalidated by mtime/size) and mean wall
+    time per (plan fingerprint, target), for the `stats_max_plans` most
+    recently run plans.
+    Updates stay in memory and are written by a background timer at most
+    every `stats_flush_seconds` (and at exit), so recording a run never
+    blocks on disk.
+    """
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or settings.stats_path)
+        self._lock = threading.Lock()
+        self._data: dict[str, dict] | None = None
+        self._timer: threading.Timer | None = None
+        atexit.register(self.flush)
+
+    def _load(self) -> dict[str, dict]:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._data = {}
+            self._data.setdefault("sources", {})
+            self._data.setdefault("runs", {})
+        return self._data
+
+    def _schedule_save(self) -> None:
+        # Called with the lock held: one pending write covers every update until it runs
+        if self._timer is None:
+            self._timer = threading.Timer(settings.stats_flush_seconds, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Writes pending updates now."""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer.cancel()
+            self._timer = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(self._data), encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError as e:
+                logger.warning("Failed to persist planner stats", error=str(e))
+
+    def source_rows(self, path: str, stat: os.stat_result) -> int | None:
+        with self._lock:
+            entry = self._load()["sources"].get(path)
+        if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return entry["rows"]
+        return None
+
+    def record_source(self, path: str, stat: os.stat_result, rows: int) -> None:
+        with self._lock:
+            self._load()["sources"][path] = {"mtime": stat.st_mtime, "size": stat.st_size, "rows": rows}
+            self._schedule_save()
+
+    def runtimes(self, fingerprint: str) -> dict[str, float]:
+        """Mean seconds per target for a plan."""
+        with self._lock:
+            runs = self._load()["runs"].get(fingerprint, {})
+            return {target: r["mean"] for target, r in runs.items()}
+
+    def run_counts(self, fingerprint: str) -> dict[str, int]:
+        """Recorded runs per target for a plan."""
+        with self._lock:
+            runs = self._load()["runs"].get(fingerprint, {})
+            return {target: r["count"] for target, r in runs.items()}
+
+    def record_run(self, fingerprint: str, target: str, seconds: float) -> None:
+        with self._lock:
+            plans = self._load()["runs"]
+            # Most recently run last; the oldest plans are forgotten first
+            runs = plans[fingerprint] = plans.pop(fingerprint, {})
+            while len(plans) > max(settings.stats_max_plans, 1):
+                del plans[next(iter(plans))]
+            entry = runs.setdefault(target, {"count": 0, "mean": 0.0})
+            entry["count"] += 1
+            entry["mean"] += (seconds - entry["mean"]) / entry["count"]
+            self._schedule_save()
+
+@functools.cache
+def stats_store(path: str) -> StatsStore:
+    """The process-wide store for a stats file, shared by every planner."""
+    return StatsStore(path)
+
+class Planner:
+    """
+    Cost-based backend selection for `engine="auto"`.
+    Once a plan has measured runtimes on two or more lanes, the fastest wins.
+    Otherwise the input size estimated from file metadata picks the lane:
+    tiny inputs (REST payloads) take the low-overhead Python lane, multi-GB
+    inputs go to Ray when it is installed, and everything else runs on Polars.
+    After `planner_explore_after` runs on the estimated Python or Polars
+    lane, a plan whose input is known not to be large runs once on the
+    other one, so the measurements have something to compare.
+    """
+    def __init__(self, stats: StatsStore | None = None):
+        self.stats = stats or stats_store(settings.stats_path)
+
+    def estimate(self, node: Node) -> SourceEstimate:
+        uri = node.config.get("uri", "")
+        if uri == "payload://":
+            payload = bound(node.config.get("payload"))
+            return SourceEstimate(len(payload) if isinstance(payload, list) else 1, 0)
+        if isinstance(node.config.get("data"), list):
+            return SourceEstimate(len(node.config["data"]), 0)
+
+        path = uri.split("://", 1)[-1]
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Streams, databases and unknown URIs
+            return SourceEstimate(None, None)
+
+        rows = self.stats.source_rows(path, stat)
+        if rows is None and pq is not None and path.endswith(".parquet"):
+            rows = pq.read_metadata(path).num_rows  # footer only
+            self.stats.record_source(path, stat, rows)
+        elif rows is None and path.endswith(".csv"):
+            rows = stat.st_size // _CSV_BYTES_PER_ROW
+        return SourceEstimate(rows, stat.st_size)
+
+    def choose(self, graph: Graph) -> str:
+        available = [t for t in ("python", "polars", "ray") if _installed(t)]
+
+        # Once the plan has run on several lanes, trust the measurements
+        measured = {t: s for t, s in self.stats.runtimes(graph.fingerprint).items() if t in available}
+        if len(measured) > 1:
+            target = min(measured, key=measured.get)
+            logger.debug("Planner chose measured target", target=target, seconds=measured[target])
+            return target
+
+        estimates = [self.estimate(n) for n in graph.sources if n.op_type == OpType.SOURCE]
+        # Only inputs of known, non-large size are worth timing on another lane
+        explorable = False
+        if any(e.bytes is None for e in estimates):
+            target = "polars"
+        else:
+            total = sum(e.bytes for e in estimates)
+            explorable = total < settings.planner_large_bytes
+            rows = sum(e.rows or 0 for e in estimates)
+            if total >= settings.planner_large_bytes:
+                target = "ray"
+            elif total <= settings.planner_small_bytes and rows <= settings.planner_small_rows:
+                target = "python"
+            else:
+                target = "polars"
+
+        if target not in available:
+            target = "polars" if "polars" in available else "python"
+
+        runs = self.stats.run_counts(graph.fingerprint).get(target, 0)
+        if explorable and target in _EXPLORABLE and 0 < settings.planner_explore_after <= runs:
+            alternative = next(t for t in _EXPLORABLE if t != target)
+            if alternative in available:
+                logger.debug("Planner times an alternative target", target=alternative, estimated=target)
+                return alternative
+
+        logger.debug("Planner chose target", target=target)
+        return target
+
+    def timed(self, graph: Graph, target: str, action: Callable[[], Any]) -> Callable[[], Any]:
+        """Wraps a sink action so its wall time feeds future choices."""
+        fingerprint = graph.fingerprint
+        def run():
+            start = time.perf_counter()
+            result = action()
+            self.stats.record_run(fingerprint, target, time.perf_counter() - start)
+            return result
+        return run
+
+def _installed(target: str) -> bool:
+    return target == "python" or importlib.util.find_spec(target) is not None
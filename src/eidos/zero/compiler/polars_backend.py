@@ -1,15 +1,81 @@
 from typing import Any, Callable
 from ..symbolism.ast import Node, OpType
+from ..symbolism.expr import Expr
+from ..runtime.exchange import ArrowExchange
+from .fusion import FusedStages
 
 try:
     import polars as pl
 except ImportError:
     pl = None
 
+# Polars 2 made `how="horizontal"` strict about heights; padding became "horizontal_extend"
+_HORIZONTAL_PADDED = "horizontal_extend" if pl and int(pl.__version__.split(".")[0]) >= 2 else "horizontal"
+
+def _to_payload(fn: Callable) -> Callable:
+    """A row Map as Polars runs it: the result becomes the row's only column."""
+    return lambda row: {"payload": fn(row)}
+
+class PolarsSink:
+    """A sink closure: calling it executes the plan into its target."""
+    __slots__ = ("lf", "uri")
+
+    def __init__(self, lf: "pl.LazyFrame", uri: str):
+        self.lf = lf
+        self.uri = uri
+
+    def lazy(self) -> "pl.LazyFrame":
+        """The plan whose collection performs this sink (for `pl.collect_all`)."""
+        if self.uri.startswith("parquet://"):
+            return self.lf.sink_parquet(self.uri.replace("parquet://", ""), lazy=True)
+        return self.lf
+
+    def result(self, df: "pl.DataFrame") -> Any:
+        match self.uri:
+            case "arrow://":
+                return df.to_arrow()
+            case _ if self.uri.startswith("parquet://"):
+                return None
+            case _:
+                return df
+
+    def __call__(self) -> Any:
+        return self.result(pl.collect_all([self.lazy()])[0])
+
+class SinkGroup:
+    """
+    All sinks of one graph.
+    Calling the group executes every sink in a single `pl.collect_all`, so
+    subplans they share (scans, indicators) are computed once. Iterating
+    yields the individual sinks, which can still be run on their own.
+    """
+    __slots__ = ("sinks",)
+
+    def __init__(self, sinks: list[PolarsSink]):
+        self.sinks = sinks
+
+    def __len__(self) -> int:
+        return len(self.sinks)
+
+    def __iter__(self):
+        return iter(self.sinks)
+
+    def __getitem__(self, index: int) -> PolarsSink:
+        return self.sinks[index]
+
+    def __call__(self) -> list[Any]:
+        frames = pl.collect_all([sink.lazy() for sink in self.sinks])
+        return [sink.result(df) for sink, df in zip(self.sinks, frames)]
+
 class PolarsBackend:
     """
     Compiles Eidos AST into Polars LazyFrame.
     """
+    # LazyFrames and sink closures can be executed any number of times.
+    reusable_plans = True
+    passes = ("expand", "cse", "pushdown", "fuse")
+    version = pl.__version__ if pl else None
+
     def __init__(self):
         self._custom_compilers: dict[str, Callable] = {
             "SMA": self._compile_sma,
@@ -26,19 +92,33 @@ class PolarsBackend:
             "VWAP": self._compile_vwap
         }
 
+    @staticmethod
+    def finalize(results: list[Any]) -> Any:
+        """Groups multiple sinks so they execute together."""
+        if len(results) > 1 and all(isinstance(r, PolarsSink) for r in results):
+            return SinkGroup(results)
+        return results
+
     def compile_node(self, node: Node, inputs: list[Any]) -> Any:
         if pl is None:
             raise ImportError("Polars is not installed. Please pip install polars.")
 
         if node.op_type == OpType.SOURCE:
             uri = node.config.get("uri", "")
+            # Set by the pushdown pass: scan only what downstream operators read
+            columns = node.config.get("columns")
             match uri:
+                case _ if uri.startswith("arrow://"):
+                    # Hand-off from another lane of a hybrid plan (zero-copy)
+                    return pl.from_arrow(ArrowExchange.get(uri)).lazy()
                 case _ if uri.startswith("csv://") or uri.endswith(".csv"):
                     clean_uri = uri.replace("csv://", "")
-                    return pl.scan_csv(clean_uri)
+                    lf = pl.scan_csv(clean_uri)
+                    return lf.select(columns) if columns else lf
                 case _ if uri.startswith("parquet://") or uri.endswith(".parquet"):
                     clean_uri = uri.replace("parquet://", "")
-                    return pl.scan_parquet(clean_uri)
+                    lf = pl.scan_parquet(clean_uri)
+                    return lf.select(columns) if columns else lf
                 case _:
                     # Fallback for testing
                     return pl.DataFrame({"close": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
@@ -54,20 +134,103 @@ class PolarsBackend:
             return lf # Pass through if it's a sink result
 
         match node.op_type:
+            case OpType.FILTER if node.config.get("batch"):
+                predicate = node.config["predicate"]
+                return lf.map_batches(lambda df: df.filter(predicate(df)), validate_output_schema=False)
+
+            case OpType.MAP if node.config.get("batch"):
+                return lf.map_batches(node.config["fn"], validate_output_schema=False)
+
             case OpType.FILTER:
-                if predicate := node.config.get("predicate"):
+                predicate = node.config.get("predicate")
+                if isinstance(predicate, Expr):
+                    return lf.filter(predicate.to_polars())
+                if predicate:
                     return lf.filter(
                         pl.struct(pl.all()).map_elements(predicate, return_dtype=pl.Boolean)
                     )
                 return lf
 
             case OpType.MAP:
-                if fn := node.config.get("fn"):
+                fn = node.config.get("fn")
+                if isinstance(fn, Expr):
+                    return lf.select(fn.to_polars().alias("payload"))
+                if fn:
                     return lf.select(
                         pl.struct(pl.all()).map_elements(fn).alias("payload")
                     )
                 return lf
 
+            case OpType.MERGE if len(inputs) > 1:
+                # `+`: time-ordered merge on a sort key, else a vertical union
+                if on := node.config.get("on"):
+                    merged = inputs[0]
+                    for other in inputs[1:]:
+                        merged = merged.merge_sorted(other, key=on)
+                    return merged
+                return pl.concat(inputs, how="diagonal_relaxed")
+
+            case OpType.ENSEMBLE if len(inputs) > 1:
+                # `&`: row-aligned horizontal join; shared columns are taken once.
+                # Like the Python lane's zip, stop at the shortest branch: pad
+                # shorter branches with nulls, then drop rows missing any
+                # branch's marker column.
+                seen = set(lf.collect_schema().names())
+                markers = [f"__ensemble{i}" for i in range(len(inputs))]
+                parts = [lf.with_columns(pl.lit(True).alias(markers[0]))]
+                for other, marker in zip(inputs[1:], markers[1:]):
+                    extra = [c for c in other.collect_schema().names() if c not in seen]
+                    seen.update(extra)
+                    parts.append(other.select(*extra, pl.lit(True).alias(marker)))
+                return (
+                    pl.concat(parts, how=_HORIZONTAL_PADDED)
+                    .filter(pl.all_horizontal(pl.col(markers).is_not_null()))
+                    .drop(markers)
+                )
+
+            case OpType.CHOICE if len(inputs) > 1:
+                # `|`: first branch that yields rows. Both branches stay in one
+                # lazy plan (evaluated in parallel); the lowest non-empty one wins.
+                tagged = [
+                    branch.with_columns(pl.lit(i, dtype=pl.UInt32).alias("__branch"))
+                    for i, branch in enumerate(inputs)
+                ]
+                return (
+                    pl.concat(tagged, how="diagonal_relaxed")
+                    .filter(pl.col("__branch") == pl.col("__branch").min())
+                    .drop("__branch")
+                )
+
+            case OpType.WINDOW:
+                return self._compile_window(node, lf)
+
+            case OpType.PROJECT:
+                return lf.select(node.config["columns"])
+
+            case OpType.WITH_COLUMN:
+                return lf.with_columns(node.config["expr"].to_polars().alias(node.config["name"]))
+
+            case OpType.FUSED:
+                # A single struct round trip for the whole Map/Filter run
+                fused = node.config["fn"]
+                if not fused.has_map:
+                    return lf.filter(
+                        pl.struct(pl.all()).map_elements(fused.test, return_dtype=pl.Boolean)
+                    )
+                # Unfused, every Map emits a "payload" column, so later stages see
+                # {"payload": value} rows: give the fused stages the same shape.
+                stages = FusedStages(
+                    (kind, _to_payload(fn) if kind == "map" else fn) for kind, fn in fused.stages
+                )
+                # Rows dropped mid-run never materialize, so the output length differs
+                # from the input: run it as one frame-level batch call.
+                return lf.map_batches(
+                    lambda df: pl.DataFrame(
+                        {"payload": [row["payload"] for row in stages.iterate(df.iter_rows(named=True))]}
+                    ),
+                    validate_output_schema=False
+                )
+
             case OpType.CUSTOM:
                 kind = node.config.get("kind")
                 if compiler := self._custom_compilers.get(kind):
@@ -77,21 +240,40 @@ class PolarsBackend:
                     return lf
 
             case OpType.SINK:
-                uri = node.config.get("uri", "")
-                def execute():
-                    match uri:
-                        case "collect" | "memory":
-                            return lf.collect()
-                        case _ if uri.startswith("parquet://"):
-                            path = uri.replace("parquet://", "")
-                            return lf.sink_parquet(path)
-                        case _:
-                            return lf.collect()
-                return execute
+                return PolarsSink(lf, node.config.get("uri", ""))
 
             case _:
                 return lf
 
+    @staticmethod
+    def _compile_window(node: Node, lf: "pl.LazyFrame") -> "pl.LazyFrame":
+        """
+        Count windows group on a row index (`"{n}i"` durations), event-time
+        windows become `group_by_dynamic` (with a slide) or `rolling` (without).
+        Without `agg` every column is collected into a list per window.
+        """
+        config = node.config
+        on, size, slide = config.get("on"), config["size"], config.get("slide")
+        duration = lambda spec: spec if isinstance(spec, str) else f"{spec}i"
+        if agg := config.get("agg"):
+            exprs = [getattr(pl.col(column), fn)().alias(name) for name, (column, fn) in agg.items()]
+        else:
+            exprs = [pl.exclude(on) if on else pl.all()]
+        if on is None:
+            # Only complete windows, like the Python lane
+            return (
+                lf.with_row_index("__index").with_columns(pl.col("__index").cast(pl.Int64))
+                .group_by_dynamic("__index", every=duration(slide or 1), period=duration(size),
+                                  closed="left", label="left", start_by="window")
+                .agg(*exprs, pl.len().alias("__len"))
+                .filter(pl.col("__len") == size)
+                .drop("__index", "__len")
+            )
+        if slide is None:
+            return lf.rolling(index_column=on, period=duration(size)).agg(*exprs)
+        return lf.group_by_dynamic(on, every=duration(slide), period=duration(size),
+                                   closed="left", label="left", start_by="window").agg(*exprs)
+
     def _compile_sma(self, node: Node, lf: "pl.LazyFrame") -> "pl.LazyFrame":
         window = node.config["window"]
         field = node.config["field"]
@@ -0,0 +1,126 @@
+import functools
+from collections.abc import Iterable, Iterator
+from typing import Any
+from ..symbolism.ast import Graph, Node, OpType
+from ..symbolism.builder import GraphBuilder
+from ..symbolism.expr import Expr
+from ..runtime.parallel import ParallelExecutor
+from ..runtime.serializer import PlanSerializer
+from ..runtime.store import publish
+from ...system.config import settings
+from ...system.logging import get_logger
+from .python_backend import PythonBackend
+
+logger = get_logger(__name__)
+
+# Row-local operators: a chunk's output depends only on that chunk
+_CHUNK_SAFE = (OpType.MAP, OpType.FILTER, OpType.FUSED, OpType.PROJECT, OpType.WITH_COLUMN)
+
+# --- Worker side ---
+
+@functools.lru_cache(maxsize=32)
+def _load_segment(path: str) -> list[Node]:
+    """Reads and decodes a published plan segment (and its UDFs) once per worker process."""
+    with open(path, "rb") as f:
+        graph = PlanSerializer.loads(f.read())
+    return [graph.nodes[n] for n in graph.topological_order()][1:]  # skip the chunk source
+
+def _run_chunk(path: str, chunk: tuple) -> list:
+    backend = PythonBackend()
+    rows: Iterable[Any] = iter(chunk)
+    for node in _load_segment(path):
+        rows = backend.compile_node(node, [rows])
+    return list(rows)
+
+# --- Driver side ---
+
+@functools.cache
+def process_pool() -> ParallelExecutor:
+    """Process-wide worker pool shared by every plan segment (started on first use)."""
+    return ParallelExecutor(settings.process_workers, settings.process_chunk_size,
+                            settings.parallel_window or None, kind="process")
+
+class Segment:
+    """
+    A pending run of row-local operators over `upstream`.
+    Iterating it ships the run to the shared process pool: the plan segment
+    is serialized once (PlanSerializer, one cloudpickled copy per UDF) and
+    published under its content hash (`store.publish`). Row chunks carry
+    only that key, and each worker reads and decodes the segment once;
+    results are merged back in input order. Runs without a row UDF (only
+    column expressions, Select, WithColumn) are cheaper than the hand-off
+    and run inline.
+    """
+    def __init__(self, upstream: Iterable[Any], nodes: tuple[Node, ...]):
+        self.upstream = upstream
+        self.nodes = nodes
+
+    def extend(self, node: Node) -> "Segment":
+        return type(self)(self.upstream, self.nodes + (node,))
+
+    def plan(self) -> Graph:
+        builder = GraphBuilder()
+        tip = builder.source("chunk://")
+        for node in self.nodes:
+            # The segment already runs in parallel: no nested pools in workers
+            config = {k: v for k, v in node.config.items() if k not in ("parallel", "ordered", "engine")}
+            tip = builder.add(node.op_type, config, (tip,))
+        return builder.build()
+
+    @property
+    def has_udf(self) -> bool:
+        for node in self.nodes:
+            match node.op_type:
+                case OpType.FUSED:
+                    return True
+                case OpType.MAP | OpType.FILTER:
+                    fn = node.config.get("fn", node.config.get("predicate"))
+                    if callable(fn) and not isinstance(fn, Expr):
+                        return True
+        return False
+
+    def __iter__(self) -> Iterator[Any]:
+        if not self.has_udf:
+            return self._inline()
+        try:
+            plan = PlanSerializer.dumps(self.plan())
+        except Exception as e:
+            # Unpicklable UDFs (locks, open connections...) run in this process
+            logger.debug("Plan segment cannot be shipped to worker processes, running inline", error=str(e))
+            return self._inline()
+        return self._distributed(plan)
+
+    def _inline(self) -> Iterator[Any]:
+        backend = PythonBackend()
+        rows = iter(self.upstream)
+        for node in self.nodes:
+            rows = backend.compile_node(node, [rows])
+        return iter(rows)
+
+    def _distributed(self, plan: bytes) -> Iterator[Any]:
+        pool = process_pool()
+        logger.debug("Running plan segment on process pool", nodes=len(self.nodes), workers=pool.workers)
+        return pool.stream(_run_chunk, publish(plan), self.upstream)
+
+class ProcessBackend(PythonBackend):
+    """
+    `target="process"`: the Free Lane on a local process pool, for
+    multi-core Python UDF throughput on GIL builds without a Ray cluster.
+    Consecutive row-local operators (Map, Filter and fused runs of them,
+    batch UDFs, Select, WithColumn) are grouped into a `Segment` that
+    workers execute chunk by chunk. Sources, sinks, indicators, windows and stream algebra
+    stay in the driver process, since they depend on row order or state.
+    """
+    segment_cls = Segment
+
+    def compile_node(self, node: Node, inputs: list[Iterable[Any]]) -> Any:
+        if self._segmentable(node) and len(inputs) == 1:
+            upstream = inputs[0]
+            if isinstance(upstream, self.segment_cls):
+                return upstream.extend(node)
+            return self.segment_cls(upstream, (node,))
+        return super().compile_node(node, inputs)
+
+    @staticmethod
+    def _segmentable(node: Node) -> bool:
+        return node.op_type in _CHUNK_SAFE
@@ -0,0 +1,96 @@
+from ..symbolism.ast import Graph, Node, NodeID, OpType, intern_config
+from ..symbolism.expr import Expr
+from ..symbolism.fingerprint import structural_id
+from ...quant.indicators import input_columns, output_columns
+from ...system.telemetry import trace_span
+
+# A required column set; None means "every column" (nothing can be pruned).
+type Columns = set[str] | None
+
+def _union(*needs: Columns) -> Columns:
+    if any(need is None for need in needs):
+        return None
+    return set().union(*needs)
+
+def _input_need(node: Node, out: Columns) -> Columns:
+    """Columns `node` reads from its inputs, given the columns required of its output."""
+    config = node.config
+    match node.op_type:
+        case OpType.PROJECT:
+            return set(config["columns"])
+        case OpType.MAP if isinstance(config.get("fn"), Expr):
+            return config["fn"].columns()
+        case OpType.FILTER if isinstance(config.get("predicate"), Expr):
+            return _union(out, config["predicate"].columns())
+        case OpType.WITH_COLUMN:
+            return None if out is None else (out - {config["name"]}) | config["expr"].columns()
+        case OpType.WINDOW if config.get("agg"):
+            # One record of aggregates per window, whatever is required of it
+            need = {column for column, _ in config["agg"].values()}
+            return need | {config["on"]} if config.get("on") else need
+        case OpType.CUSTOM if output_columns(config):
+            if out is None:
+                return None
+            return (out - set(output_columns(config))) | set(input_columns(config))
+        case _:
+            # Sinks emit every column; UDFs may read any of them. Multi-input
+            # nodes are conservative too: each branch may own different columns.
+            return None
+
+@trace_span("optimizer.pushdown")
+def push_down_projections(graph: Graph) -> Graph:
+    """
+    Computes the minimal column set each source must produce and records it
+    as the source's `columns` config, so backends scan only those columns.
+    Requirements flow backwards from the outputs: Select, `Map(expr)` and
+    aggregated windows narrow them to the columns they read, expression
+    filters and WithColumn add theirs, indicators swap their outputs for
+    their inputs, and sinks, opaque UDFs and row windows require everything.
+    So a source is only pruned below a narrowing node; a plan that sinks
+    whole rows reads every column.
+    """
+    order = graph.topological_order()
+    required: dict[NodeID, Columns] = {}
+    for node_id in reversed(order):
+        children = graph.children_of(node_id)
+        if not children:
+            required[node_id] = None
+            continue
+        required[node_id] = _union(*(
+            _input_need(graph.nodes[child], required[child]) for child in children
+        ))
+
+    pruned = {
+        node.id: required[node.id] for node in graph.sources
+        if node.op_type == OpType.SOURCE and required[node.id] is not None
+    }
+    if not pruned:
+        return graph
+
+    renamed: dict[NodeID, NodeID] = {}
+    result = Graph(id=graph.id)
+    for node_id in order:
+        node = graph.nodes[node_id]
+        parents = tuple(renamed.get(p, p) for p in node.parents)
+        config = node.config
+        if node_id in pruned:
+            existing = config.get("columns")
+            keep = pruned[node_id]
+            columns = [c for c in existing if c in keep] if existing else sorted(keep)
+            config = {**config, "columns": columns}
+
+        if config is node.config and parents == node.parents:
+            new = node
+        else:
+            shared, config_hash = intern_config(config)
+            new = Node(
+                id=structural_id(node.op_type, shared, parents, config_hash),
+                op_type=node.op_type,
+                config=shared,
+                parents=parents,
+                schema_in=node.schema_in,
+                schema_out=node.schema_out
+            )
+        renamed[node_id] = new.id
+        result.add_node(new)
+    return result
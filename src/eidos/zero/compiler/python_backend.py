@@ -1,40 +1,67 @@
-from typing import Any, List, Iterator, Iterable, Dict
+from typing import Any, Callable, List, Iterator, Iterable, Dict
 import csv
+import functools
+import heapq
 import io
+import itertools
+import operator
 from ..symbolism.ast import Node, OpType
+from ..symbolism.expr import Expr
+from ..symbolism.params import bound
+from ..runtime.batch import timed_batches
+from ..runtime.exchange import ArrowExchange
+from ..runtime.scheduler import BranchScheduler, safe_tee
+from ..runtime.parallel import ParallelExecutor
+from ..runtime.window import windows
+from ...system.config import settings
+from ...system.logging import get_logger
 try:
-    from ...quant import python_impl
+    from ...quant.streaming import STREAMING_INDICATORS
 except ImportError:
-    python_impl = None
+    STREAMING_INDICATORS = {}
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = get_logger(__name__)
+
+@functools.cache
+def branch_scheduler() -> BranchScheduler:
+    """Process-wide pool shared by every Python-lane plan."""
+    return BranchScheduler(settings.branch_workers, settings.branch_queue_size, PythonBackend.batch_size)
+
+@functools.cache
+def parallel_executor() -> ParallelExecutor:
+    """Process-wide pool for Map/Filter(parallel=True)."""
+    return ParallelExecutor(settings.parallel_workers, settings.parallel_chunk_size,
+                            settings.parallel_window or None, settings.parallel_executor)
 
 class PythonBackend:
     """
     The "Free Lane": Pure Python execution using generators.
     No heavy dependencies (Polars/Ray) required.
     """
+    # Generators are single-shot: the plan cache keeps a factory instead.
+    reusable_plans = False
+    # Schemas come last so fused nodes are typed too
+    passes = ("expand", "cse", "pushdown", "fuse", "schema")
+    # Rows gathered per call for column expressions and batch UDFs
+    batch_size = 1024
+
     def __init__(self):
-        self._custom_handlers = {}
-        if python_impl:
-            self._custom_handlers = {
-                "SMA": python_impl.calculate_sma,
-                "EMA": python_impl.calculate_ema,
-                "WMA": python_impl.calculate_wma,
-                "RSI": python_impl.calculate_rsi,
-                "MACD": python_impl.calculate_macd,
-                "BBands": python_impl.calculate_bbands,
-                "Stoch": python_impl.calculate_stoch,
-                "CCI": python_impl.calculate_cci,
-                "ADX": python_impl.calculate_adx,
-                "ATR": python_impl.calculate_atr,
-                "OBV": python_impl.calculate_obv,
-                "VWAP": python_impl.calculate_vwap
-            }
+        self._custom_handlers = STREAMING_INDICATORS
 
     def compile_node(self, node: Node, inputs: List[Iterable[Any]]) -> Iterable[Any]:
         
         if node.op_type == OpType.SOURCE:
             uri = node.config.get("uri", "")
             
+            if uri.startswith("arrow://"):
+                # Hand-off from another lane of a hybrid plan
+                return iter(ArrowExchange.get(uri).to_pylist())
+
             # --- Universal I/O Sources ---
             if uri.startswith("kafka://"):
                 from ...io.kafka import KafkaConnector
@@ -47,11 +74,11 @@ class PythonBackend:
             # Basic implementation for CSV and in-memory lists
             if uri.startswith("csv://") or uri.endswith(".csv"):
                 path = uri.replace("csv://", "")
-                return self._read_csv(path)
+                return self._read_csv(path, node.schema_out, node.config.get("columns"))
             elif isinstance(node.config.get("data"), list):
                 return iter(node.config["data"])
             elif node.config.get("uri") == "payload://":
-                return iter([node.config.get("payload", {})])
+                return iter([bound(node.config.get("payload", {}))])
             else:
                 # Fallback: simple generator
                 return iter([{"data": "dummy"}])
@@ -60,18 +87,45 @@ class PythonBackend:
              raise ValueError(f"Node {node.op_type} requires input")
 
         upstream = inputs[0]
-        
+
+        if node.op_type in (OpType.MERGE, OpType.ENSEMBLE, OpType.CHOICE) and len(inputs) > 1:
+            return self._combine(node, inputs)
+
+        if node.op_type in (OpType.MAP, OpType.FILTER) and node.config.get("batch"):
+            return self._run_batches(upstream, node)
+
+        if node.op_type in (OpType.MAP, OpType.FILTER, OpType.FUSED) and node.config.get("parallel"):
+            fn = node.config.get("fn") or node.config.get("predicate")
+            if not isinstance(fn, Expr):
+                kind = {OpType.MAP: "map", OpType.FILTER: "filter", OpType.FUSED: "fused"}[node.op_type]
+                return parallel_executor().run(kind, fn, upstream, node.config.get("ordered", True))
+
         if node.op_type == OpType.MAP:
             fn = node.config.get("fn")
+            if isinstance(fn, Expr):
+                return self._eval_expr(upstream, fn, "map")
             if fn:
                 return map(fn, upstream)
             return upstream
         
         if node.op_type == OpType.FILTER:
             pred = node.config.get("predicate")
+            if isinstance(pred, Expr):
+                return self._eval_expr(upstream, pred, "filter")
             if pred:
                 return filter(pred, upstream)
             return upstream
+
+        if node.op_type == OpType.PROJECT:
+            columns = node.config["columns"]
+            return ({c: row[c] for c in columns} for row in upstream)
+
+        if node.op_type == OpType.WITH_COLUMN:
+            return self._eval_expr(upstream, node.config["expr"], "with_column", node.config["name"])
+
+        if node.op_type == OpType.FUSED:
+            # One generator frame for the whole Map/Filter run
+            return node.config["fn"].iterate(upstream)
             
         if node.op_type == OpType.SINK:
             uri = node.config.get("uri", "")
@@ -90,6 +144,9 @@ class PythonBackend:
                     return list(RedisConnector.write(uri, upstream))
                 return execute_redis
 
+            if uri == "arrow://":
+                return lambda: ArrowExchange.from_rows(list(upstream))
+
             # Sink consumes the generator
             def execute():
                 results = []
@@ -115,52 +172,188 @@ class PythonBackend:
             return execute
 
         if node.op_type == OpType.WINDOW:
-            size = int(node.config.get("size", 1))
-            return self._window_gen(upstream, size)
+            config = node.config
+            return windows(upstream, config.get("size", 1), config.get("slide"), config.get("on"), config.get("agg"))
 
         # Handling Custom Ops (Quant)
         if node.op_type == OpType.CUSTOM:
             kind = node.config.get("kind")
             if kind in self._custom_handlers:
-                # These handlers expect a list of dicts, so we must materialize the upstream
-                # This is inefficient for streaming, but required for indicators that need history
-                # Future optimization: Use deque buffer
-                data = list(upstream)
-                
-                # Map config to args
-                kwargs = {k: v for k, v in node.config.items() if k != "kind"}
+                # Stateful indicators: one row in, one row out, window-sized state
+                kwargs = {k: v for k, v in node.config.items() if k not in ("kind", "engine")}
                 # Fix argument names if needed (e.g., 'std' vs 'std_dev')
                 if kind == "BBands" and "std" in kwargs:
                     kwargs["std_dev"] = kwargs.pop("std")
-                
-                return iter(self._custom_handlers[kind](data, **kwargs))
+
+                return self._custom_handlers[kind](**kwargs)(upstream)
             
             print(f"[PythonBackend] Warning: Passthrough for Custom Op {kind}")
             return upstream
 
         return upstream
 
-    def _read_csv(self, path: str) -> Iterator[dict]:
+    def share(self, artifact: Any, consumers: int) -> list[Any]:
+        """
+        Fans a shared upstream out to several consumers without recomputing it.
+        Generators are tee'd; sink actions are plain callables and are reused.
+        """
+        if callable(artifact) or not isinstance(artifact, Iterable):
+            return [artifact] * consumers
+        if settings.branch_workers > 0:
+            # Consumers may end up on different branch threads
+            return safe_tee(artifact, consumers)
+        return list(itertools.tee(artifact, consumers))
+
+    def _combine(self, node: Node, inputs: list[Iterable[Any]]) -> Iterator[Any]:
+        """
+        Stream algebra over several branches.
+        `+` concatenates them (or merges sorted inputs on `on`), `&` zips them
+        row by row and `|` yields the first branch that produces rows without
+        failing. Merge and ensemble branches run concurrently on the branch
+        scheduler; choice branches are only started when needed.
+        """
+        match node.op_type:
+            case OpType.CHOICE:
+                return self._first_of(inputs)
+            case OpType.MERGE if node.config.get("on"):
+                branches = [branch_scheduler().spawn(b) for b in inputs]
+                return heapq.merge(*branches, key=operator.itemgetter(node.config["on"]))
+            case OpType.MERGE:
+                return itertools.chain.from_iterable([branch_scheduler().spawn(b) for b in inputs])
+            case _:
+                branches = [branch_scheduler().spawn(b) for b in inputs]
+                return map(self._join, zip(*branches))
+
+    @staticmethod
+    def _join(rows: tuple[Any, ...]) -> Any:
+        """One ensemble row: records are joined (first value wins), anything else is a tuple."""
+        if not all(isinstance(row, dict) for row in rows):
+            return rows
+        joined = dict(rows[0])
+        for row in rows[1:]:
+            for key, value in row.items():
+                joined.setdefault(key, value)
+        return joined
+
+    @staticmethod
+    def _first_of(branches: list[Iterable[Any]]) -> Iterator[Any]:
+        for branch in branches[:-1]:
+            rows = iter(branch)
+            try:
+                first = next(rows)
+            except StopIteration:
+                continue
+            except Exception as e:
+                logger.debug("Choice branch failed, falling back", error=str(e))
+                continue
+            yield first
+            yield from rows
+            return
+        yield from branches[-1]
+
+    def _eval_expr(self, rows: Iterable[dict], expr: Expr, mode: str, name: str | None = None) -> Iterator[Any]:
+        """
+        Evaluates a column expression over row dicts, one NumPy call per chunk
+        (cut short after `batch_max_delay` on slow streams).
+        Falls back to per-row evaluation when NumPy is not installed.
+        """
+        if np is None:
+            for row in rows:
+                match mode:
+                    case "map":
+                        yield expr(row)
+                    case "filter" if expr(row):
+                        yield row
+                    case "with_column":
+                        yield {**row, name: expr(row)}
+            return
+
+        columns = expr.columns()
+        for chunk in timed_batches(rows, self.batch_size, settings.batch_max_delay):
+            vectors = {c: np.asarray([row[c] for row in chunk]) for c in columns}
+            result = expr.to_numpy(vectors, len(chunk))
+            match mode:
+                case "map":
+                    yield from result.tolist()
+                case "filter":
+                    yield from itertools.compress(chunk, result.tolist())
+                case "with_column":
+                    for row, value in zip(chunk, result.tolist()):
+                        yield {**row, name: value}
+
+    def _run_batches(self, rows: Iterable[dict], node: Node) -> Iterator[dict]:
+        """
+        Chunks row dicts into column batches (dict of NumPy arrays) for batch UDFs,
+        cut short after `batch_max_delay` on slow streams.
+        Map functions return a column batch; Filter predicates return a mask.
+        """
+        for chunk in timed_batches(rows, self.batch_size, settings.batch_max_delay):
+            batch = self._to_columns(chunk)
+            if node.op_type == OpType.FILTER:
+                mask = node.config["predicate"](batch)
+                yield from itertools.compress(chunk, self._to_list(mask))
+            else:
+                result = node.config["fn"](batch)
+                names = list(result)
+                for values in zip(*(self._to_list(result[n]) for n in names)):
+                    yield dict(zip(names, values))
+
+    @staticmethod
+    def _to_columns(chunk: tuple[dict, ...]) -> dict[str, Any]:
+        # Union of keys in first-seen order; rows without a key get None
+        names = dict.fromkeys(n for row in chunk for n in row)
+        columns = {n: [row.get(n) for row in chunk] for n in names}
+        if np is None:
+            return columns
+        return {n: np.asarray(values) for n, values in columns.items()}
+
+    @staticmethod
+    def _to_list(values: Any) -> list:
+        return values.tolist() if hasattr(values, "tolist") else list(values)
+
+    def _read_csv(self, path: str, schema: Any = None, columns: list[str] | None = None) -> Iterator[dict]:
         try:
             with open(path, "r", newline='') as f:
                 reader = csv.DictReader(f)
+                names = columns or reader.fieldnames or []
+                if schema is not None:
+                    # Typed records from the inferred schema
+                    converters = {field.name: self._converter(field.type) for field in schema}
+                    for row in reader:
+                        yield {k: converters[k](row[k]) if row[k] != "" else None for k in names}
+                    return
                 for row in reader:
                     # Try to convert numbers
-                    yield {k: self._try_convert(v) for k, v in row.items()}
+                    yield {k: self._try_convert(row[k]) for k in names}
         except FileNotFoundError:
             print(f"[PythonBackend] File not found: {path}")
             yield {}
 
-    def _try_convert(self, value):
+    @classmethod
+    def _converter(cls, dtype: Any) -> Callable[[str], Any]:
+        import pyarrow as pa
+        match dtype:
+            case _ if pa.types.is_integer(dtype):
+                parse = int
+            case _ if pa.types.is_floating(dtype):
+                parse = float
+            case _ if pa.types.is_boolean(dtype):
+                return lambda v: v.lower() in ("true", "1")
+            case _:
+                return str
+
+        def convert(value: str) -> Any:
+            # The schema is inferred from the head of the file: values it did
+            # not foresee ("NA", a float deep in an int column) are guessed
+            try:
+                return parse(value)
+            except ValueError:
+                return cls._try_convert(value)
+        return convert
+
+    @staticmethod
+    def _try_convert(value):
         try:
             return float(value)
         except ValueError:
             return value
-
-    def _window_gen(self, iterable, size):
-        buffer = []
-        for item in iterable:
-            buffer.append(item)
-            if len(buffer) >= size:
-                yield buffer.copy()
-                buffer.pop(0) # Slide by 1
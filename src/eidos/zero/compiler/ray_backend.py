@@ -1,5 +1,7 @@
 from typing import Any
 from ..symbolism.ast import Node, OpType
+from ..symbolism.expr import Expr
+from ..runtime.exchange import ArrowExchange
 
 try:
     import ray
@@ -8,6 +10,13 @@ except ImportError:
     ray = None
     Dataset = Any
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
 try:
     from ...quant import python_impl
 except ImportError:
@@ -17,17 +26,29 @@ class RayBackend:
     """
     Compiles Eidos AST into Ray Data execution plan.
     """
+    reusable_plans = True
+    passes = ("cse", "pushdown", "fuse")
+    version = ray.__version__ if ray else None
+
     def compile_node(self, node: Node, inputs: list[Any]) -> Any:
         if ray is None:
             raise ImportError("Ray is not installed. Please pip install 'ray[data]'.")
         
         if node.op_type == OpType.SOURCE:
             uri = node.config.get("uri", "")
+            # Set by the pushdown pass: read only what downstream operators use
+            columns = node.config.get("columns")
             match uri:
+                case _ if uri.startswith("arrow://"):
+                    # Hand-off from another lane of a hybrid plan
+                    return ray.data.from_arrow(ArrowExchange.get(uri))
                 case _ if uri.startswith("parquet://") or uri.endswith(".parquet"):
-                    return ray.data.read_parquet(uri.replace("parquet://", ""))
+                    return ray.data.read_parquet(uri.replace("parquet://", ""), columns=columns)
                 case _ if uri.startswith("csv://") or uri.endswith(".csv"):
-                    return ray.data.read_csv(uri.replace("csv://", ""))
+                    path = uri.replace("csv://", "")
+                    if columns:
+                        return ray.data.read_csv(path, convert_options=pa_csv.ConvertOptions(include_columns=columns))
+                    return ray.data.read_csv(path)
                 case _:
                     # Fallback
                     return ray.data.from_items([{"status": "dummy_ray_source"}])
@@ -38,15 +59,54 @@ class RayBackend:
         ds = inputs[0]
         
         match node.op_type:
+            case OpType.MAP if node.config.get("batch"):
+                return ds.map_batches(node.config["fn"], batch_format="pyarrow")
+
+            case OpType.FILTER if node.config.get("batch"):
+                pred = node.config["predicate"]
+                def filter_batch(t: "pa.Table") -> "pa.Table":
+                    mask = pred(t)
+                    if not isinstance(mask, (pa.Array, pa.ChunkedArray)):
+                        mask = pa.array(mask, type=pa.bool_())
+                    return t.filter(mask)
+                return ds.map_batches(filter_batch, batch_format="pyarrow")
+
             case OpType.MAP:
-                if fn := node.config.get("fn"):
+                fn = node.config.get("fn")
+                if isinstance(fn, Expr):
+                    return ds.map_batches(
+                        lambda t: pa.table({"payload": fn.to_arrow(t)}), batch_format="pyarrow"
+                    )
+                if fn:
                     return ds.map(fn)
                 return ds
             
             case OpType.FILTER:
-                if pred := node.config.get("predicate"):
+                pred = node.config.get("predicate")
+                if isinstance(pred, Expr):
+                    return ds.map_batches(lambda t: t.filter(pred.to_arrow(t)), batch_format="pyarrow")
+                if pred:
                     return ds.filter(pred)
                 return ds
+
+            case OpType.PROJECT:
+                return ds.select_columns(node.config["columns"])
+
+            case OpType.WITH_COLUMN:
+                name, expr = node.config["name"], node.config["expr"]
+                def with_column(t: "pa.Table") -> "pa.Table":
+                    values = expr.to_arrow(t)
+                    if name in t.column_names:
+                        return t.set_column(t.column_names.index(name), name, values)
+                    return t.append_column(name, values)
+                return ds.map_batches(with_column, batch_format="pyarrow")
+
+            case OpType.FUSED:
+                # One task per block for the whole Map/Filter run
+                fused = node.config["fn"]
+                if fused.has_map:
+                    return ds.flat_map(fused.flat)
+                return ds.filter(fused.test)
             
             case OpType.CUSTOM:
                 kind = node.config.get("kind")
@@ -63,7 +123,7 @@ class RayBackend:
                     rows = [{k: batch[k][i] for k in keys} for i in range(length)]
                     
                     # Apply logic
-                    kwargs = {k: v for k, v in node.config.items() if k != "kind"}
+                    kwargs = {k: v for k, v in node.config.items() if k not in ("kind", "engine")}
                     # Adjust argument names for compatibility
                     match kind:
                         case "BBands" if "std" in kwargs:
@@ -93,6 +153,8 @@ class RayBackend:
                     match uri:
                         case "collect":
                             return ds.take_all()
+                        case "arrow://":
+                            return pa.concat_tables(ray.get(ds.to_arrow_refs()))
                         case _ if uri.startswith("parquet://"):
                             path = uri.replace("parquet://", "")
                             ds.write_parquet(path)
@@ -0,0 +1,115 @@
+import dataclasses
+from ..symbolism.ast import Graph, Node, OpType
+from ..symbolism.expr import Expr
+from ...quant.indicators import output_columns
+from ...system.logging import get_logger
+from ...system.telemetry import trace_span
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = get_logger(__name__)
+
+def source_schema(node: Node) -> "pa.Schema | None":
+    """Reads column names and dtypes from a source without scanning it."""
+    uri = node.config.get("uri", "")
+    schema = None
+    try:
+        match uri:
+            case _ if uri.startswith("csv://") or uri.endswith(".csv"):
+                # The streaming reader only infers types from the first block
+                with pa_csv.open_csv(uri.replace("csv://", "")) as reader:
+                    schema = reader.schema
+            case _ if uri.startswith("parquet://") or uri.endswith(".parquet"):
+                schema = pq.read_schema(uri.replace("parquet://", ""))
+            case "payload://" if isinstance(node.config.get("payload"), dict):
+                schema = pa.Table.from_pylist([node.config["payload"]]).schema
+    except (OSError, pa.ArrowInvalid) as e:
+        logger.debug("Schema inference skipped", uri=uri, error=str(e))
+    if schema is not None and (columns := node.config.get("columns")):
+        return _project(schema, columns)
+    return schema
+
+def _project(schema: "pa.Schema", columns: list[str]) -> "pa.Schema | None":
+    if any(schema.get_field_index(c) < 0 for c in columns):
+        return None
+    return pa.schema([schema.field(c) for c in columns])
+
+def expr_type(expr: Expr, schema: "pa.Schema") -> "pa.DataType | None":
+    """Result dtype of a column expression, evaluated over an empty table."""
+    try:
+        return expr.to_arrow(schema.empty_table()).type
+    except (KeyError, pa.ArrowException):
+        return None
+
+def _with_field(schema: "pa.Schema", name: str, dtype: "pa.DataType") -> "pa.Schema":
+    index = schema.get_field_index(name)
+    if index >= 0:
+        return schema.set(index, pa.field(name, dtype))
+    return schema.append(pa.field(name, dtype))
+
+def _output_schema(node: Node, inputs: list["pa.Schema | None"]) -> "pa.Schema | None":
+    if node.op_type == OpType.SOURCE:
+        return source_schema(node)
+
+    schema = inputs[0] if inputs else None
+    if schema is None:
+        return None
+
+    match node.op_type:
+        case OpType.FILTER | OpType.SINK:
+            return schema
+        case OpType.PROJECT:
+            return _project(schema, node.config["columns"])
+        case OpType.FUSED:
+            return None if node.config["fn"].has_map else schema
+        case OpType.MAP if isinstance(node.config.get("fn"), Expr):
+            dtype = expr_type(node.config["fn"], schema)
+            return pa.schema([("payload", dtype)]) if dtype is not None else None
+        case OpType.WITH_COLUMN:
+            dtype = expr_type(node.config["expr"], schema)
+            return _with_field(schema, node.config["name"], dtype) if dtype is not None else None
+        case OpType.CUSTOM:
+            for name in output_columns(node.config):
+                schema = _with_field(schema, name, pa.float64())
+            return schema
+        case OpType.MERGE | OpType.CHOICE if all(s is not None and s.equals(schema) for s in inputs):
+            return schema
+        case _:
+            # Opaque UDFs and untyped operators end propagation
+            return None
+
+@trace_span("optimizer.schema")
+def infer_schemas(graph: Graph) -> Graph:
+    """
+    Fills `schema_in`/`schema_out` on every node, as Arrow schemas.
+    Sources are typed from file headers (CSV, Parquet) or payloads; indicators
+    append their known float64 output columns; expressions are typed by
+    evaluating them over an empty table. Unknown schemas stay None.
+    """
+    schemas: dict[str, "pa.Schema | None"] = {}
+    typed: list[Node] = []
+    for node_id in graph.topological_order():
+        node = graph.nodes[node_id]
+        inputs = [schemas.get(p) for p in node.parents]
+        schemas[node_id] = _output_schema(node, inputs)
+        typed.append(dataclasses.replace(
+            node,
+            schema_in=inputs[0] if inputs else None,
+            schema_out=schemas[node_id]
+        ))
+
+    result = Graph(id=graph.id)
+    for node in typed:
+        result.add_node(node)
+    return result
+
+def output_schema(graph: Graph) -> "pa.Schema | None":
+    """Schema of the graph's single output (sink, or leaf if there are no sinks)."""
+    typed = infer_schemas(graph)
+    outputs = typed.sinks or typed.leaves
+    return outputs[0].schema_out if len(outputs) == 1 else None
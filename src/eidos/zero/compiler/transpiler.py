@@ -1,47 +1,88 @@
+from collections import Counter
+from dataclasses import dataclass
 from typing import Any, Protocol
 import importlib.metadata
 from ..symbolism.ast import Graph, Node, OpType, NodeID
+from ..symbolism.params import bind, graph_params
 from ...system.telemetry import trace_span
 from ...system.governance import LineageRegistry
+from ...system.config import settings
+from .cache import PlanCache, CompiledPlan, CacheStats
+from .optimizer import Optimizer, DEFAULT_PASSES
 
 class BackendCompiler(Protocol):
     def compile_node(self, node: Node, inputs: list[Any]) -> Any:
         ...
 
+@dataclass(frozen=True)
+class Schedule:
+    """
+    The walk `Transpiler` makes over a graph, computed once: nodes in
+    topological order, how many consumers each has, and the output nodes.
+    Cached plans keep it so re-wiring them never re-traverses the graph.
+    """
+    nodes: tuple[Node, ...]
+    consumers: Counter
+    targets: tuple[NodeID, ...]
+
 class Transpiler:
     """
     Generic Graph Walker that delegates node compilation to a backend.
+    Each node is compiled exactly once. When a node feeds several consumers
+    and the backend produces single-consumer artifacts (e.g. generators), the
+    backend's optional `share(artifact, n)` hook splits it into n handles.
+    With several outputs, the optional `finalize(results)` hook may combine
+    them into one artifact (e.g. a jointly executed sink group).
+    A `memo` of artifacts keyed by node ID lets callers reuse the lowering of
+    unchanged subtrees across compiles (IDs are structural).
     """
     def __init__(self, backend: BackendCompiler):
         self.backend = backend
 
+    @staticmethod
+    def schedule(graph: Graph) -> Schedule:
+        sinks = graph.sinks
+        targets = tuple(n.id for n in (sinks or graph.leaves))
+        # Iterative walk in topological order: no recursion limit on deep chains
+        nodes = tuple(graph.nodes[nid] for nid in graph.topological_order(list(targets)))
+        consumers: Counter = Counter(p for node in nodes for p in node.parents)
+        return Schedule(nodes, consumers, targets)
+
     @trace_span("transpiler.visit")
-    def compile(self, graph: Graph) -> Any:
-        # Simple memoized recursive visitor for DAG traversal
+    def compile(self, graph: Graph, memo: dict[NodeID, Any] | None = None) -> Any:
+        return self.run(self.schedule(graph), memo)
+
+    def run(self, schedule: Schedule, memo: dict[NodeID, Any] | None = None) -> Any:
+        """Lowers every node of a precomputed schedule."""
+        consumers = schedule.consumers
+        share = getattr(self.backend, "share", None)
+
         compiled_nodes: dict[NodeID, Any] = {}
+        handles: dict[NodeID, list[Any]] = {}
+
+        def take(node_id: NodeID) -> Any:
+            result = compiled_nodes[node_id]
+            if share is None or consumers[node_id] <= 1:
+                return result
+            if node_id not in handles:
+                handles[node_id] = list(share(result, consumers[node_id]))
+            return handles[node_id].pop()
+
+        for node in schedule.nodes:
+            node_id = node.id
+            if memo is not None and node_id in memo:
+                compiled_nodes[node_id] = memo[node_id]
+                continue
+            parent_results = [take(pid) for pid in node.parents]
+            compiled_nodes[node_id] = self.backend.compile_node(node, parent_results)
+            if memo is not None:
+                memo[node_id] = compiled_nodes[node_id]
         
-        def visit(node_id: NodeID) -> Any:
-            if node_id in compiled_nodes:
-                return compiled_nodes[node_id]
-            
-            node = graph.nodes[node_id]
-            
-            # Compile parents first
-            parent_results = [visit(pid) for pid in node.parents]
-            
-            # Compile current node
-            result = self.backend.compile_node(node, parent_results)
-            compiled_nodes[node_id] = result
-            return result
-        
-        sinks = graph.sinks
-        if not sinks:
-            parent_ids = {p for p, _ in graph.edges}
-            leaf_ids = [n.id for n in graph.nodes.values() if n.id not in parent_ids]
-            results = [visit(lid) for lid in leaf_ids]
-        else:
-            results = [visit(sink.id) for sink in sinks]
-            
+        results = [compiled_nodes[tid] for tid in schedule.targets]
+        finalize = getattr(self.backend, "finalize", None)
+        if finalize is not None and len(results) > 1:
+            return finalize(results)
+
         # Python 3.10+ Pattern Matching
         match results:
             case [single]: return single
@@ -51,6 +92,8 @@ class StringBackend:
     """
     A mock backend that generates a string representation (IR) of the plan.
     """
+    reusable_plans = True
+
     @staticmethod
     def compile_node(node: Node, inputs: list[str]) -> str:
         inp = inputs[0] if inputs else "None"
@@ -83,7 +126,21 @@ class StringBackend:
             
             case OpType.MERGE:
                 return f"Merge({', '.join(inputs)})"
-                
+
+            case OpType.FUSED:
+                fn = node.config.get('fn_name', 'fused')
+                return f"Fused({inp}, fn={fn})"
+
+            case OpType.PROJECT:
+                return f"Project({inp}, columns={node.config['columns']})"
+
+            case OpType.WITH_COLUMN:
+                return f"WithColumn({inp}, {node.config['name']}={node.config['expr']!r})"
+
+            case OpType.WINDOW:
+                spec = ", ".join(f"{k}={node.config[k]}" for k in ("size", "slide", "on") if k in node.config)
+                return f"Window({inp}, {spec})"
+
             case _:
                 return f"Unknown({node.op_type})"
 
@@ -91,10 +148,44 @@ class Compiler:
     """
     Main entry point for compilation.
     Supports Plugin Architecture via Entry Points.
+    Compiled plans are memoized in a bounded LRU cache keyed by the graph's
+    structural fingerprint, so repeated requests skip lineage registration,
+    backend discovery and the graph walk. Bind-time parameters (`Param`,
+    e.g. REST payloads) are not part of the fingerprint: their values are
+    bound from the graph being compiled whenever a cached plan is wired.
     """
-    @staticmethod
+    plan_cache = PlanCache(max_size=settings.plan_cache_size)
+    _backends: dict[str, tuple[type, str | None]] = {}
+
+    @classmethod
     @trace_span("compiler.compile")
-    def compile(graph: Graph, target: str = "string") -> Any:
+    def compile(cls, graph: Graph, target: str = "string", use_cache: bool = True) -> Any:
+        backend_cls, version = cls._resolve_backend(target)
+        params = graph_params(graph)
+
+        if not use_cache:
+            plan = cls._build(graph, backend_cls, params)
+        else:
+            key = (graph.fingerprint, target, version)
+            plan = cls.plan_cache.get(key)
+            if plan is None:
+                plan = cls._build(graph, backend_cls, params)
+                cls.plan_cache.put(key, plan)
+        with bind(params):
+            return plan.materialize()
+
+    @classmethod
+    def cache_stats(cls) -> CacheStats:
+        return cls.plan_cache.stats
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drops compiled plans and forgets resolved backends (e.g. after installing a plugin)."""
+        cls.plan_cache.clear()
+        cls._backends.clear()
+
+    @staticmethod
+    def register_lineage(graph: Graph) -> None:
         # Register Lineage (Governance)
         try:
             LineageRegistry.register(graph)
@@ -102,7 +193,35 @@ class Compiler:
             # Governance failure should not block execution
             pass
 
-        backend = None
+    @classmethod
+    def _build(cls, graph: Graph, backend_cls: type, params: dict[str, Any] | None = None) -> CompiledPlan:
+        cls.register_lineage(graph)
+
+        graph = Optimizer(getattr(backend_cls, "passes", DEFAULT_PASSES)).optimize(graph)
+
+        backend = backend_cls()
+        # A reusable artifact would keep the first request's parameter values
+        reusable = getattr(backend_cls, "reusable_plans", False) and not params
+        # Graph-level backends (e.g. hybrid) lower the whole plan themselves
+        compile_graph = getattr(backend, "compile_graph", None)
+        if compile_graph is None:
+            transpiler = Transpiler(backend)
+            if reusable:
+                return CompiledPlan(artifact=transpiler.compile(graph))
+            # Single-shot artifacts are re-wired per lookup: walk the graph once, here
+            schedule = Transpiler.schedule(graph)
+            return CompiledPlan(factory=lambda: transpiler.run(schedule))
+        if reusable:
+            return CompiledPlan(artifact=compile_graph(graph))
+        return CompiledPlan(factory=lambda: compile_graph(graph))
+
+    @classmethod
+    def _resolve_backend(cls, target: str) -> tuple[type, str | None]:
+        """Returns (backend class, backend version), discovering it once per target."""
+        if target in cls._backends:
+            return cls._backends[target]
+
+        resolved = None
         
         # 1. Try plugin discovery (Modern Plugin System)
         try:
@@ -111,34 +230,52 @@ class Compiler:
             for ep in entry_points:
                 if ep.name == target:
                     backend_cls = ep.load()
-                    backend = backend_cls()
+                    dist = getattr(ep, "dist", None)
+                    version = getattr(backend_cls, "version", None) or getattr(dist, "version", None)
+                    resolved = (backend_cls, version)
                     break
         except Exception:
             # Silently fail if no plugins found or error in loading
             pass
             
         # 2. Built-in Backends (Legacy/Core)
-        if backend is None:
+        if resolved is None:
             match target:
                 case "string":
-                    backend = StringBackend()
+                    backend_cls = StringBackend
                 case "polars":
                     from .polars_backend import PolarsBackend
-                    backend = PolarsBackend()
+                    backend_cls = PolarsBackend
                 case "ray":
                     from .ray_backend import RayBackend
-                    backend = RayBackend()
+                    backend_cls = RayBackend
                 case "dolphindb":
                     from .dolphindb_backend import DolphinDBBackend
-                    backend = DolphinDBBackend()
+                    backend_cls = DolphinDBBackend
                 case "python":
                     from .python_backend import PythonBackend
-                    backend = PythonBackend()
+                    backend_cls = PythonBackend
+                case "process":
+                    from .process_backend import ProcessBackend
+                    backend_cls = ProcessBackend
+                case "interpreter":
+                    from .interpreter_backend import InterpreterBackend
+                    backend_cls = InterpreterBackend
+                case "async":
+                    from .async_backend import AsyncBackend
+                    backend_cls = AsyncBackend
+                case "columnar":
+                    from .columnar_backend import ColumnarBackend
+                    backend_cls = ColumnarBackend
                 case "triton":
                     from .triton_backend import TritonBackend
-                    backend = TritonBackend()
+                    backend_cls = TritonBackend
+                case "hybrid":
+                    from .hybrid import HybridBackend
+                    backend_cls = HybridBackend
                 case _:
                     raise ValueError(f"Unknown target: {target}")
-            
-        transpiler = Transpiler(backend)
-        return transpiler.compile(graph)
+            resolved = (backend_cls, getattr(backend_cls, "version", None))
+
+        cls._backends[target] = resolved
+        return resolved
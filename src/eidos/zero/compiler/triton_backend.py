@@ -6,6 +6,8 @@ class TritonBackend:
     Experimental Backend that compiles Map operations to OpenAI Triton Kernels.
     Target: GPU (CUDA).
     """
+    reusable_plans = True
+
     def compile_node(self, node: Node, inputs: list[Any]) -> str:
         # For simplicity, we return the Kernel Source Code as the "Compiled Artifact"
         
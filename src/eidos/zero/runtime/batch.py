@@ -0,0 +1,216 @@
+import itertools
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+class RecordBatch:
+    """
+    A chunk of rows stored column-wise: one array per column (NumPy when
+    installed, plain lists otherwise), in schema order.
+    Operators that add, drop or select columns share the untouched column
+    arrays instead of copying rows. Exports through the Arrow C stream
+    interface (`__arrow_c_stream__`), so `pl.DataFrame(batch)` and
+    `pa.table(batch)` take it directly.
+    A `bare` batch carries non-dict rows (e.g. `Map(expr)` results or
+    windows) in a single `payload` column and yields them back unwrapped,
+    so row operators see the same values as on the Python lane.
+    """
+    __slots__ = ("columns", "num_rows", "bare")
+
+    def __init__(self, columns: dict[str, Any], num_rows: int | None = None, bare: bool = False):
+        self.columns = columns
+        if num_rows is None:
+            num_rows = len(next(iter(columns.values()))) if columns else 0
+        self.num_rows = num_rows
+        self.bare = bare
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __repr__(self) -> str:
+        return f"RecordBatch(rows={self.num_rows}, columns={self.names})"
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.columns)
+
+    @property
+    def schema(self) -> "pa.Schema":
+        return self.to_arrow().schema
+
+    @staticmethod
+    def column(values: Iterable[Any]) -> Any:
+        """A NumPy array when every value has the same numeric or bool type, else a list."""
+        values = values if isinstance(values, list) else list(values)
+        if np is None or not values:
+            return values
+        kind = type(values[0])
+        if issubclass(kind, (bool, int, float, np.number, np.bool_)) and all(type(v) is kind for v in values):
+            return np.asarray(values)
+        return values
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> "RecordBatch":
+        rows = list(rows)
+        if not rows:
+            return cls({}, 0)
+        if not all(isinstance(row, dict) for row in rows):
+            return cls({"payload": cls.column(rows)}, len(rows), bare=True)
+        # Union of keys in first-seen order; rows without a key get None
+        names = dict.fromkeys(name for row in rows for name in row)
+        return cls({name: cls.column([row.get(name) for row in rows]) for name in names}, len(rows))
+
+    @classmethod
+    def from_arrow(cls, data: Any) -> "RecordBatch":
+        """From a pyarrow Table/RecordBatch (numeric columns without nulls are zero-copy)."""
+        columns = {}
+        for name, array in zip(data.column_names, data.columns):
+            if np is not None and array.null_count == 0 and pa.types.is_primitive(array.type):
+                columns[name] = array.to_numpy()
+            else:
+                columns[name] = array.to_pylist()
+        return cls(columns, data.num_rows)
+
+    @classmethod
+    def concat(cls, batches: Iterable["RecordBatch"]) -> "RecordBatch":
+        batches = [b for b in batches if b.num_rows]
+        if not batches:
+            return cls({}, 0)
+        if len(batches) == 1:
+            return batches[0]
+        columns = {}
+        for name in dict.fromkeys(name for b in batches for name in b.columns):
+            parts = [b.columns.get(name, [None] * b.num_rows) for b in batches]
+            if np is not None and all(isinstance(p, np.ndarray) for p in parts):
+                columns[name] = np.concatenate(parts)
+            else:
+                columns[name] = [v for p in parts for v in _to_list(p)]
+        return cls(columns, sum(b.num_rows for b in batches), bare=all(b.bare for b in batches))
+
+    def rows(self) -> Iterator[Any]:
+        if self.bare:
+            return iter(_to_list(self.columns["payload"]))
+        names = self.names
+        return (dict(zip(names, values)) for values in zip(*(_to_list(c) for c in self.columns.values())))
+
+    def to_pylist(self) -> list[Any]:
+        return list(self.rows())
+
+    def select(self, names: Iterable[str]) -> "RecordBatch":
+        return RecordBatch({n: self.columns[n] for n in names}, self.num_rows)
+
+    def with_columns(self, new: dict[str, Any]) -> "RecordBatch":
+        return RecordBatch({**self.columns, **new}, self.num_rows)
+
+    def filter(self, mask: Any) -> "RecordBatch":
+        if np is not None:
+            mask = np.asarray(mask, dtype=bool)
+            return RecordBatch({
+                n: c[mask] if isinstance(c, np.ndarray) else list(itertools.compress(c, mask.tolist()))
+                for n, c in self.columns.items()
+            }, int(mask.sum()), self.bare)
+        mask = list(mask)
+        return RecordBatch({n: list(itertools.compress(c, mask)) for n, c in self.columns.items()},
+                           sum(map(bool, mask)), self.bare)
+
+    def to_arrow(self) -> "pa.Table":
+        if pa is None:
+            raise ImportError("pyarrow is required to export record batches")
+        return pa.table({n: pa.array(c) for n, c in self.columns.items()})
+
+    def __arrow_c_stream__(self, requested_schema: Any = None) -> Any:
+        return self.to_arrow().__arrow_c_stream__(requested_schema)
+
+def batched_rows(rows: Iterable[Any], size: int) -> Iterator[RecordBatch]:
+    """Groups a row stream into record batches of up to `size` rows."""
+    for chunk in itertools.batched(rows, size):
+        yield RecordBatch.from_rows(chunk)
+
+def timed_batches(rows: Iterable[Any], size: int, max_delay: float = 0) -> Iterator[tuple]:
+    """
+    Like `itertools.batched`, but a partial batch is also cut once
+    `max_delay` seconds have passed since its first row, even if no further
+    row arrives: a stream that goes silent (a quiet Kafka topic) still
+    delivers the rows it already produced. Rows are pulled on a helper
+    thread into a bounded queue, and the caller waits on the queue with the
+    batch's deadline as timeout. `max_delay=0` only cuts full batches and
+    pulls rows inline.
+    """
+    if not max_delay:
+        yield from itertools.batched(rows, size)
+        return
+    channel: queue.Queue = queue.Queue(2 * size)
+    cancelled = threading.Event()
+    threading.Thread(target=_pump, args=(rows, channel, cancelled), daemon=True, name="eidos-batch").start()
+
+    clock = time.monotonic
+    chunk: list[Any] = []
+    deadline = 0.0
+    try:
+        while True:
+            try:
+                kind, value = channel.get(timeout=max(deadline - clock(), 0) if chunk else None)
+            except queue.Empty:
+                # Deadline passed without a new row
+                yield tuple(chunk)
+                chunk = []
+                continue
+            if kind == _ERROR:
+                raise value
+            if kind == _DONE:
+                break
+            if not chunk:
+                deadline = clock() + max_delay
+            chunk.append(value)
+            if len(chunk) >= size or clock() >= deadline:
+                yield tuple(chunk)
+                chunk = []
+        if chunk:
+            yield tuple(chunk)
+    finally:
+        # Early exit, close() or garbage collection: stop pulling rows
+        cancelled.set()
+
+# Queue items are tagged: (kind, value)
+_ROW, _ERROR, _DONE = range(3)
+# How long a blocked pump waits before re-checking for cancellation
+_POLL_SECONDS = 0.05
+
+def _pump(rows: Iterable[Any], channel: queue.Queue, cancelled: threading.Event) -> None:
+    def put(item: tuple[int, Any]) -> bool:
+        while not cancelled.is_set():
+            try:
+                channel.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    iterator = iter(rows)
+    try:
+        for row in iterator:
+            if not put((_ROW, row)):
+                break
+        else:
+            put((_DONE, None))
+    except BaseException as e:
+        put((_ERROR, e))
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+def _to_list(values: Any) -> list:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
@@ -0,0 +1,48 @@
+import threading
+from typing import Any
+
+class ArrowExchange:
+    """
+    Hand-off point for Arrow tables between backend lanes of a hybrid plan.
+    A producing segment publishes its output under `arrow://<run>/<node id>`;
+    consuming lanes wrap the same buffers (pl.from_arrow, ray.data.from_arrow)
+    without copying. Tables are dropped when the run finishes.
+    """
+    _tables: dict[str, dict[str, Any]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def uri(run: str, node_id: str) -> str:
+        return f"arrow://{run}/{node_id}"
+
+    @classmethod
+    def put(cls, uri: str, table: Any) -> None:
+        run, key = cls._split(uri)
+        with cls._lock:
+            cls._tables.setdefault(run, {})[key] = table
+
+    @classmethod
+    def get(cls, uri: str) -> Any:
+        run, key = cls._split(uri)
+        try:
+            return cls._tables[run][key]
+        except KeyError:
+            raise KeyError(f"No Arrow table published at {uri}") from None
+
+    @classmethod
+    def release(cls, run: str) -> None:
+        with cls._lock:
+            cls._tables.pop(run, None)
+
+    @staticmethod
+    def _split(uri: str) -> tuple[str, str]:
+        run, _, key = uri.removeprefix("arrow://").partition("/")
+        return run, key
+
+    @staticmethod
+    def from_rows(rows: list[Any]) -> Any:
+        """Arrow table from Python-lane rows; scalar streams become a `payload` column."""
+        import pyarrow as pa
+        if rows and not isinstance(rows[0], dict):
+            return pa.table({"payload": rows})
+        return pa.Table.from_pylist(rows)
@@ -0,0 +1,110 @@
+import pickle
+import sys
+import types
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, Future
+from typing import Any
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+except ImportError:  # Python < 3.14
+    InterpreterPoolExecutor = None
+
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle = None
+
+# Name of the module that holds a worker's decoded stages, and how many it keeps
+_STAGES_MODULE = "_eidos_stages"
+_MAX_STAGES = 32
+
+def subinterpreters_available() -> bool:
+    return InterpreterPoolExecutor is not None
+
+# --- Worker side ---
+# This module is pickled by value, so these functions reach a subinterpreter
+# without importing eidos (Polars, NumPy and PyArrow cannot load there).
+
+def _stages(path: str) -> tuple:
+    # Decoded stages, by published path, in a module that survives between calls
+    module = sys.modules.get(_STAGES_MODULE)
+    if module is None:
+        module = sys.modules[_STAGES_MODULE] = types.ModuleType(_STAGES_MODULE)
+        module.stages = {}
+    stages = module.stages.get(path)
+    if stages is None:
+        with open(path, "rb") as f:
+            stages = pickle.loads(f.read())
+        if len(module.stages) >= _MAX_STAGES:
+            module.stages.pop(next(iter(module.stages)))
+        module.stages[path] = stages
+    return stages
+
+def load_stages(path: str) -> int:
+    """Decodes the (kind, fn) stages published at `path` once per interpreter."""
+    return len(_stages(path))
+
+def run_stages(path: str, chunk: Iterable[Any]) -> list:
+    stages = _stages(path)
+    out = []
+    for row in chunk:
+        for kind, fn in stages:
+            if kind == "map":
+                row = fn(row)
+            elif not fn(row):
+                break
+        else:
+            out.append(row)
+    return out
+
+class _Call:
+    """Pickles as the call `fn(*args)`: unpickling it runs the call."""
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn: Callable, args: tuple):
+        self.fn = fn
+        self.args = args
+
+    def __reduce__(self):
+        return self.fn, self.args
+
+# --- Driver side ---
+
+def pack(fn: Callable, *args: Any) -> bytes:
+    """A self-contained `fn(*args)` call; `pickle.loads` on it executes the call."""
+    return cloudpickle.dumps(_Call(fn, args))
+
+class InterpreterPool(Executor):
+    """
+    Subinterpreter pool (Python 3.14+): each worker has its own GIL, so
+    UDFs that are not free-threading safe still run on all cores, with a
+    cheaper start and hand-off than worker processes.
+    Work is submitted as `pack`ed calls that the worker runs with the
+    builtin `pickle.loads`, so workers only need the standard library
+    and cloudpickle.
+    """
+    def __init__(self, workers: int, initializer: Callable | None = None, initargs: tuple = ()):
+        if InterpreterPoolExecutor is None:
+            raise RuntimeError(
+                "Subinterpreter pools need Python 3.14+ (concurrent.futures.InterpreterPoolExecutor); "
+                f"this is Python {sys.version_info.major}.{sys.version_info.minor}"
+            )
+        if cloudpickle is None:
+            raise ImportError("cloudpickle is required to ship work to subinterpreters. Please pip install cloudpickle.")
+        if initializer is not None:
+            self._pool = InterpreterPoolExecutor(workers, initializer=pickle.loads,
+                                                 initargs=(pack(initializer, *initargs),))
+        else:
+            self._pool = InterpreterPoolExecutor(workers)
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        if kwargs:
+            raise TypeError("InterpreterPool.submit takes positional arguments only")
+        return self._pool.submit(pickle.loads, pack(fn, *args))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+if cloudpickle is not None:
+    cloudpickle.register_pickle_by_value(sys.modules[__name__])
@@ -0,0 +1,129 @@
+import functools
+import itertools
+import multiprocessing
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any
+from .serializer import FunctionSerializer
+from ...system.logging import get_logger
+
+logger = get_logger(__name__)
+
+def free_threaded() -> bool:
+    """True when running on a free-threaded (No-GIL) build with the GIL actually off."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+# --- Chunk kernels (module level so process workers can import them) ---
+
+@functools.lru_cache(maxsize=32)
+def _load(payload: bytes) -> Callable:
+    return FunctionSerializer.deserialize(payload)
+
+def _resolve(fn: Callable | bytes) -> Callable:
+    return _load(fn) if isinstance(fn, bytes) else fn
+
+def _map_chunk(fn: Callable | bytes, chunk: tuple) -> list:
+    fn = _resolve(fn)
+    return [fn(item) for item in chunk]
+
+def _filter_chunk(predicate: Callable | bytes, chunk: tuple) -> list:
+    predicate = _resolve(predicate)
+    return [item for item in chunk if predicate(item)]
+
+def _iterate_chunk(stages: Callable | bytes, chunk: tuple) -> list:
+    return list(_resolve(stages).iterate(chunk))
+
+KERNELS = {"map": _map_chunk, "filter": _filter_chunk, "fused": _iterate_chunk}
+
+class ParallelExecutor:
+    """
+    Runs per-row Python UDFs on all cores, chunk by chunk.
+    Free-threaded builds use a thread pool; GIL builds fall back to a
+    process pool, shipping UDFs cloudpickled (each worker decodes a function
+    once). `kind="thread"` or `"process"` forces one; `"interpreter"` uses
+    a subinterpreter pool (Python 3.14+, see `interpreters`).
+    At most `window` chunks are in flight, so memory stays bounded however
+    long the input is; results come back in input order unless
+    `ordered=False`, which yields each chunk as soon as it completes.
+    `initializer(*initargs)` runs once in every worker process.
+    """
+    def __init__(self, workers: int, chunk_size: int = 64, window: int | None = None, kind: str = "auto",
+                 initializer: Callable | None = None, initargs: tuple = ()):
+        self.workers = max(workers, 1)
+        self.chunk_size = chunk_size
+        self.window = window or 2 * self.workers
+        if kind == "auto":
+            kind = "thread" if free_threaded() else "process"
+        self.kind = kind
+        self.initializer = initializer
+        self.initargs = initargs
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "interpreter":
+                from .interpreters import InterpreterPool
+                self._executor = InterpreterPool(self.workers, self.initializer, self.initargs)
+            elif self.kind == "process":
+                # Forking a process that already runs threads can deadlock the child
+                context = multiprocessing.get_context("spawn" if sys.platform == "win32" else "forkserver")
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=context,
+                                                     initializer=self.initializer, initargs=self.initargs)
+            else:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="eidos-map")
+        return self._executor
+
+    def _payload(self, fn: Callable) -> tuple[Executor | None, Callable | bytes]:
+        if self.kind != "process":
+            return self.executor, fn
+        try:
+            payload = FunctionSerializer.serialize(fn)
+        except Exception as e:
+            # Unpicklable closures (locks, open files...) stay in this process
+            logger.debug("UDF cannot be shipped to worker processes, running inline", error=str(e))
+            return None, fn
+        return self.executor, payload
+
+    def run(self, kind: str, fn: Callable, items: Iterable[Any], ordered: bool = True) -> Iterator[Any]:
+        """Applies a "map", "filter" or "fused" kernel over `items`."""
+        kernel = KERNELS[kind]
+        executor, payload = self._payload(fn)
+        if executor is None:
+            chunks = itertools.batched(items, self.chunk_size)
+            return itertools.chain.from_iterable(kernel(payload, chunk) for chunk in chunks)
+        return self.stream(kernel, payload, items, ordered)
+
+    def stream(self, kernel: Callable, payload: Any, items: Iterable[Any], ordered: bool = True) -> Iterator[Any]:
+        """Runs `kernel(payload, chunk) -> list` over chunks of `items` on the pool."""
+        executor = self.executor
+        chunks = itertools.batched(items, self.chunk_size)
+        pending: deque = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(kernel, payload, chunk))
+                while len(pending) >= self.window:
+                    yield from self._next_done(pending, ordered)
+            while pending:
+                yield from self._next_done(pending, ordered)
+        finally:
+            # Consumer stopped early (or a UDF failed): drop queued work
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _next_done(pending: deque, ordered: bool) -> list:
+        if ordered:
+            return pending.popleft().result()
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = next(iter(done))
+        pending.remove(future)
+        return future.result()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
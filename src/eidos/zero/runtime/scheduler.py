@@ -0,0 +1,125 @@
+import itertools
+import queue
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+# Queue items are tagged chunks: (kind, payload)
+_CHUNK, _ERROR, _DONE = range(3)
+# How long a blocked producer waits before re-checking for cancellation
+_POLL_SECONDS = 0.05
+
+class BranchScheduler:
+    """
+    Runs independent branches of a Python-lane plan on a thread pool.
+    Each scheduled branch is driven by a worker thread that pushes chunks of
+    rows into a bounded queue; the consumer reads them back in order. A
+    branch only gets a thread when one is idle, otherwise it stays a plain
+    lazy iterator, so nested ensembles can never starve the pool.
+    On free-threaded builds CPU-bound branches run truly in parallel.
+    """
+    def __init__(self, workers: int, queue_size: int = 8, chunk_size: int = 1024):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.chunk_size = chunk_size
+        self._slots = threading.BoundedSemaphore(workers) if workers > 0 else None
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="eidos-branch")
+            return self._executor
+
+    def spawn(self, branch: Iterable[Any]) -> Iterator[Any]:
+        """
+        Returns the output of `branch`, produced in the background (if a worker
+        is free). Nothing starts until the first row is requested, so plans
+        that are compiled but never run hold no thread and read no rows.
+        """
+        if self._slots is None or not self._slots.acquire(blocking=False):
+            yield from branch
+            return
+        channel: queue.Queue = queue.Queue(self.queue_size)
+        cancelled = threading.Event()
+        try:
+            self._pool().submit(self._produce, branch, channel, cancelled)
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            yield from self._consume(channel)
+        finally:
+            # Early exit (zip, choice), close() or garbage collection: stop the producer
+            cancelled.set()
+
+    def _produce(self, branch: Iterable[Any], channel: queue.Queue, cancelled: threading.Event) -> None:
+        def put(item: tuple[int, Any]) -> bool:
+            while not cancelled.is_set():
+                try:
+                    channel.put(item, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        iterator = iter(branch)
+        try:
+            for chunk in itertools.batched(iterator, self.chunk_size):
+                if not put((_CHUNK, chunk)):
+                    break
+            else:
+                put((_DONE, None))
+        except BaseException as e:
+            put((_ERROR, e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            self._slots.release()
+
+    @staticmethod
+    def _consume(channel: queue.Queue) -> Iterator[Any]:
+        while True:
+            kind, payload = channel.get()
+            if kind == _CHUNK:
+                yield from payload
+            elif kind == _ERROR:
+                raise payload
+            else:
+                return
+
+def safe_tee(iterable: Iterable[Any], n: int) -> list[Iterator[Any]]:
+    """
+    Like `itertools.tee`, but its copies may be consumed from different threads.
+    Rows pulled from the shared source are buffered per copy under one lock.
+    """
+    source = iter(iterable)
+    lock = threading.Lock()
+    buffers = [deque() for _ in range(n)]
+    exhausted = False
+
+    def copy(index: int) -> Iterator[Any]:
+        nonlocal exhausted
+        own = buffers[index]
+        while True:
+            with lock:
+                if own:
+                    item = own.popleft()
+                elif exhausted:
+                    return
+                else:
+                    try:
+                        item = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        return
+                    for i, buffer in enumerate(buffers):
+                        if i != index:
+                            buffer.append(item)
+            yield item
+
+    return [copy(i) for i in range(n)]
@@ -1,5 +1,13 @@
 from typing import Any, Callable
+from pathlib import Path
+import hashlib
+import io
 import pickle
+import types
+
+import pyarrow as pa
+
+from ..symbolism.ast import Graph, Node, OpType, intern_config
 
 try:
     import cloudpickle
@@ -21,3 +29,143 @@ class FunctionSerializer:
         if cloudpickle:
             return cloudpickle.loads(data)
         return pickle.loads(data)
+
+class _ConfigPickler(pickle.Pickler):
+    """
+    Pickles node metadata, replacing every Python function with the hash of
+    its serialized bytes. Each function object is serialized once per plan.
+    """
+    def __init__(self, file, udfs: dict[str, bytes], hashes: dict[int, str]):
+        super().__init__(file, protocol=5)
+        self.udfs = udfs
+        self._hashes = hashes
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if not isinstance(obj, types.FunctionType):
+            return None
+        key = self._hashes.get(id(obj))
+        if key is None:
+            payload = FunctionSerializer.serialize(obj)
+            # Hash the bytes themselves: only identical payloads may be merged
+            key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+            self._hashes[id(obj)] = key
+            self.udfs.setdefault(key, payload)
+        return key
+
+class _ConfigUnpickler(pickle.Unpickler):
+    def __init__(self, file, udfs: dict[str, bytes], decoded: dict[str, Callable]):
+        super().__init__(file)
+        self.udfs = udfs
+        self.decoded = decoded
+
+    def persistent_load(self, key: str) -> Callable:
+        fn = self.decoded.get(key)
+        if fn is None:
+            try:
+                payload = self.udfs[key]
+            except KeyError:
+                raise pickle.UnpicklingError(f"Plan references unknown UDF {key}") from None
+            fn = self.decoded[key] = FunctionSerializer.deserialize(payload)
+        return fn
+
+class PlanSerializer:
+    """
+    Binary plan format: one Arrow IPC stream holding a node table and a UDF table.
+    Each function is encoded once (FunctionSerializer) and referenced from
+    node configs by the hash of its encoded bytes, so a plan can be shipped
+    to remote workers or cached on disk and rebuilt without re-running the
+    user script.
+    """
+    MAGIC = b"EIDOSPLAN"
+    VERSION = 1
+
+    NODE_SCHEMA = pa.schema([
+        ("id", pa.string()),
+        ("op_type", pa.string()),
+        ("parents", pa.list_(pa.string())),
+        ("meta", pa.binary()),   # pickled (config, schema_in, schema_out)
+    ])
+    UDF_SCHEMA = pa.schema([
+        ("hash", pa.string()),
+        ("payload", pa.binary()),
+    ])
+
+    @classmethod
+    def dumps(cls, graph: Graph) -> bytes:
+        udfs: dict[str, bytes] = {}
+        # Function identity -> key; the graph keeps every function alive meanwhile
+        hashes: dict[int, str] = {}
+        ids, ops, parents, metas = [], [], [], []
+        for node_id in graph.topological_order():
+            node = graph.nodes[node_id]
+            buf = io.BytesIO()
+            _ConfigPickler(buf, udfs, hashes).dump((dict(node.config), node.schema_in, node.schema_out))
+            ids.append(node.id)
+            ops.append(node.op_type.value)
+            parents.append(list(node.parents))
+            metas.append(buf.getvalue())
+
+        nodes = pa.record_batch([ids, ops, parents, metas], schema=cls.NODE_SCHEMA)
+        functions = pa.record_batch([list(udfs), list(udfs.values())], schema=cls.UDF_SCHEMA)
+
+        sink = io.BytesIO()
+        sink.write(cls.MAGIC)
+        sink.write(cls.VERSION.to_bytes(2, "little"))
+        graph_id = graph.id.encode("utf-8")
+        sink.write(len(graph_id).to_bytes(4, "little"))
+        sink.write(graph_id)
+        for batch in (functions, nodes):
+            with pa.ipc.new_stream(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+        return sink.getvalue()
+
+    @classmethod
+    def loads(cls, data: bytes) -> Graph:
+        view = memoryview(data)
+        if bytes(view[:len(cls.MAGIC)]) != cls.MAGIC:
+            raise ValueError("Not an Eidos plan")
+        offset = len(cls.MAGIC)
+        version = int.from_bytes(view[offset:offset + 2], "little")
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported plan format version {version}")
+        offset += 2
+        id_len = int.from_bytes(view[offset:offset + 4], "little")
+        offset += 4
+        graph_id = bytes(view[offset:offset + id_len]).decode("utf-8")
+        offset += id_len
+
+        source = pa.BufferReader(pa.py_buffer(view[offset:]))
+        functions = pa.ipc.open_stream(source).read_all()
+        nodes = pa.ipc.open_stream(source).read_all()
+
+        udfs = dict(zip(functions["hash"].to_pylist(), functions["payload"].to_pylist()))
+        decoded: dict[str, Callable] = {}
+
+        graph = Graph(id=graph_id)
+        for node_id, op, parents, meta in zip(
+            nodes["id"].to_pylist(),
+            nodes["op_type"].to_pylist(),
+            nodes["parents"].to_pylist(),
+            nodes["meta"].to_pylist()
+        ):
+            config, schema_in, schema_out = _ConfigUnpickler(io.BytesIO(meta), udfs, decoded).load()
+            shared, _ = intern_config(config)
+            graph.add_node(Node(
+                id=node_id,
+                op_type=OpType(op),
+                config=shared,
+                parents=tuple(parents),
+                schema_in=schema_in,
+                schema_out=schema_out
+            ))
+        return graph
+
+    @classmethod
+    def save(cls, graph: Graph, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_bytes(cls.dumps(graph))
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> Graph:
+        return cls.loads(Path(path).read_bytes())
@@ -0,0 +1,32 @@
+import functools
+import hashlib
+import os
+import tempfile
+import threading
+
+_published: set[str] = set()
+_lock = threading.Lock()
+
+@functools.cache
+def _directory() -> tempfile.TemporaryDirectory:
+    # Removed when the driver exits
+    return tempfile.TemporaryDirectory(prefix="eidos-plans-")
+
+def publish(blob: bytes) -> str:
+    """
+    Writes `blob` once, under its content hash, and returns the file path.
+    Pool workers are sent only the path with each chunk; they read and decode
+    the file on first use and keep the result, so a plan segment (with its
+    UDFs) crosses to each worker once instead of travelling with every chunk.
+    """
+    name = hashlib.blake2b(blob, digest_size=16).hexdigest()
+    path = os.path.join(_directory().name, name)
+    with _lock:
+        if name not in _published:
+            partial = f"{path}.part"
+            with open(partial, "wb") as f:
+                f.write(blob)
+            # Workers never see a half-written file
+            os.replace(partial, path)
+            _published.add(name)
+    return path
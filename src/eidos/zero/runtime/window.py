@@ -0,0 +1,308 @@
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+_DURATION = re.compile(r"(\d+)(ms|s|m|h|d|w)")
+_UNITS = {"ms": "milliseconds", "s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+def parse_duration(spec: Any) -> Any:
+    """
+    Window sizes: numbers are used as-is (row counts, or the units of a
+    numeric time column); strings such as "90s" or "1h30m" become timedeltas.
+    """
+    if not isinstance(spec, str):
+        return spec
+    parts = _DURATION.findall(spec)
+    if not parts or "".join(n + u for n, u in parts) != spec:
+        raise ValueError(f"Invalid window duration {spec!r} (use e.g. '30s', '5m', '1h30m')")
+    return sum((timedelta(**{_UNITS[unit]: int(n)}) for n, unit in parts), timedelta())
+
+def _align(key: Any, slide: Any) -> Any:
+    """Start of the slide-aligned window holding `key` (datetimes align to the Unix epoch)."""
+    if isinstance(key, datetime):
+        epoch = datetime(1970, 1, 1, tzinfo=key.tzinfo)
+        return epoch + (key - epoch) // slide * slide
+    return key // slide * slide
+
+class RingBuffer:
+    """
+    Growable circular buffer addressed by absolute position.
+    Push and pop are O(1) and never shift elements; capacity doubles when
+    full. `pushed` counts every item ever appended, so positions stay
+    stable while the buffer slides.
+    """
+    __slots__ = ("_items", "_head", "_size", "pushed")
+
+    def __init__(self, capacity: int = 16):
+        self._items: list[Any] = [None] * max(capacity, 1)
+        self._head = 0
+        self._size = 0
+        self.pushed = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def first_position(self) -> int:
+        return self.pushed - self._size
+
+    def push(self, item: Any) -> None:
+        if self._size == len(self._items):
+            self._items = [self[i] for i in range(self._size)] + [None] * self._size
+            self._head = 0
+        self._items[(self._head + self._size) % len(self._items)] = item
+        self._size += 1
+        self.pushed += 1
+
+    def popleft(self) -> Any:
+        item = self._items[self._head]
+        self._items[self._head] = None
+        self._head = (self._head + 1) % len(self._items)
+        self._size -= 1
+        return item
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._size
+        return self._items[(self._head + index) % len(self._items)]
+
+class WindowView(Sequence):
+    """
+    A read-only, zero-copy view of one window's rows inside the ring buffer
+    (`windows(..., views=True)`). It stays readable until one of its rows is
+    evicted by the window sliding on; use `list(view)` to keep the rows
+    beyond that.
+    """
+    __slots__ = ("_buffer", "_start", "_length")
+
+    def __init__(self, buffer: RingBuffer, start: int, length: int):
+        self._buffer = buffer
+        self._start = start
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("window index out of range")
+        offset = self._start - self._buffer.first_position
+        if offset < 0:
+            raise RuntimeError("Window view is stale: its rows were evicted (copy it with list(view))")
+        return self._buffer[offset + index]
+
+    def __repr__(self) -> str:
+        return f"WindowView({list(self)!r})"
+
+# --- Incremental aggregates ---
+# Each one sees rows enter at the back and leave at the front of the window.
+
+class _Sum:
+    __slots__ = ("total", "count")
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+
+    def add(self, position: int, value: Any) -> None:
+        if value is not None:
+            self.total += value
+            self.count += 1
+
+    def remove(self, position: int, value: Any) -> None:
+        if value is not None:
+            self.total -= value
+            self.count -= 1
+            if not self.count:
+                self.total = 0  # drop accumulated float error
+
+    def result(self, rows: RingBuffer, column: str) -> Any:
+        return self.total
+
+class _Mean(_Sum):
+    __slots__ = ()
+
+    def result(self, rows, column):
+        return self.total / self.count if self.count else None
+
+class _Count(_Sum):
+    __slots__ = ()
+
+    def result(self, rows, column):
+        return self.count
+
+class _Extreme:
+    """Sliding min/max over a monotonic deque of (position, value)."""
+    __slots__ = ("largest", "candidates")
+
+    def __init__(self, largest: bool):
+        self.largest = largest
+        self.candidates: deque = deque()
+
+    def add(self, position: int, value: Any) -> None:
+        if value is None:
+            return
+        while self.candidates and (
+            self.candidates[-1][1] <= value if self.largest else self.candidates[-1][1] >= value
+        ):
+            self.candidates.pop()
+        self.candidates.append((position, value))
+
+    def remove(self, position: int, value: Any) -> None:
+        if self.candidates and self.candidates[0][0] == position:
+            self.candidates.popleft()
+
+    def result(self, rows, column):
+        return self.candidates[0][1] if self.candidates else None
+
+class _Edge:
+    """First/last value: read straight from the ring buffer."""
+    __slots__ = ("last",)
+
+    def __init__(self, last: bool):
+        self.last = last
+
+    def add(self, position, value): pass
+    def remove(self, position, value): pass
+
+    def result(self, rows, column):
+        return rows[-1 if self.last else 0].get(column) if len(rows) else None
+
+AGGREGATES = {
+    "sum": _Sum,
+    "mean": _Mean,
+    "count": _Count,
+    "min": lambda: _Extreme(largest=False),
+    "max": lambda: _Extreme(largest=True),
+    "first": lambda: _Edge(last=False),
+    "last": lambda: _Edge(last=True),
+}
+
+class _Aggregates:
+    """The `agg` spec ({name: (column, function)}) maintained over a ring buffer."""
+    __slots__ = ("spec", "states")
+
+    def __init__(self, spec: dict[str, tuple[str, str]]):
+        self.spec = spec
+        for name, (_, fn) in spec.items():
+            if fn not in AGGREGATES:
+                raise ValueError(f"Unknown window aggregate {fn!r} for {name!r} (one of {', '.join(AGGREGATES)})")
+        self.states = {name: AGGREGATES[fn]() for name, (_, fn) in spec.items()}
+
+    def add(self, position: int, row: dict) -> None:
+        for name, state in self.states.items():
+            state.add(position, row.get(self.spec[name][0]))
+
+    def remove(self, position: int, row: dict) -> None:
+        for name, state in self.states.items():
+            state.remove(position, row.get(self.spec[name][0]))
+
+    def result(self, rows: RingBuffer) -> dict[str, Any]:
+        return {name: state.result(rows, self.spec[name][0]) for name, state in self.states.items()}
+
+def windows(
+    rows: Iterable[Any],
+    size: Any,
+    slide: Any = None,
+    on: str | None = None,
+    agg: dict[str, tuple[str, str]] | None = None,
+    views: bool = False,
+) -> Iterator[Any]:
+    """
+    Windows over a row stream, in order of window end.
+    * Count windows (`on` is None) cover `size` consecutive rows and start
+      every `slide` rows (1 = sliding, `size` = tumbling, else hopping); only
+      complete windows are emitted.
+    * Event-time windows (`on` names a sorted time column) cover
+      `[start, start + size)` with starts aligned to multiples of `slide`,
+      skip empty windows and close once a later row arrives. Without `slide`
+      every row gets the trailing window `(t - size, t]`.
+    With `agg`, each window yields one record of incremental aggregates
+    (plus the window start, or the row time, under `on`); otherwise it yields
+    a list of the window's rows. `views=True` yields zero-copy `WindowView`s
+    instead, for consumers that finish with each window before pulling the
+    next one.
+    """
+    size = parse_duration(size)
+    slide = parse_duration(slide) if slide is not None else (1 if on is None else None)
+    buffer = RingBuffer()
+    keys: deque = deque()  # window key (time or row index) per buffered row
+    aggregates = _Aggregates(agg) if agg else None
+
+    def push(key: Any, row: Any) -> None:
+        if aggregates is not None:
+            aggregates.add(buffer.pushed, row)
+        buffer.push(row)
+        keys.append(key)
+
+    def evict(before: Any, inclusive: bool = False) -> None:
+        while keys and (keys[0] <= before if inclusive else keys[0] < before):
+            position = buffer.first_position
+            row = buffer.popleft()
+            keys.popleft()
+            if aggregates is not None:
+                aggregates.remove(position, row)
+
+    def emit(label: Any, length: int) -> Any:
+        if aggregates is None:
+            if views:
+                return WindowView(buffer, buffer.first_position, length)
+            return [buffer[i] for i in range(length)]
+        if length == len(buffer):
+            values = aggregates.result(buffer)
+        else:
+            # Final partial flush: rebuild from the rows inside the window
+            partial = RingBuffer(length)
+            fresh = _Aggregates(agg)
+            for i in range(length):
+                fresh.add(i, buffer[i])
+                partial.push(buffer[i])
+            values = fresh.result(partial)
+        return values if on is None else {on: label, **values}
+
+    if slide is None:
+        # Trailing event-time window per row: (t - size, t]
+        for row in rows:
+            t = row[on]
+            push(t, row)
+            evict(t - size, inclusive=True)
+            yield emit(t, len(buffer))
+        return
+
+    start = None
+    for index, row in enumerate(rows):
+        key = index if on is None else row[on]
+        if start is None:
+            start = 0 if on is None else _align(key, slide)
+        if on is not None:
+            # Close every window that ends at or before this row
+            while start + size <= key:
+                if keys:
+                    yield emit(start, len(buffer))
+                start += slide
+                evict(start)
+                if not keys and start + size <= key:
+                    # Skip empty windows: jump to the first one containing `key`
+                    start = max(start, _align(key - size, slide) + slide)
+        if key < start:
+            continue  # falls between two windows
+        push(key, row)
+        if on is None and key + 1 == start + size:
+            yield emit(start, len(buffer))
+            start += slide
+            evict(start)
+
+    if on is not None:
+        # End of stream: flush the windows that still hold rows
+        while keys:
+            inside = sum(1 for k in keys if k < start + size)
+            if inside:
+                yield emit(start, inside)
+            start += slide
+            evict(start)
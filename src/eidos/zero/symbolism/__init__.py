@@ -1,10 +1,16 @@
-from .ast import Node, Graph, OpType
-from .dsl import SymbolicStream, Operator, Source, Map, Filter, Sink
+from .ast import Node, Graph, OpType, FrozenConfig
+from .dsl import SymbolicStream, Operator, Source, Map, Filter, WithColumn, Select, Window, Sink
+from .expr import Expr, col, lit, when
 from .types import Monad, Context, Effect
+from .fingerprint import fingerprint, structural_id
+from .builder import GraphBuilder
+from .params import Param
 
 __all__ = [
-    "Node", "Graph", "OpType",
+    "Node", "Graph", "OpType", "FrozenConfig", "GraphBuilder",
     "SymbolicStream", "Operator",
-    "Source", "Map", "Filter", "Sink",
-    "Monad", "Context", "Effect"
+    "Source", "Map", "Filter", "WithColumn", "Select", "Window", "Sink",
+    "Expr", "col", "lit", "when",
+    "Monad", "Context", "Effect",
+    "fingerprint", "structural_id", "Param"
 ]
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
+import weakref
 from typing import Any
+from .fingerprint import fingerprint
+from .params import Param
 
 # PEP 695 Type Aliases (Python 3.12+)
 type NodeID = str
@@ -21,63 +24,254 @@ class OpType(Enum):
     ENSEMBLE = "Ensemble"   # &
     MERGE = "Merge"         # +
     CUSTOM = "Custom"
+    FUSED = "Fused"         # Map/Filter run collapsed by the optimizer
+    WITH_COLUMN = "WithColumn"
+    PROJECT = "Project"
 
-@dataclass(frozen=True)
+class FrozenConfig(dict):
+    """
+    Immutable node configuration.
+    Nodes with identical configs share one instance (see `intern_config`),
+    which keeps very large parameter sweeps from allocating a dict per node.
+    """
+    __slots__ = ("__weakref__",)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Node config is immutable; build a new node instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenConfig, (dict(self),))
+
+_CONFIG_POOL: weakref.WeakValueDictionary[tuple, FrozenConfig] = weakref.WeakValueDictionary()
+
+def _identity_ids(value: Any) -> tuple[int, ...]:
+    # Callables and bind-time parameters hash by content but must not be swapped
+    match value:
+        case dict():
+            return tuple(i for v in value.values() for i in _identity_ids(v))
+        case list() | tuple():
+            return tuple(i for v in value for i in _identity_ids(v))
+        case Param():
+            return (id(value),)
+        case _ if callable(value):
+            return (id(value),)
+    return ()
+
+def intern_config(config: dict[str, Any]) -> tuple[FrozenConfig, str]:
+    """
+    Returns the shared FrozenConfig for `config` and its content hash.
+    Configs are only shared when they hold the very same callables and
+    parameters: a content-equal but distinct UDF (or a `Param` with another
+    value) keeps its own config, so a node never runs a function or reads a
+    value the user did not pass. The pooled config keeps those objects
+    alive, so their ids cannot be reused while it is pooled.
+    """
+    config_hash = fingerprint(config)
+    key = (config_hash, _identity_ids(config))
+    shared = _CONFIG_POOL.get(key)
+    if shared is None:
+        shared = config if isinstance(config, FrozenConfig) else FrozenConfig(config)
+        _CONFIG_POOL[key] = shared
+    return shared, config_hash
+
+@dataclass(frozen=True, slots=True)
 class Node:
     """
     A node in the logical computation graph (AST).
-    Immutable and serializable.
+    Immutable and serializable. Slotted, with tuple parents and a frozen
+    (shareable) config to keep per-node memory small.
     """
     id: NodeID
     op_type: OpType
-    config: dict[str, Any] = field(default_factory=dict)
-    parents: list[NodeID] = field(default_factory=list)
+    config: dict[str, Any] = field(default_factory=FrozenConfig)
+    parents: tuple[NodeID, ...] = ()
     
     # Metadata for the compiler
     schema_in: Any | None = None
     schema_out: Any | None = None
+
+    def __post_init__(self):
+        if not isinstance(self.parents, tuple):
+            object.__setattr__(self, "parents", tuple(self.parents))
+        if not isinstance(self.config, FrozenConfig):
+            object.__setattr__(self, "config", FrozenConfig(self.config))
     
     @property
     def short_id(self) -> str:
         return self.id[:8]
 
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.op_type.value,
+            "config": str(self.config), # Simplified for JSON
+            "parents": list(self.parents)
+        }
+
 @dataclass
 class Graph:
     """
     The Logical Plan (DAG).
     Contains all nodes and their relationships.
+    Parent/child adjacency, sources, sinks and leaves are indexed on insertion;
+    the topological order and fingerprint are cached until the next mutation.
+    Mutate through `add_node` so the index stays consistent.
     """
     id: GraphID = field(default_factory=lambda: str(uuid.uuid4()))
     nodes: dict[NodeID, Node] = field(default_factory=dict)
     edges: list[Edge] = field(default_factory=list)
-    
+
+    _children: dict[NodeID, list[NodeID]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _edge_set: set[Edge] = field(default_factory=set, init=False, repr=False, compare=False)
+    _sources: dict[NodeID, None] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _sinks: dict[NodeID, None] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _leaves: dict[NodeID, None] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _topo: list[NodeID] | None = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Union-find link set when this graph is absorbed into a larger arena
+    _forward: "Graph | None" = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Index nodes passed to the constructor
+        initial_nodes, initial_edges = self.nodes, self.edges
+        self.nodes, self.edges = {}, []
+        for node in initial_nodes.values():
+            self.add_node(node)
+        for edge in initial_edges:
+            if edge not in self._edge_set:
+                self._edge_set.add(edge)
+                self.edges.append(edge)
+
     def add_node(self, node: Node):
         if node.id in self.nodes:
             return # Idempotent
         self.nodes[node.id] = node
+        self._topo = None
+        self._fingerprint = None
+
+        if not node.parents:
+            self._sources[node.id] = None
+        if node.op_type == OpType.SINK:
+            self._sinks[node.id] = None
+        if not self._children.get(node.id):
+            self._leaves[node.id] = None
+
         for p in node.parents:
-            self.edges.append((p, node.id))
+            edge = (p, node.id)
+            if edge in self._edge_set:
+                continue
+            self._edge_set.add(edge)
+            self.edges.append(edge)
+            self._children.setdefault(p, []).append(node.id)
+            self._leaves.pop(p, None)
+
+    def resolve(self) -> "Graph":
+        """Returns the arena this graph has been merged into (itself if never merged)."""
+        root = self
+        while root._forward is not None:
+            root = root._forward
+        # Path compression
+        current = self
+        while current._forward is not None and current._forward is not root:
+            current._forward, current = root, current._forward
+        return root
+
+    def union(self, other: "Graph") -> "Graph":
+        """
+        Merges two graph arenas with union-by-size.
+        Only the smaller arena's nodes are re-inserted, so folding N streams
+        together costs amortized O(1) per node instead of O(N) per merge.
+        The absorbed graph keeps its own contents but forwards to the result.
+        The larger arena is extended in place, whichever side it is on: both
+        operands' streams see the merged graph (see `SymbolicStream.graph`).
+        """
+        a, b = self.resolve(), other.resolve()
+        if a is b:
+            return a
+        if len(a.nodes) < len(b.nodes):
+            a, b = b, a
+        for node in b.nodes.values():
+            a.add_node(node)
+        b._forward = a
+        return a
+
+    def parents_of(self, node_id: NodeID) -> list[NodeID]:
+        return self.nodes[node_id].parents
+
+    def children_of(self, node_id: NodeID) -> list[NodeID]:
+        return self._children.get(node_id, [])
             
     @property
     def sources(self) -> list[Node]:
-        return [n for n in self.nodes.values() if not n.parents]
+        return [self.nodes[nid] for nid in self._sources]
         
     @property
     def sinks(self) -> list[Node]:
-        return [n for n in self.nodes.values() if n.op_type == OpType.SINK]
+        return [self.nodes[nid] for nid in self._sinks]
+
+    @property
+    def leaves(self) -> list[Node]:
+        """Nodes without children (the implicit outputs of a sink-less graph)."""
+        return [self.nodes[nid] for nid in self._leaves]
+
+    def topological_order(self, targets: list[NodeID] | None = None) -> list[NodeID]:
+        """
+        Node IDs with parents before children (iterative Kahn's algorithm).
+        With `targets`, only their ancestors (inclusive) are returned.
+        """
+        if self._topo is None:
+            indegree = {nid: 0 for nid in self.nodes}
+            for node in self.nodes.values():
+                indegree[node.id] = len({p for p in node.parents if p in self.nodes})
+            ready = [nid for nid, deg in indegree.items() if deg == 0]
+            ready.reverse()
+            order = []
+            while ready:
+                nid = ready.pop()
+                order.append(nid)
+                for cid in self._children.get(nid, []):
+                    indegree[cid] -= 1
+                    if indegree[cid] == 0:
+                        ready.append(cid)
+            if len(order) != len(self.nodes):
+                raise ValueError("Graph contains a cycle")
+            self._topo = order
+
+        if targets is None:
+            return list(self._topo)
+        wanted = self.ancestors(targets)
+        return [nid for nid in self._topo if nid in wanted]
+
+    def ancestors(self, targets: list[NodeID]) -> set[NodeID]:
+        """All nodes reachable upstream from `targets`, including the targets."""
+        seen: set[NodeID] = set()
+        stack = list(targets)
+        while stack:
+            nid = stack.pop()
+            if nid in seen:
+                continue
+            seen.add(nid)
+            stack.extend(self.nodes[nid].parents)
+        return seen
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Structural hash of the whole plan.
+        Node IDs are content-addressed, so the set of IDs identifies the graph
+        independently of `Graph.id` or construction order.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint(sorted(self.nodes))
+        return self._fingerprint
         
     def to_json(self) -> dict[str, Any]:
         """Serialize graph for visualization or transport."""
         return {
             "id": self.id,
-            "nodes": [
-                {
-                    "id": n.id,
-                    "type": n.op_type.value,
-                    "config": str(n.config), # Simplified for JSON
-                    "parents": n.parents
-                }
-                for n in self.nodes.values()
-            ],
+            "nodes": [n.to_json() for n in self.nodes.values()],
             "edges": self.edges
         }
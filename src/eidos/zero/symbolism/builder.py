@@ -0,0 +1,57 @@
+from collections.abc import Iterable
+from typing import Any
+from .ast import Graph, Node, NodeID, OpType, intern_config
+from .dsl import Operator, ChainOperator
+from .fingerprint import structural_id
+
+class GraphBuilder:
+    """
+    Bulk construction API for very large programmatic plans.
+    Works on node IDs instead of SymbolicStream objects, so a parameter sweep
+    pays one interned config and one slotted Node per operator and the graph
+    index is built once in `build()`.
+
+        b = GraphBuilder()
+        src = b.source("parquet://prices.parquet")
+        for w in range(5, 500):
+            b.sink(b.apply(SMA(window=w), src), "memory")
+        graph = b.build()
+    """
+    def __init__(self):
+        self._nodes: dict[NodeID, Node] = {}
+
+    def add(
+        self,
+        op_type: OpType | str,
+        config: dict[str, Any] | None = None,
+        parents: Iterable[NodeID] = ()
+    ) -> NodeID:
+        op = op_type if isinstance(op_type, OpType) else OpType(op_type)
+        parents = tuple(parents)
+        missing = [p for p in parents if p not in self._nodes]
+        if missing:
+            raise KeyError(f"Unknown parent nodes: {missing}")
+
+        shared, config_hash = intern_config(config or {})
+        node_id = structural_id(op, shared, parents, config_hash)
+        if node_id not in self._nodes:
+            self._nodes[node_id] = Node(id=node_id, op_type=op, config=shared, parents=parents)
+        return node_id
+
+    def source(self, uri: str, **config: Any) -> NodeID:
+        return self.add(OpType.SOURCE, {"uri": uri, **config})
+
+    def apply(self, operator: Operator, *parents: NodeID) -> NodeID:
+        """Adds a node for a DSL operator (Map, SMA, ...) without binding a stream."""
+        if isinstance(operator, ChainOperator):
+            return self.apply(operator.right, self.apply(operator.left, *parents))
+        return self.add(operator.op_type, operator.config, parents)
+
+    def sink(self, parent: NodeID, uri: str) -> NodeID:
+        return self.add(OpType.SINK, {"uri": uri}, (parent,))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def build(self) -> Graph:
+        return Graph(nodes=dict(self._nodes))
@@ -1,19 +1,52 @@
 from collections.abc import Callable
 from typing import Self, Any
-import uuid
 from beartype import beartype
-from .ast import Node, Graph, OpType
+from .ast import Node, Graph, OpType, intern_config
+from .params import Param
+from .fingerprint import structural_id
+from .expr import Expr
+
+def _make_node(op_type: OpType, config: dict, parents: list[str]) -> Node:
+    """Creates a Node whose ID is derived from its structure, sharing identical configs."""
+    shared, config_hash = intern_config(config)
+    return Node(
+        id=structural_id(op_type, shared, parents, config_hash),
+        op_type=op_type,
+        config=shared,
+        parents=tuple(parents)
+    )
+
+def _parallel_config(parallel: bool, ordered: bool) -> dict:
+    if not parallel:
+        return {}
+    return {"parallel": True} if ordered else {"parallel": True, "ordered": False}
 
-@beartype
 class SymbolicStream:
     """
     Represents a stream of data in the logical graph.
     It holds the reference to the current tip of the graph (node).
+    Operands are validated explicitly rather than through @beartype, since
+    every `>>` goes through this class.
     """
+    __slots__ = ("node", "_graph")
+
     def __init__(self, node: Node, graph: Graph | None = None):
         self.node = node
-        self.graph = graph if graph is not None else Graph()
-        self.graph.add_node(node)
+        self._graph = graph if graph is not None else Graph()
+        self._graph.add_node(node)
+
+    @property
+    def graph(self) -> Graph:
+        """
+        The arena holding this stream, following any merges since creation.
+        Arenas are shared and mutable: `>>` adds nodes to the arena of its
+        input, and `+`, `&` and `|` merge both arenas in place (the larger one
+        absorbs the smaller), so a graph obtained earlier, from this stream or
+        any stream it was combined with, also shows the later nodes. Copy it
+        (`Graph(nodes=dict(g.nodes))`) to keep a snapshot.
+        """
+        self._graph = self._graph.resolve()
+        return self._graph
 
     def __rshift__(self, other: "Operator") -> "SymbolicStream":
         """
@@ -24,27 +57,29 @@ class SymbolicStream:
         return other.bind(self)
     
     def _merge_graph(self, other: "SymbolicStream"):
-        """Helper to merge two graphs."""
-        if self.graph is not other.graph:
-            for nid, n in other.graph.nodes.items():
-                self.graph.add_node(n)
-            for edge in other.graph.edges:
-                self.graph.edges.append(edge)
+        """Helper to merge two graphs (union of arenas, no copying of the larger one)."""
+        self.graph.union(other.graph)
 
     def __add__(self, other: "SymbolicStream") -> "SymbolicStream":
         """
         Interference Algebra: Stream + Stream -> Merged Stream
         """
+        return self.merge(other)
+
+    def merge(self, other: "SymbolicStream", on: str | None = None) -> "SymbolicStream":
+        """
+        Merges two streams (`+`). With `on`, both inputs must be sorted by
+        that column and the result interleaves them in order (time-ordered merge).
+        """
         if not isinstance(other, SymbolicStream):
             raise TypeError(f"Right operand must be a SymbolicStream, got {type(other)}")
         
         self._merge_graph(other)
         
         # Create Merge Node
-        merge_node = Node(
-            id=uuid.uuid4().hex,
+        merge_node = _make_node(
             op_type=OpType.MERGE,
-            config={},
+            config={"on": on} if on else {},
             parents=[self.node.id, other.node.id]
         )
         return SymbolicStream(merge_node, self.graph)
@@ -58,8 +93,7 @@ class SymbolicStream:
         
         self._merge_graph(other)
         
-        choice_node = Node(
-            id=uuid.uuid4().hex,
+        choice_node = _make_node(
             op_type=OpType.CHOICE,
             config={},
             parents=[self.node.id, other.node.id]
@@ -75,8 +109,7 @@ class SymbolicStream:
         
         self._merge_graph(other)
         
-        ensemble_node = Node(
-            id=uuid.uuid4().hex,
+        ensemble_node = _make_node(
             op_type=OpType.ENSEMBLE,
             config={},
             parents=[self.node.id, other.node.id]
@@ -106,14 +139,18 @@ class Operator:
         """
         Connects this operator to an upstream stream.
         """
-        new_node = Node(
-            id=uuid.uuid4().hex,
+        new_node = _make_node(
             op_type=self.op_type,
             config=self.config,
             parents=[upstream.node.id]
         )
         return SymbolicStream(new_node, upstream.graph)
 
+    def on(self, engine: str) -> Self:
+        """Pins this operator to a backend lane when compiled with target="hybrid"."""
+        self.config = {**self.config, "engine": engine}
+        return self
+
     def __rshift__(self, other: "Operator") -> "ChainOperator":
         """Composition: op1 >> op2"""
         return ChainOperator(self, other)
@@ -136,6 +173,11 @@ class ChainOperator(Operator):
         # stream >> (A >> B) is equivalent to (stream >> A) >> B
         return upstream >> self.left >> self.right
 
+    def on(self, engine: str) -> Self:
+        self.left.on(engine)
+        self.right.on(engine)
+        return self
+
 class ChoiceOperator(Operator):
     def __init__(self, left: Operator, right: Operator):
         self.left = left
@@ -170,36 +212,54 @@ class Source:
     Entry point for data sources.
     Now a class to support static factory methods.
     """
-    def __new__(cls, uri: str) -> SymbolicStream:
+    def __new__(cls, uri: str, engine: str | None = None) -> SymbolicStream:
         """
         Default constructor: Source("uri")
+        `engine` pins the scan to a backend lane in hybrid plans.
         """
-        node = Node(
-            id=uuid.uuid4().hex,
+        config = {"uri": uri}
+        if engine:
+            config["engine"] = engine
+        node = _make_node(
             op_type=OpType.SOURCE,
-            config={"uri": uri},
+            config=config,
             parents=[]
         )
         return SymbolicStream(node)
     
     @staticmethod
-    def from_payload(payload: Any) -> SymbolicStream:
+    def from_payload(payload: Any, name: str = "payload") -> SymbolicStream:
         """
         Creates a source from a direct payload (dict/list).
         Used by REST Port.
+        The payload is a bind-time parameter (see `Param`): it is not part of
+        the node ID, so requests with different bodies reuse one cached plan.
+        Payload sources in the same graph need distinct names.
         """
-        node = Node(
-            id=uuid.uuid4().hex,
+        node = _make_node(
             op_type=OpType.SOURCE,
-            config={"uri": "payload://", "payload": payload},
+            config={"uri": "payload://", "payload": Param(name, payload)},
             parents=[]
         )
         return SymbolicStream(node)
 
 @beartype
 class Map(Operator):
-    def __init__(self, fn: Callable):
-        super().__init__(config={"fn": fn, "fn_name": getattr(fn, "__name__", str(fn))})
+    """
+    Applies `fn` to every row.
+    With `batch=True`, `fn` receives a whole columnar batch in the backend's
+    native format (Polars DataFrame, Arrow Table on Ray, dict of NumPy arrays
+    on the Python lane) and returns a batch of the same kind.
+    With `parallel=True`, the Python lane spreads rows over all cores
+    (threads on free-threaded builds, processes otherwise), keeping input
+    order unless `ordered=False`.
+    """
+    def __init__(self, fn: Callable, batch: bool = False, parallel: bool = False, ordered: bool = True):
+        config = {"fn": fn, "fn_name": getattr(fn, "__name__", str(fn))}
+        if batch:
+            config["batch"] = True
+        config.update(_parallel_config(parallel, ordered))
+        super().__init__(config=config)
 
     @property
     def op_type(self) -> OpType:
@@ -207,13 +267,79 @@ class Map(Operator):
 
 @beartype
 class Filter(Operator):
-    def __init__(self, predicate: Callable):
-        super().__init__(config={"predicate": predicate, "fn_name": getattr(predicate, "__name__", str(predicate))})
+    """
+    Keeps the rows for which `predicate` is true.
+    With `batch=True`, `predicate` receives a columnar batch (see `Map`) and
+    returns a boolean mask of the same length. `parallel` and `ordered` work
+    as for `Map`.
+    """
+    def __init__(self, predicate: Callable, batch: bool = False, parallel: bool = False, ordered: bool = True):
+        config = {"predicate": predicate, "fn_name": getattr(predicate, "__name__", str(predicate))}
+        if batch:
+            config["batch"] = True
+        config.update(_parallel_config(parallel, ordered))
+        super().__init__(config=config)
 
     @property
     def op_type(self) -> OpType:
         return OpType.FILTER
 
+@beartype
+class WithColumn(Operator):
+    """
+    Adds (or replaces) a column computed from a column expression:
+    `WithColumn("range", col("high") - col("low"))`.
+    """
+    def __init__(self, name: str, expr: Expr):
+        super().__init__(config={"name": name, "expr": expr})
+
+    @property
+    def op_type(self) -> OpType:
+        return OpType.WITH_COLUMN
+
+@beartype
+class Select(Operator):
+    """Keeps only the named columns: `Select("close", "volume")`."""
+    def __init__(self, *columns: str):
+        super().__init__(config={"columns": list(columns)})
+
+    @property
+    def op_type(self) -> OpType:
+        return OpType.PROJECT
+
+@beartype
+class Window(Operator):
+    """
+    Groups rows into windows of `size` that start every `slide`.
+    Without `on`, sizes count rows: `Window(20)` slides by one row,
+    `Window(20, 20)` tumbles. With `on`, they are spans of that sorted time
+    column (`Window("5m", "1m", on="ts")`), and `Window("5m", on="ts")`
+    gives every row its trailing five minutes.
+    `agg` maps output names to `(column, function)` with function one of
+    sum, mean, count, min, max, first, last; without it each window is
+    emitted as a sequence of rows.
+    """
+    def __init__(
+        self,
+        size: int | float | str,
+        slide: int | float | str | None = None,
+        *,
+        on: str | None = None,
+        agg: dict[str, tuple[str, str]] | None = None,
+    ):
+        config = {"size": size}
+        if slide is not None:
+            config["slide"] = slide
+        if on:
+            config["on"] = on
+        if agg:
+            config["agg"] = dict(agg)
+        super().__init__(config=config)
+
+    @property
+    def op_type(self) -> OpType:
+        return OpType.WINDOW
+
 @beartype
 class Sink(Operator):
     def __init__(self, uri: str):
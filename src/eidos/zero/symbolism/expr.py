@@ -0,0 +1,301 @@
+import operator
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+# op -> (per-row function, SQL infix token)
+_BINARY: dict[str, tuple[Any, str]] = {
+    "add": (operator.add, "+"),
+    "sub": (operator.sub, "-"),
+    "mul": (operator.mul, "*"),
+    "truediv": (operator.truediv, "/"),
+    "eq": (operator.eq, "=="),
+    "ne": (operator.ne, "!="),
+    "lt": (operator.lt, "<"),
+    "le": (operator.le, "<="),
+    "gt": (operator.gt, ">"),
+    "ge": (operator.ge, ">="),
+    "and": (lambda a, b: bool(a) and bool(b), "and"),
+    "or": (lambda a, b: bool(a) or bool(b), "or"),
+}
+
+_ARROW_BINARY = {
+    "add": "add", "sub": "subtract", "mul": "multiply", "truediv": "divide",
+    "eq": "equal", "ne": "not_equal", "lt": "less", "le": "less_equal",
+    "gt": "greater", "ge": "greater_equal", "and": "and_kleene", "or": "or_kleene",
+}
+
+_NUMPY_BINARY = {
+    "add": "add", "sub": "subtract", "mul": "multiply", "truediv": "true_divide",
+    "eq": "equal", "ne": "not_equal", "lt": "less", "le": "less_equal",
+    "gt": "greater", "ge": "greater_equal", "and": "logical_and", "or": "logical_or",
+}
+
+def _wrap(value: Any) -> "Expr":
+    return value if isinstance(value, Expr) else Expr("lit", (value,))
+
+class Expr:
+    """
+    A column expression: `col("close") > 10`, `(col("high") - col("low")) / 2`.
+    Expressions are plain data (an op and its arguments), so every backend
+    lowers them natively: Polars expressions, Arrow compute kernels, NumPy
+    vectors or a SQL fragment. Calling one on a row dict evaluates it in Python,
+    which keeps an Expr a valid `Map`/`Filter` callable on any lane.
+    """
+    __slots__ = ("op", "args")
+
+    def __init__(self, op: str, args: tuple):
+        self.op = op
+        self.args = args
+
+    # --- Algebra ---
+    def _binary(self, op: str, other: Any, reflected: bool = False) -> "Expr":
+        other = _wrap(other)
+        return Expr(op, (other, self) if reflected else (self, other))
+
+    def __add__(self, other): return self._binary("add", other)
+    def __radd__(self, other): return self._binary("add", other, reflected=True)
+    def __sub__(self, other): return self._binary("sub", other)
+    def __rsub__(self, other): return self._binary("sub", other, reflected=True)
+    def __mul__(self, other): return self._binary("mul", other)
+    def __rmul__(self, other): return self._binary("mul", other, reflected=True)
+    def __truediv__(self, other): return self._binary("truediv", other)
+    def __rtruediv__(self, other): return self._binary("truediv", other, reflected=True)
+    def __eq__(self, other): return self._binary("eq", other)  # type: ignore[override]
+    def __ne__(self, other): return self._binary("ne", other)  # type: ignore[override]
+    def __lt__(self, other): return self._binary("lt", other)
+    def __le__(self, other): return self._binary("le", other)
+    def __gt__(self, other): return self._binary("gt", other)
+    def __ge__(self, other): return self._binary("ge", other)
+    def __and__(self, other): return self._binary("and", other)
+    def __rand__(self, other): return self._binary("and", other, reflected=True)
+    def __or__(self, other): return self._binary("or", other)
+    def __ror__(self, other): return self._binary("or", other, reflected=True)
+    def __invert__(self): return Expr("not", (self,))
+    def __neg__(self): return Expr("neg", (self,))
+    def __abs__(self): return Expr("abs", (self,))
+
+    __hash__ = None  # __eq__ builds an expression
+
+    def columns(self) -> set[str]:
+        """Column names referenced by this expression."""
+        if self.op == "col":
+            return {self.args[0]}
+        return set().union(*(a.columns() for a in self.args if isinstance(a, Expr)))
+
+    def __fingerprint__(self) -> tuple:
+        return (self.op, tuple(
+            a.__fingerprint__() if isinstance(a, Expr) else (type(a).__name__, repr(a))
+            for a in self.args
+        ))
+
+    def __repr__(self) -> str:
+        match self.op:
+            case "col":
+                return f'col("{self.args[0]}")'
+            case "lit":
+                return repr(self.args[0])
+            case "not":
+                return f"~{self.args[0]!r}"
+            case "neg":
+                return f"-{self.args[0]!r}"
+            case "abs":
+                return f"abs({self.args[0]!r})"
+            case "when":
+                cond, then, otherwise = self.args
+                return f"when({cond!r}).then({then!r}).otherwise({otherwise!r})"
+            case _:
+                left, right = self.args
+                return f"({left!r} {_BINARY[self.op][1]} {right!r})"
+
+    # --- Lowerings ---
+    def __call__(self, row: dict[str, Any]) -> Any:
+        """Evaluates the expression on a single row (the per-row fallback)."""
+        match self.op:
+            case "col":
+                return row[self.args[0]]
+            case "lit":
+                return self.args[0]
+            case "not":
+                return not self.args[0](row)
+            case "neg":
+                return -self.args[0](row)
+            case "abs":
+                return abs(self.args[0](row))
+            case "when":
+                cond, then, otherwise = self.args
+                return then(row) if cond(row) else otherwise(row)
+            case _:
+                left, right = self.args
+                return _BINARY[self.op][0](left(row), right(row))
+
+    def to_polars(self) -> "pl.Expr":
+        if pl is None:
+            raise ImportError("Polars is not installed. Please pip install polars.")
+        match self.op:
+            case "col":
+                return pl.col(self.args[0])
+            case "lit":
+                return pl.lit(self.args[0])
+            case "not":
+                return ~self.args[0].to_polars()
+            case "neg":
+                return -self.args[0].to_polars()
+            case "abs":
+                return self.args[0].to_polars().abs()
+            case "when":
+                cond, then, otherwise = self.args
+                return pl.when(cond.to_polars()).then(then.to_polars()).otherwise(otherwise.to_polars())
+            case "and":
+                return self.args[0].to_polars() & self.args[1].to_polars()
+            case "or":
+                return self.args[0].to_polars() | self.args[1].to_polars()
+            case _:
+                left, right = self.args
+                return _BINARY[self.op][0](left.to_polars(), right.to_polars())
+
+    def to_arrow(self, table: "pa.Table | pa.RecordBatch") -> Any:
+        """Evaluates the expression over an Arrow table with pyarrow.compute kernels."""
+        if pc is None:
+            raise ImportError("PyArrow is not installed. Please pip install pyarrow.")
+        result = self._arrow(table)
+        if isinstance(result, pa.Scalar):
+            return pa.array([result.as_py()] * table.num_rows, type=result.type)
+        return result
+
+    def _arrow(self, table) -> Any:
+        match self.op:
+            case "col":
+                return table[self.args[0]]
+            case "lit":
+                return pa.scalar(self.args[0])
+            case "not":
+                return pc.invert(self.args[0]._arrow(table))
+            case "neg":
+                return pc.negate(self.args[0]._arrow(table))
+            case "abs":
+                return pc.abs(self.args[0]._arrow(table))
+            case "when":
+                cond, then, otherwise = (a._arrow(table) for a in self.args)
+                return pc.if_else(cond, then, otherwise)
+            case "truediv":
+                # Arrow divides integers as integers; match Python/Polars semantics
+                left, right = (pc.cast(a._arrow(table), pa.float64()) for a in self.args)
+                return pc.divide(left, right)
+            case _:
+                left, right = (a._arrow(table) for a in self.args)
+                return pc.call_function(_ARROW_BINARY[self.op], [left, right])
+
+    def to_numpy(self, columns: dict[str, "np.ndarray"], length: int) -> "np.ndarray":
+        """Evaluates the expression over a dict of NumPy column vectors."""
+        if np is None:
+            raise ImportError("NumPy is not installed. Please pip install numpy.")
+        result = self._numpy(columns)
+        if np.ndim(result) == 0:
+            return np.full(length, result)
+        return result
+
+    def _numpy(self, columns: dict[str, "np.ndarray"]) -> Any:
+        match self.op:
+            case "col":
+                return columns[self.args[0]]
+            case "lit":
+                return self.args[0]
+            case "not":
+                return np.logical_not(self.args[0]._numpy(columns))
+            case "neg":
+                return np.negative(self.args[0]._numpy(columns))
+            case "abs":
+                return np.abs(self.args[0]._numpy(columns))
+            case "when":
+                cond, then, otherwise = (a._numpy(columns) for a in self.args)
+                return np.where(cond, then, otherwise)
+            case _:
+                left, right = (a._numpy(columns) for a in self.args)
+                return getattr(np, _NUMPY_BINARY[self.op])(left, right)
+
+    def to_sql(self) -> str:
+        """Renders the expression as a DolphinDB SQL fragment."""
+        match self.op:
+            case "col":
+                return self.args[0]
+            case "lit":
+                return _sql_literal(self.args[0])
+            case "not":
+                return f"not({self.args[0].to_sql()})"
+            case "neg":
+                return f"(-{self.args[0].to_sql()})"
+            case "abs":
+                return f"abs({self.args[0].to_sql()})"
+            case "when":
+                cond, then, otherwise = (a.to_sql() for a in self.args)
+                return f"iif({cond}, {then}, {otherwise})"
+            case "truediv":
+                # "/" is integer division on DolphinDB integer columns
+                left, right = (a.to_sql() for a in self.args)
+                return f"ratio({left}, {right})"
+            case _:
+                left, right = self.args
+                return f"({left.to_sql()} {_BINARY[self.op][1]} {right.to_sql()})"
+
+def _sql_literal(value: Any) -> str:
+    match value:
+        case None:
+            return "NULL"
+        case bool():
+            return "true" if value else "false"
+        case str():
+            escaped = value.replace('"', '\\"')
+            return f'"{escaped}"'
+        case _:
+            return repr(value)
+
+class When:
+    """`when(cond).then(a)`: the first half of a conditional expression."""
+    def __init__(self, condition: Any, branches: tuple = ()):
+        self._condition = _wrap(condition)
+        self._branches = branches
+
+    def then(self, value: Any) -> "Then":
+        return Then(self._branches + ((self._condition, _wrap(value)),))
+
+class Then:
+    """Conditional branches awaiting `.when(...)` or the final `.otherwise(...)`."""
+    def __init__(self, branches: tuple):
+        self._branches = branches
+
+    def when(self, condition: Any) -> When:
+        return When(condition, self._branches)
+
+    def otherwise(self, value: Any) -> Expr:
+        result = _wrap(value)
+        for condition, then in reversed(self._branches):
+            result = Expr("when", (condition, then, result))
+        return result
+
+def col(name: str) -> Expr:
+    """References a column (a field of the row dict on the Python lane)."""
+    return Expr("col", (name,))
+
+def lit(value: Any) -> Expr:
+    """A literal value."""
+    return Expr("lit", (value,))
+
+def when(condition: Any) -> When:
+    """Conditional expression: `when(c).then(a).when(c2).then(b).otherwise(d)`."""
+    return When(condition)
@@ -0,0 +1,144 @@
+import hashlib
+import pickle
+import types
+from enum import Enum
+from functools import partial
+from collections.abc import Iterable
+from typing import Any
+
+# Node IDs keep the 32-hex-char shape of the uuid4().hex IDs they replace.
+DIGEST_SIZE = 16
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+def _canonical(value: Any, seen: set[int]) -> Any:
+    """
+    Reduces a value to a nested tuple of primitives that is stable across
+    processes for the same logical content.
+    """
+    match value:
+        case None | bool() | int() | float() | complex() | str() | bytes():
+            return (type(value).__name__, value)
+        case Enum():
+            return ("enum", type(value).__qualname__, value.value)
+
+    # Guard against self-referencing closures (recursive UDFs) and containers.
+    marker = id(value)
+    if marker in seen:
+        return ("cycle",)
+    seen = seen | {marker}
+
+    if hasattr(value, "__fingerprint__"):
+        return ("custom", type(value).__qualname__, value.__fingerprint__())
+
+    match value:
+        case dict():
+            items = sorted(
+                ((_canonical(k, seen), _canonical(v, seen)) for k, v in value.items()),
+                key=repr
+            )
+            return ("dict", tuple(items))
+        case list() | tuple():
+            return (type(value).__name__, tuple(_canonical(v, seen) for v in value))
+        case set() | frozenset():
+            return ("set", tuple(sorted((_canonical(v, seen) for v in value), key=repr)))
+        case types.CodeType():
+            return _canonical_code(value, seen)
+        case types.FunctionType():
+            return _canonical_function(value, seen)
+        case types.MethodType():
+            return ("method", _canonical(value.__func__, seen), _canonical(value.__self__, seen))
+        case partial():
+            return ("partial", _canonical(value.func, seen),
+                    _canonical(value.args, seen), _canonical(value.keywords, seen))
+        case types.BuiltinFunctionType() | type():
+            return ("ref", getattr(value, "__module__", None), value.__qualname__)
+        case types.ModuleType():
+            return ("module", value.__name__)
+
+    try:
+        return ("pickle", type(value).__qualname__, pickle.dumps(value, protocol=5))
+    except Exception:
+        # Unpicklable opaque object: identity is the only safe equality.
+        return ("object", type(value).__qualname__, marker)
+
+def _canonical_code(code: types.CodeType, seen: set[int]) -> tuple:
+    # Line numbers and filenames are deliberately excluded so that the same
+    # lambda defined in two places hashes identically.
+    return (
+        "code",
+        code.co_name,
+        code.co_code,
+        tuple(_canonical(c, seen) for c in code.co_consts),
+        code.co_names,
+        code.co_varnames,
+        code.co_argcount,
+        code.co_kwonlyargcount,
+    )
+
+def _canonical_function(fn: types.FunctionType, seen: set[int]) -> tuple:
+    closure = tuple(
+        _canonical(cell.cell_contents, seen) if _cell_filled(cell) else ("empty",)
+        for cell in (fn.__closure__ or ())
+    )
+    return (
+        "function",
+        fn.__module__,
+        fn.__qualname__,
+        _canonical_code(fn.__code__, seen),
+        _canonical(fn.__defaults__, seen),
+        _canonical(fn.__kwdefaults__, seen),
+        closure,
+        _canonical_globals(fn, seen),
+    )
+
+def _canonical_globals(fn: types.FunctionType, seen: set[int]) -> tuple:
+    # Module-level values read by the code are part of its behaviour: two
+    # `lambda r: r["v"] > TH` with different TH must not hash alike.
+    namespace = fn.__globals__
+    try:
+        return tuple(
+            (name, _canonical(namespace[name], seen))
+            for name in sorted(_global_names(fn.__code__))
+            if name in namespace
+        )
+    except Exception:
+        return ("unhashable-globals", id(fn))
+
+def _global_names(code: types.CodeType) -> set[str]:
+    # co_names also lists attribute names; extra lookups only make the hash stricter.
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+def _cell_filled(cell: types.CellType) -> bool:
+    try:
+        _ = cell.cell_contents
+    except ValueError:  # an unassigned closure variable
+        return False
+    return True
+
+def fingerprint(value: Any) -> str:
+    """
+    Deterministic content hash of an arbitrary config value.
+    Callables are hashed by code object, defaults, closure values and the
+    current values of the module globals they read.
+    """
+    return _digest(repr(_canonical(value, set())).encode("utf-8"))
+
+def structural_id(
+    op_type: Enum,
+    config: dict[str, Any],
+    parents: Iterable[str],
+    config_hash: str | None = None
+) -> str:
+    """
+    Content-addressed Node ID: a hash of op type, config and parent IDs.
+    Two structurally identical subtrees always receive the same ID.
+    Pass `config_hash` when the config fingerprint is already known.
+    """
+    payload = (op_type.value, config_hash or fingerprint(config), tuple(parents))
+    return _digest(repr(payload).encode("utf-8"))
@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .ast import Graph
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Param:
+    """
+    A bind-time value in a node config, e.g. the body of a REST request.
+    Only the name is part of the structural ID, so plans that differ only in
+    parameter values share one fingerprint and one cached plan. Backends read
+    the value through `bound`, which prefers the binding of the run in progress.
+    """
+    name: str
+    value: Any = None
+
+    def __fingerprint__(self) -> str:
+        return self.name
+
+_bindings: ContextVar[dict[str, Any]] = ContextVar("eidos_params", default={})
+
+def graph_params(graph: "Graph") -> dict[str, Any]:
+    """The parameter values carried by a graph's sources, by name."""
+    return {
+        value.name: value.value
+        for node in graph.sources
+        for value in node.config.values()
+        if isinstance(value, Param)
+    }
+
+@contextmanager
+def bind(params: dict[str, Any]) -> Iterator[None]:
+    """
+    Binds parameter values while a plan is wired.
+    Bindings already in effect win, so sub-plans compiled while serving a
+    request (e.g. hybrid segments) see that request's values.
+    """
+    token = _bindings.set({**params, **_bindings.get()})
+    try:
+        yield
+    finally:
+        _bindings.reset(token)
+
+def bindings() -> dict[str, Any]:
+    """The parameter values bound for the plan being wired."""
+    return dict(_bindings.get())
+
+def bound(value: Any) -> Any:
+    """Resolves a Param to its bound value; other values pass through."""
+    if isinstance(value, Param):
+        return _bindings.get().get(value.name, value.value)
+    return value
@@ -0,0 +1,116 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+import pytest
+from eidos import Source, Map, Filter, Window, Sink, settings
+from eidos.io.kafka import KafkaConnector
+from eidos.io.redis import RedisConnector
+from eidos.quant.indicators import SMA
+from eidos.zero.compiler import Compiler
+
+def compile_async(flow):
+    return Compiler.compile(flow.compile(), target="async", use_cache=False)
+
+@pytest.fixture
+def bars(tmp_path):
+    path = tmp_path / "bars.csv"
+    path.write_text("close\n" + "\n".join(str(float(i)) for i in range(1, 41)))
+    return f"csv://{path}"
+
+@pytest.fixture
+def ticks(monkeypatch):
+    """A fake Kafka topic of 200 ticks that records how far the producer got."""
+    state = {"produced": 0}
+
+    async def aread(uri):
+        for i in range(200):
+            state["produced"] = i + 1
+            yield {"i": i}
+            await asyncio.sleep(0)
+
+    monkeypatch.setattr(KafkaConnector, "aread", staticmethod(aread))
+    return state
+
+@pytest.fixture
+def redis_sink(monkeypatch):
+    """A fake Redis sink whose writes take a while; tracks writes in flight."""
+    state = {"written": [], "in_flight": 0, "peak": 0}
+
+    @asynccontextmanager
+    async def asink(uri):
+        async def send(item):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.001)
+            state["written"].append(item)
+            state["in_flight"] -= 1
+        yield send
+
+    monkeypatch.setattr(RedisConnector, "asink", staticmethod(asink))
+    return state
+
+def test_matches_the_python_lane(bars):
+    def flow():
+        return (Source(bars) >> Map(lambda r: {"close": r["close"] * 2})
+                >> Filter(lambda r: r["close"] > 10) >> SMA(window=3) >> Sink("memory"))
+    reference = Compiler.compile(flow().compile(), target="python", use_cache=False)()
+
+    assert compile_async(flow())() == reference
+
+def test_async_udfs_are_awaited(bars):
+    async def enrich(row):
+        await asyncio.sleep(0)
+        return {**row, "seen": True}
+
+    result = compile_async(Source(bars) >> Map(enrich) >> Map(lambda r: r["seen"]) >> Sink("memory"))()
+
+    assert result == [True] * 40
+
+def test_other_operators_run_on_a_bridge_thread(bars):
+    result = compile_async(Source(bars) >> Window(4, 4, agg={"total": ("close", "sum")}) >> Sink("memory"))()
+
+    assert [r["total"] for r in result] == [sum(range(i, i + 4)) for i in range(1, 41, 4)]
+
+def test_sinks_write_with_bounded_concurrency(ticks, redis_sink, monkeypatch):
+    monkeypatch.setattr(settings, "async_sink_concurrency", 4)
+
+    written = compile_async(Source("kafka://broker:9092/ticks") >> Sink("redis://localhost/ticks"))()
+
+    assert written == len(redis_sink["written"]) == 200
+    assert 1 < redis_sink["peak"] <= 4
+
+def test_queues_apply_backpressure(ticks, monkeypatch):
+    monkeypatch.setattr(settings, "async_queue_size", 4)
+    flow = Source("kafka://broker:9092/ticks") >> Map(lambda r: r["i"])
+
+    async def take_slowly():
+        seen = []
+        async for i in compile_async(flow):
+            seen.append(i)
+            if len(seen) == 10:
+                # Two bounded queues between us and the source
+                assert ticks["produced"] <= 10 + 2 * 4 + 2
+                break
+            await asyncio.sleep(0.001)
+        return seen
+
+    assert asyncio.run(take_slowly()) == list(range(10))
+
+def test_pipelines_share_one_event_loop(bars, ticks, redis_sink):
+    a = compile_async(Source(bars) >> Map(lambda r: r["close"]) >> Sink("memory"))
+    b = compile_async(Source("kafka://broker:9092/ticks") >> Sink("redis://localhost/ticks"))
+
+    async def main():
+        return await asyncio.gather(a.run(), b)
+
+    closes, written = asyncio.run(main())
+    assert len(closes) == 40 and written == 200
+
+def test_more_bridged_pipelines_than_default_executor_workers(bars):
+    count = min(32, (os.cpu_count() or 1) + 4) + 4
+    plans = [compile_async(Source(bars) >> Window(2) >> Map(len) >> Sink("memory")) for _ in range(count)]
+
+    async def main():
+        return await asyncio.wait_for(asyncio.gather(*(plan.run() for plan in plans)), timeout=30)
+
+    assert asyncio.run(main()) == [[2] * 39] * count
@@ -0,0 +1,66 @@
+import polars as pl
+from eidos import Source, Map, Filter, Sink
+from eidos.zero.symbolism import OpType
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.fusion import fuse_map_filter
+from eidos.zero.compiler.python_backend import PythonBackend
+
+def returns(batch):
+    # Works on a Polars DataFrame and on a dict of NumPy arrays alike
+    if isinstance(batch, pl.DataFrame):
+        return batch.with_columns((pl.col("close") / 10.0).alias("ret"))
+    return {"close": batch["close"], "ret": batch["close"] / 10.0}
+
+def above_ten(batch):
+    return batch["close"] > 10
+
+def write_bars(tmp_path, n=50):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame({"close": [float(i) for i in range(n)]}).write_csv(path)
+    return f"csv://{path}"
+
+def test_polars_batch_udfs_skip_per_row_calls(tmp_path):
+    graph = (Source(write_bars(tmp_path)) >> Filter(above_ten, batch=True) >> Map(returns, batch=True)).compile()
+    lazy = Compiler.compile(graph, target="polars", use_cache=False)
+
+    assert "map_elements" not in lazy.explain()
+    df = lazy.collect()
+    assert df.height == 39
+    assert df["ret"][0] == 1.1
+
+def test_python_lane_chunks_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(PythonBackend, "batch_size", 16)
+    calls = []
+
+    def tracked(batch):
+        calls.append(len(batch["close"]))
+        return returns(batch)
+
+    graph = (
+        Source(write_bars(tmp_path)) >> Filter(above_ten, batch=True) >> Map(tracked, batch=True) >> Sink("memory")
+    ).compile()
+    rows = Compiler.compile(graph, target="python", use_cache=False)()
+
+    assert len(rows) == 39
+    assert rows[0] == {"close": 11.0, "ret": 1.1}
+    assert calls == [16, 16, 7]
+
+def test_batch_udfs_are_not_fused():
+    graph = (Source("mem") >> Map(returns, batch=True) >> Filter(above_ten, batch=True) >> Sink("memory")).compile()
+    types = {n.op_type for n in fuse_map_filter(graph).nodes.values()}
+    assert OpType.FUSED not in types
+
+if __name__ == "__main__":
+    test_batch_udfs_are_not_fused()
+
+def test_batches_take_the_union_of_row_keys():
+    seen = []
+
+    def columns(batch):
+        seen.append({name: list(values) for name, values in batch.items()})
+        return batch["close"] > 0
+
+    node = (Source("mem") >> Filter(columns, batch=True)).node
+    rows = [{"close": 1.0}, {"close": 2.0, "tag": "x"}]
+    assert list(PythonBackend()._run_batches(iter(rows), node)) == rows
+    assert seen == [{"close": [1.0, 2.0], "tag": [None, "x"]}]
@@ -0,0 +1,95 @@
+import threading
+import time
+import pytest
+from eidos import Source, Map, Filter, Sink
+from eidos.zero.compiler import Compiler
+from eidos.zero.runtime.scheduler import BranchScheduler, safe_tee
+
+def write(tmp_path, name, values):
+    path = tmp_path / f"{name}.csv"
+    path.write_text("close\n" + "".join(f"{v}\n" for v in values))
+    return f"csv://{path}"
+
+def run(flow):
+    return Compiler.compile((flow >> Sink("memory")).compile(), target="python", use_cache=False)()
+
+def test_ensemble_branches_run_on_worker_threads(tmp_path):
+    uri = write(tmp_path, "bars", range(3000))
+    threads = set()
+
+    def double(row):
+        threads.add(threading.current_thread().name)
+        return {"double": row["close"] * 2}
+
+    bars = Source(uri)
+    result = run((bars >> Map(double)) & (bars >> Map(lambda r: {"square": r["close"] ** 2})))
+
+    assert len(result) == 3000
+    assert result[7] == {"double": 14, "square": 49}
+    assert all(name.startswith("eidos-branch") for name in threads)
+
+def test_merge_and_choice_on_python_lane(tmp_path):
+    a, b = write(tmp_path, "a", [1, 3]), write(tmp_path, "b", [2, 4])
+
+    assert [r["close"] for r in run(Source(a) + Source(b))] == [1, 3, 2, 4]
+    assert [r["close"] for r in run(Source(a).merge(Source(b), on="close"))] == [1, 2, 3, 4]
+
+    def broken(row):
+        raise ConnectionError("cache down")
+
+    assert run((Source(a) >> Map(broken)) | Source(b)) == [{"close": 2}, {"close": 4}]
+    assert run((Source(a) >> Filter(lambda r: False)) | Source(b)) == [{"close": 2}, {"close": 4}]
+
+def test_branch_errors_reach_the_consumer():
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    branch = BranchScheduler(workers=1, chunk_size=1).spawn(failing())
+    assert next(branch) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(branch)
+
+def test_abandoned_branch_frees_its_worker():
+    scheduler = BranchScheduler(workers=1, queue_size=1, chunk_size=1)
+    first = scheduler.spawn(iter(range(10_000)))
+    assert next(first) == 0
+    first.close()
+
+    def where():
+        yield threading.current_thread().name
+
+    # The cancelled producer releases its slot, so a later branch gets the thread back
+    for _ in range(100):
+        if next(scheduler.spawn(where())).startswith("eidos-branch"):
+            break
+        time.sleep(0.01)
+    else:
+        pytest.fail("worker slot was never released")
+
+def test_compiled_but_unrun_plans_start_nothing(tmp_path):
+    uri = write(tmp_path, "bars", range(100))
+    pulled = []
+
+    def count(row):
+        pulled.append(row)
+        return row
+
+    bars = Source(uri)
+    flow = (bars >> Map(count)) & (bars >> Map(lambda r: {"square": r["close"] ** 2}))
+    plan = Compiler.compile((flow >> Sink("memory")).compile(), target="python", use_cache=False)
+    del plan
+
+    scheduler = BranchScheduler(workers=2)
+    branch = scheduler.spawn(count(i) for i in range(100))
+    time.sleep(0.05)
+
+    assert pulled == []
+    assert scheduler._executor is None
+    branch.close()
+    assert scheduler._executor is None
+
+def test_safe_tee_copies_are_independent():
+    left, right = safe_tee(iter(range(5)), 2)
+    assert list(left) == [0, 1, 2, 3, 4]
+    assert list(right) == [0, 1, 2, 3, 4]
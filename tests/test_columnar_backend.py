@@ -0,0 +1,94 @@
+import polars as pl
+import pytest
+from eidos import Source, Map, Filter, Select, WithColumn, Sink, col
+from eidos.quant.indicators import SMA, RSI, VWAP, ATR
+from eidos.zero.compiler import Compiler
+from eidos.zero.runtime.batch import RecordBatch
+
+def pipeline(path):
+    return (
+        Source(f"csv://{path}")
+        >> SMA(window=3)
+        >> RSI(window=5)
+        >> VWAP(field_price="close")
+        >> WithColumn("spread", col("high") - col("low"))
+        >> Filter(col("close") > 3)
+        >> Map(lambda row: {**row, "tag": "up" if row["close"] > 10 else "low"})
+        >> Select("close", "sma_3", "rsi_5", "vwap", "spread", "tag")
+        >> Sink("memory")
+    )
+
+@pytest.fixture
+def bars(tmp_path):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame({
+        "close": [float(i % 7 + i) for i in range(40)],
+        "high": [float(i % 7 + i) + 1 for i in range(40)],
+        "low": [float(i % 7 + i) - 1 for i in range(40)],
+        "volume": [10 + i for i in range(40)],
+    }).write_csv(path)
+    return path
+
+def test_columnar_matches_row_execution(bars):
+    graph = pipeline(bars).compile()
+    rows = Compiler.compile(graph, target="python", use_cache=False)()
+    batch = Compiler.compile(graph, target="columnar", use_cache=False)()
+
+    assert isinstance(batch, RecordBatch)
+    assert batch.names == ["close", "sma_3", "rsi_5", "vwap", "spread", "tag"]
+    assert batch.to_pylist() == pytest.approx(rows)
+
+def test_batches_export_through_arrow_c_stream(bars):
+    graph = pipeline(bars).compile()
+    batch = Compiler.compile(graph, target="columnar", use_cache=False)()
+
+    df = pl.DataFrame(batch)
+    assert df.shape == (len(batch), 6)
+    assert df["spread"].to_list() == [2.0] * len(batch)
+
+def test_batches_export_to_pandas(bars):
+    pd = pytest.importorskip("pandas")
+    batch = Compiler.compile(pipeline(bars).compile(), target="columnar", use_cache=False)()
+    assert isinstance(batch.to_arrow().to_pandas(), pd.DataFrame)
+
+def test_record_batch_shares_untouched_columns():
+    batch = RecordBatch.from_rows([{"a": 1, "b": 2.0}, {"a": 3, "b": 4.0}])
+    extended = batch.with_columns({"c": [5, 6]})
+
+    assert extended.columns["a"] is batch.columns["a"]
+    assert batch.filter([True, False]).to_pylist() == [{"a": 1, "b": 2.0}]
+    assert RecordBatch.concat([batch, batch]).num_rows == 4
+
+def test_only_uniform_numeric_columns_become_arrays():
+    batch = RecordBatch.from_rows([{"a": 1, "b": "x", "c": 1.5, "d": True},
+                                   {"a": 2, "b": 2, "c": 2, "d": False}])
+
+    assert batch.columns["a"].dtype.kind == "i"
+    assert batch.columns["b"] == ["x", 2]
+    assert batch.columns["c"] == [1.5, 2]
+    assert batch.columns["d"].dtype == bool
+
+def test_batches_take_the_union_of_row_keys():
+    batch = RecordBatch.from_rows([{"a": 1}, {"a": 2, "b": "x"}])
+    other = RecordBatch.from_rows([{"c": 3.0}])
+
+    assert batch.to_pylist() == [{"a": 1, "b": None}, {"a": 2, "b": "x"}]
+    assert RecordBatch.concat([batch, other]).to_pylist() == [
+        {"a": 1, "b": None, "c": None}, {"a": 2, "b": "x", "c": None}, {"a": None, "b": None, "c": 3.0},
+    ]
+
+def test_atr_keeps_its_seed_column(bars):
+    graph = (Source(f"csv://{bars}") >> ATR(window=5) >> Sink("memory")).compile()
+    rows = Compiler.compile(graph, target="python", use_cache=False)()
+    batch = Compiler.compile(graph, target="columnar", use_cache=False)()
+
+    assert batch.columns["_prev_atr"] == [row.get("_prev_atr") for row in rows]
+    assert batch.columns["_prev_atr"][5] is not None
+
+def test_expression_maps_yield_bare_values_like_the_python_lane(bars):
+    graph = (Source(f"csv://{bars}") >> Map(col("close") * 2) >> Map(lambda v: v + 1) >> Sink("memory")).compile()
+    rows = Compiler.compile(graph, target="python", use_cache=False)()
+    batch = Compiler.compile(graph, target="columnar", use_cache=False)()
+
+    assert batch.to_pylist() == pytest.approx(rows)
+    assert rows[0] == 1.0
@@ -0,0 +1,51 @@
+import uuid
+from eidos import Source, Map, Sink
+from eidos.quant.indicators import SMA
+from eidos.zero.symbolism import Graph, Node, OpType
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.optimizer import eliminate_common_subexpressions
+
+def test_cse_merges_identical_subtrees():
+    # Hand-built graph with random IDs: the same scan and SMA appear twice
+    graph = Graph()
+    scans = [Node(id=uuid.uuid4().hex, op_type=OpType.SOURCE, config={"uri": "a.parquet"}) for _ in range(2)]
+    smas = [
+        Node(id=uuid.uuid4().hex, op_type=OpType.CUSTOM, config={"kind": "SMA", "window": 20, "field": "close"}, parents=[scan.id])
+        for scan in scans
+    ]
+    merge = Node(id=uuid.uuid4().hex, op_type=OpType.MERGE, parents=[smas[0].id, smas[1].id])
+    for node in [*scans, *smas, merge]:
+        graph.add_node(node)
+
+    optimized = eliminate_common_subexpressions(graph)
+
+    assert len(optimized.nodes) == 3
+    merge_node = next(n for n in optimized.nodes.values() if n.op_type == OpType.MERGE)
+    assert merge_node.parents[0] == merge_node.parents[1]
+    assert optimized.id == graph.id
+
+def test_cse_is_noop_for_dsl_graphs():
+    graph = (Source("A") >> SMA(window=5) >> Sink("out")).compile()
+    assert eliminate_common_subexpressions(graph) is graph
+
+def test_shared_intermediate_computed_once_in_python_lane():
+    calls = []
+
+    def tap(row):
+        calls.append(row)
+        return row
+
+    left = Source.from_payload({"v": 1}) >> Map(tap) >> Map(lambda r: {"l": r["v"]}) >> Sink("collect")
+    right = Source.from_payload({"v": 1}) >> Map(tap) >> Map(lambda r: {"r": r["v"]}) >> Sink("memory")
+    graph = (left + right).compile()
+
+    sinks = Compiler.compile(graph, target="python", use_cache=False)
+    results = sorted((run() for run in sinks), key=str)
+
+    assert results == [[{"l": 1}], [{"r": 1}]]
+    assert len(calls) == 1
+
+if __name__ == "__main__":
+    test_cse_merges_identical_subtrees()
+    test_cse_is_noop_for_dsl_graphs()
+    test_shared_intermediate_computed_once_in_python_lane()
@@ -0,0 +1,106 @@
+import threading
+import time
+import pyarrow as pa
+import polars as pl
+from eidos import Source, Map, Filter, WithColumn, Sink, col, lit, when, settings
+from eidos.zero.symbolism import OpType
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.fusion import fuse_map_filter
+from eidos.zero.compiler.python_backend import PythonBackend
+
+ROWS = [
+    {"close": 8.0, "high": 9.0, "low": 7.5},
+    {"close": 12.0, "high": 13.0, "low": 11.0},
+    {"close": 15.0, "high": 15.5, "low": 14.0},
+]
+
+def pipeline(source):
+    return (
+        source
+        >> Filter(col("close") > 10)
+        >> WithColumn("range", col("high") - col("low"))
+        >> WithColumn("signal", when(col("range") > 1).then(lit("wide")).otherwise("narrow"))
+    )
+
+def test_expression_evaluates_per_row():
+    expr = (col("high") - col("low")) / 2 >= 0.75
+    assert expr(ROWS[0]) is True
+    assert expr(ROWS[2]) is True
+    assert (~(col("close") > 10) | (col("close") == 15))(ROWS[1]) is False
+
+def test_polars_lowers_to_native_expressions(tmp_path):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame(ROWS).write_csv(path)
+
+    lazy = Compiler.compile(pipeline(Source(f"csv://{path}")).compile(), target="polars", use_cache=False)
+    assert "map_elements" not in lazy.explain()
+
+    df = lazy.collect()
+    assert df["close"].to_list() == [12.0, 15.0]
+    assert df["signal"].to_list() == ["wide", "wide"]
+
+def test_python_lane_matches_polars(tmp_path):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame(ROWS).write_csv(path)
+    graph = (pipeline(Source(f"csv://{path}")) >> Map(col("range") * 10) >> Sink("memory")).compile()
+
+    python = Compiler.compile(graph, target="python", use_cache=False)()
+    polars = Compiler.compile(graph, target="polars", use_cache=False)()
+    assert python == polars["payload"].to_list() == [20.0, 15.0]
+
+def test_arrow_and_sql_lowering():
+    table = pa.Table.from_pylist(ROWS)
+    expr = when(col("close") > 10).then(col("high") / 2).otherwise(0)
+    assert expr.to_arrow(table).to_pylist() == [0.0, 6.5, 7.75]
+    assert expr.to_sql() == "iif((close > 10), ratio(high, 2), 0)"
+
+    graph = (Source("dolphindb://bars") >> Filter((col("close") > 10) & (col("low") != 0)) >> Sink("stdout")).compile()
+    script = str(Compiler.compile(graph, target="dolphindb", use_cache=False))
+    assert "where ((close > 10) and (low != 0))" in script
+
+def test_expressions_are_not_fused():
+    graph = (Source("mem") >> Filter(col("close") > 1) >> Map(col("close") * 2) >> Sink("memory")).compile()
+    types = {n.op_type for n in fuse_map_filter(graph).nodes.values()}
+    assert OpType.FUSED not in types
+
+def test_identical_expressions_share_node_ids():
+    a = Source("A") >> Filter(col("close") > 10)
+    b = Source("A") >> Filter(col("close") > 10)
+    c = Source("A") >> Filter(col("close") > 11)
+    assert a.node.id == b.node.id != c.node.id
+
+if __name__ == "__main__":
+    test_expression_evaluates_per_row()
+    test_arrow_and_sql_lowering()
+    test_expressions_are_not_fused()
+    test_identical_expressions_share_node_ids()
+
+def test_slow_streams_are_not_held_back_for_a_full_batch(monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_delay", 0.05)
+
+    def ticks():
+        for i in range(5000):
+            time.sleep(0.001)
+            yield {"close": float(i)}
+
+    start = time.monotonic()
+    doubled = PythonBackend()._eval_expr(ticks(), col("close") * 2, "map")
+    assert next(doubled) == 0.0
+    assert time.monotonic() - start < 0.5
+
+def test_stalled_streams_flush_on_the_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_delay", 0.05)
+    resume = threading.Event()
+
+    def quiet_topic():
+        yield {"close": 5.0}
+        yield {"close": 1.0}
+        resume.wait(5)  # the topic goes silent
+        yield {"close": 7.0}
+
+    start = time.monotonic()
+    matched = PythonBackend()._eval_expr(quiet_topic(), col("close") > 2, "filter")
+    assert next(matched) == {"close": 5.0}
+    assert time.monotonic() - start < 1
+    resume.set()
+    assert list(matched) == [{"close": 7.0}]
@@ -0,0 +1,79 @@
+import polars as pl
+from eidos import Source, Map, Filter, Sink
+from eidos.zero.symbolism import OpType
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.fusion import fuse_map_filter, DROP
+from eidos.zero.compiler.polars_backend import PolarsBackend
+
+def chain(source):
+    return (
+        source
+        >> Filter(lambda r: r["close"] > 3)
+        >> Map(lambda r: {**r, "double": r["close"] * 2})
+        >> Filter(lambda r: r["double"] < 20)
+        >> Map(lambda r: r["double"])
+    )
+
+def test_run_collapses_to_single_node():
+    graph = (chain(Source("mem")) >> Sink("collect")).compile()
+    fused = fuse_map_filter(graph)
+
+    types = [fused.nodes[nid].op_type for nid in fused.topological_order()]
+    assert types == [OpType.SOURCE, OpType.FUSED, OpType.SINK]
+    node = next(n for n in fused.nodes.values() if n.op_type == OpType.FUSED)
+    assert node.config["fn"]({"close": 1}) is DROP
+    assert node.config["fn"]({"close": 5}) == 10
+
+def test_shared_intermediate_is_not_fused():
+    base = Source("mem") >> Map(lambda r: r)
+    left = base >> Filter(lambda r: True) >> Sink("a")
+    right = base >> Map(lambda r: r) >> Sink("b")
+    graph = (left + right).compile()
+
+    fused = fuse_map_filter(graph)
+    assert base.node.id in fused.nodes
+
+def test_python_lane_matches_unfused(tmp_path):
+    path = tmp_path / "prices.csv"
+    path.write_text("close\n" + "\n".join(str(i) for i in range(15)))
+    graph = (chain(Source(f"csv://{path}")) >> Sink("collect")).compile()
+
+    result = Compiler.compile(graph, target="python", use_cache=False)()
+    assert result == [8.0, 10.0, 12.0, 14.0, 16.0, 18.0]
+
+def polars_chain(source):
+    # On Polars a row Map's result becomes the "payload" column of the next row
+    return (
+        source
+        >> Filter(lambda r: r["close"] > 3)
+        >> Map(lambda r: {**r, "double": r["close"] * 2})
+        >> Filter(lambda r: r["payload"]["double"] < 20)
+        >> Map(lambda r: r["payload"]["double"])
+    )
+
+def test_polars_lane_fused_filters_and_maps():
+    graph = (polars_chain(Source("mem")) >> Sink("collect")).compile()
+    df = Compiler.compile(graph, target="polars", use_cache=False)()
+
+    assert df["payload"].to_list() == [8.0, 10.0, 12.0, 14.0, 16.0, 18.0]
+
+    only_filters = Source("mem") >> Filter(lambda r: r["close"] > 5) >> Filter(lambda r: r["close"] < 9) >> Sink("collect")
+    df = Compiler.compile(only_filters.compile(), target="polars", use_cache=False)()
+    assert df["close"].to_list() == [6, 7, 8]
+    assert isinstance(df, pl.DataFrame)
+
+def test_polars_lane_fused_matches_unfused(monkeypatch):
+    fused = Compiler.compile((polars_chain(Source("mem")) >> Sink("collect")).compile(),
+                             target="polars", use_cache=False)()
+    monkeypatch.setattr(PolarsBackend, "passes", tuple(p for p in PolarsBackend.passes if p != "fuse"))
+    unfused = Compiler.compile((polars_chain(Source("mem")) >> Sink("collect")).compile(),
+                               target="polars", use_cache=False)()
+
+    assert fused.equals(unfused)
+
+if __name__ == "__main__":
+    test_run_collapses_to_single_node()
+    test_shared_intermediate_is_not_fused()
+    import tempfile, pathlib
+    test_python_lane_matches_unfused(pathlib.Path(tempfile.mkdtemp()))
+    test_polars_lane_fused_filters_and_maps()
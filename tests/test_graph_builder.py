@@ -0,0 +1,69 @@
+import pytest
+from eidos import Source, Map, Filter, Sink
+from eidos.quant.indicators import SMA
+from eidos.zero.symbolism import GraphBuilder, OpType
+
+def test_builder_matches_dsl_graph():
+    fn = lambda x: x
+    dsl = (Source("prices") >> SMA(window=10) >> Map(fn) >> Sink("memory")).compile()
+
+    b = GraphBuilder()
+    tip = b.apply(SMA(window=10) >> Map(fn), b.source("prices"))
+    b.sink(tip, "memory")
+    graph = b.build()
+
+    assert graph.fingerprint == dsl.fingerprint
+    assert len(graph.edges) == 3
+
+def test_sweep_shares_configs():
+    b = GraphBuilder()
+    sources = [b.source(f"sym{i}") for i in range(100)]
+    smas = [b.apply(SMA(window=20), s) for s in sources]
+    graph = b.build()
+
+    configs = {id(graph.nodes[n].config) for n in smas}
+    assert len(configs) == 1
+    assert len(graph.nodes) == 200
+
+def test_pooled_config_keeps_the_users_callable():
+    f = lambda r: r["v"] > 0
+    g = lambda r: r["v"] > 0
+    a = (Source("A") >> Filter(f)).node
+    b = (Source("A") >> Filter(g)).node
+
+    # Content-equal UDFs share an ID, but each node runs its own function
+    assert a.id == b.id
+    assert a.config["predicate"] is f
+    assert b.config["predicate"] is g
+
+    def thresholded(threshold):
+        namespace = {"TH": threshold}
+        exec('pred = lambda r: r["v"] > TH', namespace)
+        return namespace["pred"]
+
+    f5, f1 = thresholded(5), thresholded(1)
+    s1 = Source("A") >> Filter(f5)
+    s2 = Source("A") >> Filter(f1)
+    assert s2.node.config["predicate"] is f1
+    assert s2.node.config["predicate"]({"v": 3}) is True
+    assert s1.node.config["predicate"]({"v": 3}) is False
+
+def test_nodes_are_compact_and_immutable():
+    node = (Source("A") >> Map(lambda x: x)).node
+
+    assert not hasattr(node, "__dict__")
+    assert isinstance(node.parents, tuple)
+    with pytest.raises(TypeError):
+        node.config["fn"] = None
+
+def test_unknown_parent_rejected():
+    b = GraphBuilder()
+    with pytest.raises(KeyError):
+        b.add(OpType.MAP, {"fn": len}, parents=["missing"])
+
+if __name__ == "__main__":
+    test_builder_matches_dsl_graph()
+    test_sweep_shares_configs()
+    test_pooled_config_keeps_the_users_callable()
+    test_nodes_are_compact_and_immutable()
+    test_unknown_parent_rejected()
@@ -0,0 +1,49 @@
+from eidos import Source, Map, Filter, Sink
+from eidos.zero.symbolism import Graph, Node, OpType
+from eidos.zero.compiler import Compiler
+
+def test_adjacency_and_lookups():
+    source = Source("root")
+    path_a = source >> Map(lambda x: x) >> Sink("a")
+    path_b = source >> Filter(lambda x: True)
+    graph = path_a.compile()
+
+    assert [n.id for n in graph.sources] == [source.node.id]
+    assert [n.id for n in graph.sinks] == [path_a.node.id]
+    assert {n.id for n in graph.leaves} == {path_a.node.id, path_b.node.id}
+    assert len(graph.children_of(source.node.id)) == 2
+
+def test_topological_order_is_cached_and_invalidated():
+    stream = Source("A") >> Map(lambda x: x)
+    graph = stream.compile()
+
+    order = graph.topological_order()
+    assert order == [stream.graph.sources[0].id, stream.node.id]
+    assert graph.topological_order() == order
+
+    tip = stream >> Sink("out")
+    assert graph.topological_order()[-1] == tip.node.id
+
+def test_constructor_indexes_nodes():
+    a = Node(id="a", op_type=OpType.SOURCE)
+    b = Node(id="b", op_type=OpType.SINK, parents=["a"])
+    graph = Graph(nodes={"b": b, "a": a})
+
+    assert graph.edges == [("a", "b")]
+    assert graph.topological_order() == ["a", "b"]
+
+def test_deep_chain_compiles_without_recursion():
+    flow = Source("deep")
+    for i in range(5000):
+        flow = flow >> Map(lambda x, i=i: x + i)
+    graph = (flow >> Sink("out")).compile()
+
+    plan = Compiler.compile(graph, target="dolphindb", use_cache=False)
+    assert plan is not None
+    assert len(graph.topological_order()) == 5002
+
+if __name__ == "__main__":
+    test_adjacency_and_lookups()
+    test_topological_order_is_cached_and_invalidated()
+    test_constructor_indexes_nodes()
+    test_deep_chain_compiles_without_recursion()
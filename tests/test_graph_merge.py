@@ -0,0 +1,50 @@
+from functools import reduce
+from eidos import Source, Map
+from eidos.zero.symbolism import Graph, OpType
+
+def test_fold_shares_one_arena():
+    streams = [Source(f"sym{i}") >> Map(lambda x: x) for i in range(500)]
+    ensemble = reduce(lambda acc, s: acc + s, streams)
+    graph = ensemble.compile()
+
+    # 500 sources, 500 maps, 499 merges, and no duplicated edges
+    assert len(graph.nodes) == 1499
+    assert len(graph.edges) == len(set(graph.edges)) == 1498
+    assert all(s.graph is graph for s in streams)
+
+def test_absorbed_graph_forwards_to_arena():
+    small = Source("B")
+    big = Source("A") >> Map(lambda x: x) >> Map(lambda x: x)
+    old_small_graph = small.graph
+
+    merged = big | small
+
+    assert old_small_graph.resolve() is merged.graph
+    assert big.graph is merged.graph
+    # Later appends on the absorbed stream land in the shared arena
+    tip = small >> Map(lambda x: x)
+    assert tip.node.id in merged.graph.nodes
+
+def test_merging_extends_the_larger_arena_in_place():
+    small = Source("B")
+    big = Source("A") >> Map(lambda x: x)
+    before = big.graph
+    snapshot = Graph(nodes=dict(before.nodes))
+
+    big + small
+
+    assert small.node.id in before.nodes
+    assert small.node.id not in snapshot.nodes
+    assert snapshot.edges == [(big.node.parents[0], big.node.id)]
+
+def test_self_merge_keeps_single_edge():
+    s = Source("A")
+    merged = s + s
+    node = merged.node
+    assert node.op_type == OpType.MERGE
+    assert merged.graph.edges.count((s.node.id, node.id)) == 1
+
+if __name__ == "__main__":
+    test_fold_shares_one_arena()
+    test_absorbed_graph_forwards_to_arena()
+    test_self_merge_keeps_single_edge()
@@ -0,0 +1,45 @@
+import pyarrow as pa
+import polars as pl
+from eidos import Source, Map, Filter, Sink, col
+from eidos.quant.indicators import SMA
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.hybrid import HybridPlan, place
+from eidos.zero.runtime.exchange import ArrowExchange
+
+def write_bars(tmp_path, n=10):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame({"close": [float(i) for i in range(n)]}).write_csv(path)
+    return f"csv://{path}"
+
+def test_segments_follow_pins_and_indicators(tmp_path):
+    flow = (
+        Source(write_bars(tmp_path), engine="python")
+        >> Filter(lambda r: r["close"] > 2)
+        >> SMA(window=3)
+        >> Map(lambda r: r["sma_3"]).on("python")
+        >> Sink("memory")
+    )
+    plan = Compiler.compile(flow.compile(), target="hybrid", use_cache=False)
+
+    assert isinstance(plan, HybridPlan)
+    assert [s.lane for s in plan.segments] == ["python", "polars", "python"]
+    assert plan() == [None, None, 4.0, 5.0, 6.0, 7.0, 8.0]
+    # Plans are re-executable and leave no tables behind
+    assert plan() == [None, None, 4.0, 5.0, 6.0, 7.0, 8.0]
+    assert ArrowExchange._tables == {}
+
+def test_diamond_across_lanes_stays_acyclic(tmp_path):
+    base = Source(write_bars(tmp_path)) >> SMA(window=2)
+    side = base >> Map(lambda r: {"close": r["close"], "sma_2": r["sma_2"]}).on("python")
+    flow = (base + side) >> Sink("memory")
+    graph = flow.compile()
+
+    plan = HybridPlan(graph, place(graph))
+    for index, segment in enumerate(plan.segments):
+        assert all(u < index for u in segment.upstream)
+
+def test_sinkless_plan_returns_arrow(tmp_path):
+    flow = Source(write_bars(tmp_path)) >> Filter(col("close") >= 8) >> Map(lambda r: r["close"] * 2).on("python")
+    result = Compiler.compile(flow.compile(), target="hybrid", use_cache=False)()
+    assert isinstance(result, pa.Table)
+    assert result["payload"].to_pylist() == [16.0, 18.0]
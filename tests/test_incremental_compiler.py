@@ -0,0 +1,115 @@
+import os
+import sys
+import textwrap
+from unittest.mock import patch
+import pytest
+from eidos import Source, Filter, Sink
+from eidos.quant.indicators import SMA, EMA
+from eidos.zero.compiler.incremental import IncrementalCompiler
+from eidos.dx.lsp import TopologyExtractor
+
+def strategy(window):
+    return (Source("bars.parquet") >> SMA(window=20) >> EMA(window=window) >> Sink("out")).compile()
+
+def test_edit_recompiles_only_changed_nodes():
+    compiler = IncrementalCompiler(target="dolphindb")
+    first = compiler.compile(strategy(5))
+    assert len(compiler.last_diff.added) == 4
+
+    lowered = []
+    original = compiler._transpiler.backend.compile_node
+    def spy(node, inputs):
+        lowered.append(node.op_type)
+        return original(node, inputs)
+
+    with patch.object(compiler._transpiler.backend, "compile_node", side_effect=spy):
+        edited = compiler.compile(strategy(9))
+
+    # Source and SMA are reused; only EMA and the sink below it are lowered again
+    assert len(compiler.last_diff.reused) == 2
+    assert len(lowered) == 2
+    assert str(edited) != str(first)
+
+def test_editing_a_referenced_global_recompiles():
+    namespace = {"TH": 5}
+    exec('pred = lambda r: r["v"] > TH', namespace)
+    build = lambda: (Source("bars.parquet") >> Filter(namespace["pred"]) >> Sink("out")).compile()
+
+    compiler = IncrementalCompiler()
+    compiler.compile(build())
+    compiler.compile(build())
+    assert not compiler.last_diff.added
+
+    namespace["TH"] = 1
+    compiler.compile(build())
+    # The Filter and the Sink below it see the new constant
+    assert len(compiler.last_diff.added) == 2
+
+def test_studio_reloads_edited_imports(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    from eidos.interfaces import studio
+
+    module = "studio_helpers_under_test"
+    helpers = tmp_path / f"{module}.py"
+    helpers.write_text("TH = 5\npred = lambda r: r['v'] > TH\n")
+    script = tmp_path / "strategy.py"
+    script.write_text(textwrap.dedent(f"""
+        from eidos import Source, Filter, Sink
+        from {module} import pred
+
+        def main():
+            return Source("bars.parquet") >> Filter(pred) >> Sink("out")
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    first = studio.get_graph(str(script))
+    assert studio.get_graph(str(script)) is first
+
+    helpers.write_text("TH = 10\npred = lambda r: r['v'] > TH\n")
+    os.utime(helpers, ns=(0, helpers.stat().st_mtime_ns + 1_000_000))
+    edited = studio.get_graph(str(script))
+
+    sys.modules.pop(module, None)
+
+    assert "error" not in edited
+    assert {n["id"] for n in edited["nodes"]} != {n["id"] for n in first["nodes"]}
+
+def test_each_new_version_is_registered_for_lineage():
+    compiler = IncrementalCompiler()
+    with patch("eidos.zero.compiler.transpiler.LineageRegistry.register") as register:
+        compiler.compile(strategy(5))
+        compiler.compile(strategy(5))
+        compiler.compile(strategy(9))
+
+    assert [call.args[0].fingerprint for call in register.call_args_list] == \
+           [strategy(5).fingerprint, strategy(9).fingerprint]
+
+def test_topology_matches_full_serialization():
+    compiler = IncrementalCompiler()
+    graph = strategy(5)
+    assert compiler.topology(graph) == graph.to_json()
+
+    edited = strategy(9)
+    assert compiler.topology(edited) == edited.to_json()
+
+def test_lsp_skips_unchanged_documents():
+    source = "from eidos import Source, Sink\nflow = Source('a.csv') >> Sink('out')\n"
+    first = TopologyExtractor.extract_from_source(source)
+    assert first["graphs"][0]["variable"] == "flow"
+
+    with patch("builtins.exec") as executed:
+        assert TopologyExtractor.extract_from_source(source) is first
+    executed.assert_not_called()
+
+def test_lsp_state_is_per_document_and_bounded(monkeypatch):
+    monkeypatch.setattr(TopologyExtractor, "_documents", type(TopologyExtractor._documents)())
+    monkeypatch.setattr("eidos.dx.lsp.MAX_DOCUMENTS", 2)
+    a = "from eidos import Source, Sink\nflow = Source('a.csv') >> Sink('out')\n"
+    b = "from eidos import Source, Sink\nflow = Source('b.csv') >> Sink('out')\n"
+
+    first = TopologyExtractor.extract_from_source(a, "file:///a.py")
+    TopologyExtractor.extract_from_source(b, "file:///b.py")
+    assert TopologyExtractor.extract_from_source(a, "file:///a.py") is first
+
+    TopologyExtractor.extract_from_source(b, "file:///c.py")
+    assert list(TopologyExtractor._documents) == ["file:///a.py", "file:///c.py"]
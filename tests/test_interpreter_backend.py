@@ -0,0 +1,107 @@
+import os
+import pickle
+import subprocess
+import sys
+import textwrap
+from concurrent.futures import Future
+import pytest
+from eidos import Source, Map, Filter, Sink, settings
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler import interpreter_backend
+from eidos.zero.compiler.interpreter_backend import InterpreterSegment
+from eidos.zero.runtime import interpreters
+from eidos.zero.runtime.interpreters import load_stages, pack, run_stages
+from eidos.zero.runtime.store import publish
+
+needs_subinterpreters = pytest.mark.skipif(
+    not interpreters.subinterpreters_available(), reason="needs Python 3.14+ subinterpreters"
+)
+
+def test_packed_calls_run_on_unpickling(monkeypatch):
+    import cloudpickle
+    monkeypatch.delitem(sys.modules, "_eidos_stages", raising=False)
+    path = publish(cloudpickle.dumps((("map", lambda r: r * 10), ("filter", lambda r: r > 10))))
+
+    assert pickle.loads(pack(load_stages, path)) == 2
+    assert pickle.loads(pack(run_stages, path, (1, 2, 3))) == [20, 30]
+
+def test_worker_code_travels_by_value(tmp_path):
+    # Workers must not need eidos (nor Polars/NumPy/PyArrow) to run stages
+    import cloudpickle
+    calls = tmp_path / "calls.pkl"
+    path = publish(cloudpickle.dumps((("map", abs),)))
+    calls.write_bytes(pickle.dumps([
+        pack(load_stages, path),
+        pack(run_stages, path, (-1, -2)),
+    ]))
+    script = (
+        "import pickle, sys; load, run = pickle.load(open(sys.argv[1], 'rb')); pickle.loads(load); "
+        "print(pickle.loads(run), any(m.startswith(('eidos', 'numpy', 'polars', 'pyarrow')) for m in sys.modules))"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    out = subprocess.run([sys.executable, "-c", script, str(calls)], cwd=tmp_path, env=env,
+                         capture_output=True, text=True, check=True).stdout
+
+    assert out.split() == ["[1,", "2]", "False"]
+
+def test_stages_that_fail_to_load_run_inline(monkeypatch):
+    class FailingPool:
+        class executor:
+            @staticmethod
+            def submit(fn, *args):
+                future = Future()
+                future.set_exception(ImportError("polars cannot be loaded in a subinterpreter"))
+                return future
+
+        def stream(self, *args):
+            raise AssertionError("stages that cannot load were sent to the pool")
+
+    monkeypatch.setattr(interpreter_backend, "interpreter_pool", lambda: FailingPool())
+    interpreter_backend._loadable.cache_clear()
+    node = (Source("data://") >> Map(lambda r: r * 10)).node
+
+    assert list(InterpreterSegment(iter([1, 2]), (node,))) == [10, 20]
+    interpreter_backend._loadable.cache_clear()
+
+@pytest.mark.skipif(interpreters.subinterpreters_available(), reason="pre-3.14 behaviour")
+def test_clear_error_before_python_3_14():
+    flow = Source("data://") >> Map(str) >> Sink("memory")
+
+    with pytest.raises(RuntimeError, match="3.14"):
+        Compiler.compile(flow.compile(), target="interpreter", use_cache=False)
+
+@needs_subinterpreters
+def test_udfs_run_on_subinterpreters(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "interpreter_workers", 2)
+    monkeypatch.setattr(settings, "process_chunk_size", 8)
+    path = tmp_path / "bars.csv"
+    path.write_text("close\n" + "\n".join(str(i) for i in range(100)))
+    flow = (Source(f"csv://{path}")
+            >> Map(lambda r: {"close": r["close"] * 2})
+            >> Filter(lambda r: r["close"] % 3 == 0)
+            >> Sink("memory"))
+
+    result = Compiler.compile(flow.compile(), target="interpreter", use_cache=False)()
+
+    assert [r["close"] for r in result] == [float(i * 2) for i in range(100) if (i * 2) % 3 == 0]
+
+@needs_subinterpreters
+def test_runs_share_one_pool_and_fall_back_for_module_udfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "interpreter_workers", 2)
+    # Pickled by reference: loading it in a subinterpreter imports eidos and Polars
+    (tmp_path / "interp_udfs_under_test.py").write_text(textwrap.dedent("""
+        import eidos
+        def triple(r):
+            return r * 3
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    from interp_udfs_under_test import triple
+
+    def run(fn):
+        flow = Source.from_payload(2) >> Map(fn) >> Sink("memory")
+        return Compiler.compile(flow.compile(), target="interpreter", use_cache=False)()
+
+    assert run(lambda r: r + 1) == [3]
+    executor = interpreter_backend.interpreter_pool().executor
+    assert run(triple) == [6]
+    assert interpreter_backend.interpreter_pool().executor is executor
@@ -0,0 +1,39 @@
+import polars as pl
+from eidos import Source, Map, Sink
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.polars_backend import SinkGroup
+
+def test_sinks_share_one_execution(tmp_path):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame({"close": [float(i) for i in range(10)]}).write_csv(path)
+    out = tmp_path / "signals.parquet"
+
+    calls = []
+    def tag(df):
+        calls.append(df.height)
+        return df
+
+    signals = Source(f"csv://{path}") >> Map(tag, batch=True)
+    signals >> Sink(f"parquet://{out}")
+    graph = (signals >> Sink("memory")).compile()
+
+    group = Compiler.compile(graph, target="polars", use_cache=False)
+    assert isinstance(group, SinkGroup) and len(group) == 2
+
+    results = group()
+    assert len(calls) == 1
+    frame = next(r for r in results if r is not None)
+    assert frame.height == 10
+    assert pl.read_parquet(out).equals(frame)
+
+def test_sinks_still_run_individually(tmp_path):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame({"close": [1.0, 2.0]}).write_csv(path)
+
+    bars = Source(f"csv://{path}")
+    bars >> Sink("memory")
+    graph = (bars >> Sink("arrow://")).compile()
+
+    results = [sink() for sink in Compiler.compile(graph, target="polars", use_cache=False)]
+    assert sorted(len(r) for r in results) == [2, 2]
+    assert {type(r).__name__ for r in results} == {"DataFrame", "Table"}
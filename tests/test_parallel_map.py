@@ -0,0 +1,89 @@
+import sys
+import threading
+import pytest
+from eidos import Source, Map, Filter, Sink
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.fusion import fuse_map_filter
+from eidos.zero.runtime import parallel
+from eidos.zero.runtime.parallel import ParallelExecutor, free_threaded
+
+def run(flow):
+    return Compiler.compile((flow >> Sink("memory")).compile(), target="python", use_cache=False)()
+
+def test_parallel_map_keeps_input_order(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text("i\n" + "\n".join(str(i) for i in range(500)))
+    flow = (Source(f"csv://{path}")
+            >> Map(lambda r: {"i": r["i"], "sq": r["i"] ** 2}, parallel=True)
+            >> Filter(lambda r: r["i"] % 3 == 0, parallel=True))
+
+    result = run(flow)
+
+    assert [r["i"] for r in result] == [float(i) for i in range(0, 500, 3)]
+    assert all(r["sq"] == r["i"] ** 2 for r in result)
+
+def test_parallel_runs_fuse_separately_from_serial_ones():
+    flow = (Source("data://") >> Map(str, parallel=True) >> Map(len, parallel=True) >> Map(abs))
+    graph = fuse_map_filter(flow.compile())
+    fused = [n for n in graph.nodes.values() if n.config.get("fn_name") == "str >> len"]
+
+    assert len(fused) == 1 and fused[0].config["parallel"] is True
+    assert any(n.config.get("fn") is abs for n in graph.nodes.values())
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_executors_agree(kind):
+    executor = ParallelExecutor(workers=2, chunk_size=7, kind=kind)
+    try:
+        items = list(range(100))
+        assert list(executor.run("map", lambda x: x * 2, items)) == [x * 2 for x in items]
+        assert list(executor.run("filter", lambda x: x % 5 == 0, items)) == items[::5]
+        assert sorted(executor.run("map", lambda x: -x, items, ordered=False)) == sorted(-x for x in items)
+    finally:
+        executor.shutdown()
+
+def test_in_flight_chunks_are_bounded():
+    executor = ParallelExecutor(workers=2, chunk_size=1, window=3, kind="thread")
+    pulled = 0
+
+    def source():
+        nonlocal pulled
+        for i in range(50):
+            pulled += 1
+            yield i
+
+    output = executor.run("map", lambda x: x, source())
+    assert next(output) == 0
+    assert pulled <= 4
+    output.close()
+    executor.shutdown()
+
+def test_unordered_yields_fast_chunks_first():
+    executor = ParallelExecutor(workers=2, chunk_size=1, kind="thread")
+    release = threading.Event()
+
+    def slow_first(x):
+        if x == 0:
+            release.wait(5)
+        return x
+
+    output = executor.run("map", slow_first, [0, 1], ordered=False)
+    assert next(output) == 1
+    release.set()
+    assert list(output) == [0]
+    executor.shutdown()
+
+def test_unpicklable_udfs_run_inline():
+    lock = threading.Lock()
+    executor = ParallelExecutor(workers=2, kind="process")
+
+    assert list(executor.run("map", lambda x: (lock, x)[1], [1, 2])) == [1, 2]
+    assert executor._executor is None
+
+def test_free_threaded_detection(monkeypatch):
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    assert free_threaded()
+    assert ParallelExecutor(workers=1).kind == "thread"
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: True, raising=False)
+    assert ParallelExecutor(workers=1).kind == "process"
+    monkeypatch.delattr(sys, "_is_gil_enabled", raising=False)
+    assert not parallel.free_threaded()
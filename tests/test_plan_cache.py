@@ -0,0 +1,81 @@
+from unittest.mock import patch
+from eidos import Source, Map, Sink
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.cache import PlanCache, CompiledPlan
+
+def make_flow():
+    return Source("csv://data.csv") >> Map(lambda x: x) >> Sink("memory")
+
+def test_repeated_compile_hits_cache():
+    Compiler.clear_cache()
+
+    first = Compiler.compile(make_flow().compile(), target="string")
+    with patch("eidos.zero.compiler.transpiler.LineageRegistry.register") as register:
+        second = Compiler.compile(make_flow().compile(), target="string")
+        register.assert_not_called()
+
+    assert first == second
+    stats = Compiler.cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+def test_targets_are_cached_separately():
+    Compiler.clear_cache()
+    graph = make_flow().compile()
+
+    Compiler.compile(graph, target="string")
+    Compiler.compile(graph, target="dolphindb")
+
+    assert Compiler.cache_stats().misses == 2
+
+def test_python_plans_are_rewired_on_hit():
+    Compiler.clear_cache()
+    flow = Source.from_payload({"a": 1}) >> Sink("collect")
+
+    first = Compiler.compile(flow.compile(), target="python")
+    second = Compiler.compile(flow.compile(), target="python")
+
+    # Generators are single-shot, so each hit must produce a fresh pipeline
+    assert first is not second
+    assert first() == second() == [{"a": 1}]
+    assert Compiler.cache_stats().hits == 1
+
+def test_python_hits_do_not_walk_the_graph():
+    Compiler.clear_cache()
+    flow = Source.from_payload({"a": 1}) >> Map(lambda r: r) >> Sink("collect")
+    Compiler.compile(flow.compile(), target="python")
+
+    with patch("eidos.zero.symbolism.ast.Graph.topological_order", side_effect=AssertionError("graph walked")), \
+         patch("eidos.zero.compiler.transpiler.Optimizer.optimize", side_effect=AssertionError("re-optimized")):
+        plan = Compiler.compile(flow.compile(), target="python")
+
+    assert plan() == [{"a": 1}]
+
+def test_payloads_are_bound_per_lookup():
+    Compiler.clear_cache()
+    flows = [Source.from_payload({"a": a}) >> Map(lambda r: r) >> Sink("collect") for a in (1, 2)]
+    graphs = [f.compile() for f in flows]
+
+    # The payload is a bind-time parameter, not part of the plan's identity
+    assert graphs[0].fingerprint == graphs[1].fingerprint
+    assert Compiler.compile(graphs[0], target="python")() == [{"a": 1}]
+    assert Compiler.compile(graphs[1], target="python")() == [{"a": 2}]
+    assert Compiler.cache_stats().hits == 1
+
+def test_lru_eviction():
+    cache = PlanCache(max_size=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, CompiledPlan(artifact=key))
+
+    assert cache.get("a") is None
+    assert cache.get("c").materialize() == "c"
+    stats = cache.stats
+    assert stats.evictions == 1
+    assert stats.size == 2
+
+if __name__ == "__main__":
+    test_repeated_compile_hits_cache()
+    test_targets_are_cached_separately()
+    test_python_plans_are_rewired_on_hit()
+    test_payloads_are_bound_per_lookup()
+    test_lru_eviction()
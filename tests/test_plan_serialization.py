@@ -0,0 +1,64 @@
+import pyarrow as pa
+from eidos import Source, Map, Filter, Sink
+from eidos.quant.indicators import SMA
+from eidos.zero.compiler import Compiler
+from eidos.zero.symbolism import OpType
+from eidos.zero.runtime.serializer import PlanSerializer
+
+def test_round_trip_preserves_structure_and_udfs():
+    factor = 3
+    scale = lambda r: r * factor
+    graph = (
+        Source.from_payload(2) >> Map(scale) >> Filter(lambda r: r > 1) >> Map(scale) >> Sink("memory")
+    ).compile()
+
+    restored = PlanSerializer.loads(PlanSerializer.dumps(graph))
+
+    assert restored.id == graph.id
+    assert restored.fingerprint == graph.fingerprint
+    assert restored.edges == graph.edges
+    run = Compiler.compile(restored, target="python", use_cache=False)
+    assert run() == [18]
+
+def test_udfs_are_encoded_once():
+    double = lambda r: r * 2
+    left = Source("A") >> Map(double) >> Sink("memory")
+    right = Source("B") >> Map(double) >> Sink("memory")
+    data = PlanSerializer.dumps((left + right).compile())
+
+    # Skip the header and read the UDF table directly
+    header = len(PlanSerializer.MAGIC) + 2
+    header += 4 + int.from_bytes(data[header:header + 4], "little")
+    udfs = pa.ipc.open_stream(pa.BufferReader(data[header:])).read_all()
+    assert udfs.num_rows == 1
+
+def test_udfs_differing_only_in_globals_round_trip():
+    def thresholded(threshold):
+        namespace = {"TH": threshold}
+        exec('pred = lambda r: r > TH', namespace)
+        return namespace["pred"]
+
+    left = Source("A") >> Filter(thresholded(5)) >> Sink("memory")
+    right = Source("B") >> Filter(thresholded(1)) >> Sink("memory")
+    restored = PlanSerializer.loads(PlanSerializer.dumps((left + right).compile()))
+
+    predicates = {
+        node.parents[0]: node.config["predicate"]
+        for node in restored.nodes.values() if node.op_type == OpType.FILTER
+    }
+    sources = {restored.nodes[p].config["uri"]: fn for p, fn in predicates.items()}
+    assert sources["A"](3) is False
+    assert sources["B"](3) is True
+
+def test_save_and_load(tmp_path):
+    graph = (Source("prices") >> SMA(window=20) >> Sink("memory")).compile()
+    path = PlanSerializer.save(graph, tmp_path / "plan.eidos")
+
+    restored = PlanSerializer.load(path)
+    assert restored.fingerprint == graph.fingerprint
+    assert Compiler.compile(restored) == Compiler.compile(graph)
+
+if __name__ == "__main__":
+    test_round_trip_preserves_structure_and_udfs()
+    test_udfs_are_encoded_once()
+    test_udfs_differing_only_in_globals_round_trip()
@@ -0,0 +1,82 @@
+import polars as pl
+import eidos
+from eidos import Source, Map, Sink
+from eidos.quant.indicators import SMA
+from eidos.system.config import settings
+from eidos.zero.compiler.planner import Planner, StatsStore, stats_store
+
+def make_planner(tmp_path):
+    return Planner(StatsStore(tmp_path / "stats.json"))
+
+def test_small_payload_takes_python_lane(tmp_path):
+    graph = (Source.from_payload({"x": 1}) >> Map(lambda r: r) >> Sink("memory")).compile()
+    assert make_planner(tmp_path).choose(graph) == "python"
+
+def test_parquet_footer_sizes_the_input(tmp_path, monkeypatch):
+    path = tmp_path / "bars.parquet"
+    pl.DataFrame({"close": [float(i) for i in range(50_000)]}).write_parquet(path)
+    graph = (Source(f"parquet://{path}") >> SMA(window=5)).compile()
+    planner = make_planner(tmp_path)
+
+    estimate = planner.estimate(graph.sources[0])
+    assert estimate.rows == 50_000
+    assert planner.choose(graph) == "polars"
+
+    # Row counts are cached in the stats file, keyed by path
+    planner.stats.flush()
+    assert str(path) in StatsStore(tmp_path / "stats.json")._load()["sources"]
+
+    # Multi-GB inputs go to Ray when installed, otherwise stay on Polars
+    monkeypatch.setattr(settings, "planner_large_bytes", 1)
+    monkeypatch.setattr("eidos.zero.compiler.planner._installed", lambda t: True)
+    assert planner.choose(graph) == "ray"
+
+def test_measured_runtimes_override_estimates(tmp_path):
+    graph = (Source.from_payload({"x": 1}) >> Sink("memory")).compile()
+    planner = make_planner(tmp_path)
+    planner.stats.record_run(graph.fingerprint, "python", 2.0)
+    planner.stats.record_run(graph.fingerprint, "polars", 0.5)
+    planner.stats.flush()
+
+    assert make_planner(tmp_path).choose(graph) == "polars"
+
+def test_run_auto_records_runtime(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "stats_path", str(tmp_path / "stats.json"))
+    flow = Source.from_payload({"x": 1}) >> Map(lambda r: r["x"] + 1) >> Sink("memory")
+
+    assert eidos.run(flow, engine="auto")() == [2]
+    assert "python" in stats_store(str(tmp_path / "stats.json")).runtimes(flow.compile().fingerprint)
+
+def test_stats_are_written_in_the_background(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "stats_flush_seconds", 0.05)
+    store = StatsStore(tmp_path / "stats.json")
+    store.record_run("plan", "python", 1.0)
+    timer = store._timer
+    assert not (tmp_path / "stats.json").exists()
+
+    timer.join()
+    assert StatsStore(tmp_path / "stats.json").runtimes("plan") == {"python": 1.0}
+
+def test_run_history_keeps_the_most_recent_plans(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "stats_max_plans", 2)
+    store = StatsStore(tmp_path / "stats.json")
+    for plan in ("a", "b", "a", "c"):
+        store.record_run(plan, "python", 1.0)
+
+    assert list(store._load()["runs"]) == ["a", "c"]
+    store.flush()
+
+def test_the_other_lane_is_timed_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "planner_explore_after", 2)
+    graph = (Source.from_payload({"x": 1}) >> Sink("memory")).compile()
+    planner = make_planner(tmp_path)
+    for seconds in (0.2, 0.2):
+        assert planner.choose(graph) == "python"
+        planner.stats.record_run(graph.fingerprint, "python", seconds)
+
+    assert planner.choose(graph) == "polars"
+    planner.stats.record_run(graph.fingerprint, "polars", 0.1)
+    assert planner.choose(graph) == "polars"
+    planner.stats.record_run(graph.fingerprint, "polars", 0.5)
+    assert planner.choose(graph) == "python"
+    planner.stats.flush()
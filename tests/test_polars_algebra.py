@@ -0,0 +1,57 @@
+import polars as pl
+from eidos import Source, Filter, Sink, col
+from eidos.quant.indicators import SMA, EMA
+from eidos.zero.symbolism import OpType
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.optimizer import expand_operator_algebra
+
+def write(tmp_path, name, **columns):
+    path = tmp_path / f"{name}.csv"
+    pl.DataFrame(columns).write_csv(path)
+    return f"csv://{path}"
+
+def run(flow):
+    return Compiler.compile(flow.compile(), target="polars", use_cache=False).collect()
+
+def test_merge_concats_both_branches(tmp_path):
+    a = write(tmp_path, "a", ts=[1, 3], close=[1.0, 3.0])
+    b = write(tmp_path, "b", ts=[2, 4], close=[2.0, 4.0])
+
+    assert run(Source(a) + Source(b))["ts"].to_list() == [1, 3, 2, 4]
+    assert run(Source(a).merge(Source(b), on="ts"))["ts"].to_list() == [1, 2, 3, 4]
+
+def test_ensemble_aligns_signals_side_by_side(tmp_path):
+    bars = Source(write(tmp_path, "bars", close=[float(i) for i in range(1, 7)]))
+    df = run((bars >> SMA(window=2)) & (bars >> EMA(window=2)))
+
+    assert df.columns == ["close", "sma_2", "ema_2"]
+    assert df.height == 6
+
+def test_ensemble_stops_at_the_shortest_branch_like_the_python_lane(tmp_path):
+    prices = Source(write(tmp_path, "prices", close=[1.0, 2.0, 3.0, 4.0]))
+    volumes = Source(write(tmp_path, "volumes", volume=[10, 20, 30, 40])) >> Filter(col("volume") > 20)
+    flow = (prices & volumes) >> Sink("memory")
+
+    polars_rows = Compiler.compile(flow.compile(), target="polars", use_cache=False)().to_dicts()
+    python_rows = Compiler.compile(flow.compile(), target="python", use_cache=False)()
+
+    assert polars_rows == python_rows == [{"close": 1.0, "volume": 30}, {"close": 2.0, "volume": 40}]
+
+def test_choice_falls_back_when_primary_is_empty(tmp_path):
+    primary = write(tmp_path, "cache", close=[1.0, 2.0])
+    backup = write(tmp_path, "db", close=[9.0])
+
+    assert run(Source(primary) | Source(backup))["close"].to_list() == [1.0, 2.0]
+    fallback = (Source(primary) >> Filter(col("close") > 5)) | Source(backup)
+    assert run(fallback)["close"].to_list() == [9.0]
+
+def test_operator_level_algebra_is_expanded(tmp_path):
+    bars = Source(write(tmp_path, "bars", close=[float(i) for i in range(1, 31)]))
+    graph = (bars >> (SMA(window=5) & EMA(window=3))).compile()
+
+    expanded = expand_operator_algebra(graph)
+    ensemble = next(n for n in expanded.nodes.values() if n.op_type == OpType.ENSEMBLE)
+    assert len(ensemble.parents) == 2
+
+    df = Compiler.compile(graph, target="polars", use_cache=False).collect()
+    assert {"sma_5", "ema_3"} <= set(df.columns)
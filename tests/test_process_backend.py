@@ -0,0 +1,94 @@
+import os
+import threading
+import pytest
+from eidos import Source, Map, Filter, WithColumn, Sink, col, settings
+from eidos.quant.indicators import SMA
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler import process_backend
+from eidos.zero.compiler.process_backend import Segment
+
+@pytest.fixture
+def bars(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "process_workers", 2)
+    monkeypatch.setattr(settings, "process_chunk_size", 16)
+    path = tmp_path / "bars.csv"
+    path.write_text("close\n" + "\n".join(str(100 + (i * 13) % 7) for i in range(200)))
+    return f"csv://{path}"
+
+def run(flow, target):
+    return Compiler.compile((flow >> Sink("memory")).compile(), target=target, use_cache=False)()
+
+def pipeline(uri):
+    return (Source(uri)
+            >> Map(lambda r: {**r, "pid": os.getpid()})
+            >> Filter(lambda r: r["close"] > 101)
+            >> WithColumn("double", col("close") * 2)
+            >> SMA(window=5))
+
+def test_matches_the_python_lane_in_order(bars):
+    ours = run(pipeline(bars), "process")
+    reference = run(pipeline(bars), "python")
+
+    assert [{k: v for k, v in r.items() if k != "pid"} for r in ours] == \
+           [{k: v for k, v in r.items() if k != "pid"} for r in reference]
+    assert os.getpid() not in {r["pid"] for r in ours}
+
+def test_row_local_runs_become_one_segment(bars):
+    backend = Compiler._resolve_backend("process")[0]()
+    flow = Source(bars) >> Map(lambda r: r) >> WithColumn("x", col("close") + 1)
+    nodes = [flow.graph.nodes[n] for n in flow.graph.topological_order()]
+    artifact = None
+    for node in nodes:
+        artifact = backend.compile_node(node, [artifact] if artifact is not None else [])
+
+    assert isinstance(artifact, Segment)
+    assert [n.op_type.value for n in artifact.nodes] == ["Map", "WithColumn"]
+
+def test_unpicklable_udfs_run_in_the_driver(bars):
+    lock = threading.Lock()
+    flow = Source(bars) >> Map(lambda r: (lock, os.getpid())[1])
+
+    assert set(run(flow, "process")) == {os.getpid()}
+
+def test_runs_reuse_one_worker_pool(bars):
+    run(pipeline(bars), "process")
+    executor = process_backend.process_pool().executor
+    run(pipeline(bars), "process")
+
+    assert process_backend.process_pool().executor is executor
+
+class _LogUnpickling:
+    """Appends the unpickling process's pid to `path`."""
+    def __init__(self, path):
+        self.path = str(path)
+
+    def __reduce__(self):
+        return exec, (f"import os; open({self.path!r}, 'a').write(f'{{os.getpid()}}\\n')",)
+
+def test_segments_reach_each_worker_once(bars, tmp_path, monkeypatch):
+    log = tmp_path / "unpickled.log"
+    marker = _LogUnpickling(log)
+    payloads = []
+    stream = process_backend.ParallelExecutor.stream
+    def spy(self, kernel, payload, items, ordered=True):
+        payloads.append(payload)
+        return stream(self, kernel, payload, items, ordered)
+    monkeypatch.setattr(process_backend.ParallelExecutor, "stream", spy)
+
+    # 200 rows in chunks of 16: many more chunks than the two workers
+    result = run(Source(bars) >> Map(lambda r: (marker, r)[1]), "process")
+
+    assert len(result) == 200
+    # Chunks carry a short key, not the serialized segment
+    assert len(payloads) == 1 and isinstance(payloads[0], str)
+    pids = log.read_text().split()
+    assert 1 <= len(pids) == len(set(pids)) <= 2
+    assert str(os.getpid()) not in pids
+
+def test_segments_without_udfs_run_inline(bars, monkeypatch):
+    def no_pool():
+        raise AssertionError("a UDF-free segment was shipped to worker processes")
+    monkeypatch.setattr(process_backend, "process_pool", no_pool)
+
+    result = run(Source(bars) >> WithColumn("double", col("close") * 2), "process")
+    assert result[0] == {"close": 100.0, "double": 200.0}
@@ -0,0 +1,65 @@
+import polars as pl
+from eidos import Source, Map, Filter, WithColumn, Select, Window, Sink, col
+from eidos.quant.indicators import SMA, ATR
+from eidos.zero.symbolism import OpType
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.pushdown import push_down_projections
+
+WIDE = {f"extra_{i}": [0.0, 0.0, 0.0] for i in range(40)}
+
+def write_bars(tmp_path, fmt="parquet"):
+    df = pl.DataFrame({
+        "close": [1.0, 2.0, 3.0], "high": [1.5, 2.5, 3.5], "low": [0.5, 1.5, 2.5],
+        "volume": [10, 20, 30], **WIDE
+    })
+    path = tmp_path / f"bars.{fmt}"
+    df.write_parquet(path) if fmt == "parquet" else df.write_csv(path)
+    return f"{fmt}://{path}"
+
+def source_columns(graph):
+    return next(n for n in graph.nodes.values() if n.op_type == OpType.SOURCE).config.get("columns")
+
+def test_indicator_inputs_reach_the_scan(tmp_path):
+    flow = (
+        Source(write_bars(tmp_path))
+        >> SMA(window=2)
+        >> ATR(window=2)
+        >> Filter(col("volume") > 10)
+        >> Select("sma_2", "atr_2")
+    )
+    pushed = push_down_projections(flow.compile())
+    assert source_columns(pushed) == ["close", "high", "low", "volume"]
+
+def test_sinks_and_udfs_keep_every_column(tmp_path):
+    uri = write_bars(tmp_path)
+    assert source_columns(push_down_projections((Source(uri) >> SMA(window=2) >> Sink("memory")).compile())) is None
+    flow = Source(uri) >> Map(lambda r: r) >> Select("close")
+    assert source_columns(push_down_projections(flow.compile())) is None
+
+def test_expressions_and_window_aggregates_narrow_without_select(tmp_path):
+    uri = write_bars(tmp_path)
+    flow = Source(uri) >> Filter(col("volume") > 10) >> Map(col("close") * 2) >> Sink("memory")
+    assert source_columns(push_down_projections(flow.compile())) == ["close", "volume"]
+
+    flow = Source(uri) >> Window(2, agg={"hi": ("high", "max")}) >> Sink("memory")
+    assert source_columns(push_down_projections(flow.compile())) == ["high"]
+    rows = Compiler.compile(flow.compile(), target="polars", use_cache=False)()
+    assert rows["hi"].to_list() == [2.5, 3.5]
+
+def test_polars_scans_only_required_columns(tmp_path):
+    flow = Source(write_bars(tmp_path)) >> WithColumn("range", col("high") - col("low")) >> Select("range")
+    lazy = Compiler.compile(flow.compile(), target="polars", use_cache=False)
+
+    assert lazy.collect()["range"].to_list() == [1.0, 1.0, 1.0]
+    plan = lazy.explain()
+    assert "extra_0" not in plan
+
+def test_python_csv_reader_drops_unused_columns(tmp_path):
+    flow = Source(write_bars(tmp_path, fmt="csv")) >> SMA(window=2) >> Select("close", "sma_2") >> Sink("memory")
+    assert source_columns(push_down_projections(flow.compile())) == ["close"]
+    rows = Compiler.compile(flow.compile(), target="python", use_cache=False)()
+    assert rows == [
+        {"close": 1.0, "sma_2": None},
+        {"close": 2.0, "sma_2": 1.5},
+        {"close": 3.0, "sma_2": 2.5},
+    ]
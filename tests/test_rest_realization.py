@@ -15,6 +15,10 @@ from eidos.interfaces.rest import RestPort
 def predict(payload):
     return Source.from_payload(payload) >> Map(lambda x: {"res": x["val"] * 2})
 
+@expose(route="/scale", method="POST")
+def scale(payload):
+    return Source.from_payload(payload) >> Map(lambda x: {"res": x["val"] * 2}) >> Sink("collect")
+
 class TestRestRealization(unittest.TestCase):
     @patch("uvicorn.run")
     def test_server_startup(self, mock_run):
@@ -77,5 +81,50 @@ class TestRestRealization(unittest.TestCase):
         
         loop.close()
 
+    @patch("eidos.zero.compiler.Compiler.compile")
+    def test_planned_polars_sinks_return_rows(self, mock_compile):
+        import polars as pl
+        from eidos.system.config import settings
+
+        # A planned Polars sink action returns a DataFrame, not a list of rows
+        mock_compile.return_value = lambda: pl.DataFrame({"res": [4]})
+        port = RestPort()
+        port.planner = MagicMock()
+        port.planner.choose.return_value = "polars"
+        port.planner.timed.side_effect = lambda graph, target, action: action
+        port._register_route(predict)
+        endpoint = [r for r in port.app.routes if getattr(r, "path", "") == "/predict"][0].endpoint
+
+        mock_request = MagicMock()
+        mock_request.json = AsyncMock(return_value={"val": 2})
+        with patch.object(settings, "default_backend", "auto"):
+            response = asyncio.run(endpoint(mock_request))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.body), [{"res": 4}])
+
+    def test_requests_with_different_bodies_share_a_plan(self):
+        from eidos.system.config import settings
+        from eidos.zero.compiler import Compiler
+
+        Compiler.clear_cache()
+        port = RestPort()
+        port.planner = MagicMock()
+        port.planner.choose.return_value = "python"
+        port.planner.timed.side_effect = lambda graph, target, action: action
+        port._register_route(scale)
+        endpoint = [r for r in port.app.routes if getattr(r, "path", "") == "/scale"][0].endpoint
+
+        bodies = []
+        with patch.object(settings, "default_backend", "auto"):
+            for val in (2, 5):
+                mock_request = MagicMock()
+                mock_request.json = AsyncMock(return_value={"val": val})
+                bodies.append(json.loads(asyncio.run(endpoint(mock_request)).body))
+
+        self.assertEqual(bodies, [[{"res": 4}], [{"res": 10}]])
+        stats = Compiler.cache_stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
 if __name__ == "__main__":
     unittest.main()
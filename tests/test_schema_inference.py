@@ -0,0 +1,50 @@
+import pyarrow as pa
+import polars as pl
+from eidos import Source, Map, Filter, WithColumn, Sink, col
+from eidos.quant.indicators import SMA, MACD
+from eidos.zero.compiler import Compiler
+from eidos.zero.compiler.python_backend import PythonBackend
+from eidos.zero.compiler.schema import infer_schemas, output_schema
+from eidos.interfaces.flight_sql import EidosFlightServer
+
+def write_bars(tmp_path):
+    path = tmp_path / "bars.csv"
+    pl.DataFrame({"symbol": ["A", "B"], "close": [10.5, 11.0], "volume": [100, 200]}).write_csv(path)
+    return f"csv://{path}"
+
+def test_schema_propagates_through_indicators(tmp_path):
+    flow = Source(write_bars(tmp_path)) >> SMA(window=5) >> MACD() >> Filter(col("close") > 0)
+    schema = output_schema(flow.compile())
+
+    assert schema.names == ["symbol", "close", "volume", "sma_5", "macd", "macd_signal", "macd_hist"]
+    assert schema.field("volume").type == pa.int64()
+    assert schema.field("sma_5").type == pa.float64()
+
+def test_expressions_are_typed_and_udfs_stop_propagation(tmp_path):
+    source = Source(write_bars(tmp_path))
+    typed = output_schema((source >> WithColumn("notional", col("close") * col("volume"))).compile())
+    assert typed.field("notional").type == pa.float64()
+
+    graph = infer_schemas((source >> Map(lambda r: r) >> Sink("memory")).compile())
+    sink = graph.sinks[0]
+    assert sink.schema_out is None
+    assert graph.sources[0].schema_out is not None
+
+def test_python_lane_reads_typed_records(tmp_path):
+    graph = (Source(write_bars(tmp_path)) >> Sink("memory")).compile()
+    rows = Compiler.compile(graph, target="python", use_cache=False)()
+    assert rows[0] == {"symbol": "A", "close": 10.5, "volume": 100}
+    assert isinstance(rows[0]["volume"], int)
+
+def test_values_outside_the_inferred_type_fall_back(tmp_path):
+    path = tmp_path / "gaps.csv"
+    path.write_text("volume,close\n" + "100,1.5\n" * 5 + "NA,NA\n2.5,2\n")
+    schema = pa.schema([("volume", pa.int64()), ("close", pa.float64())])
+
+    rows = list(PythonBackend()._read_csv(str(path), schema))
+    assert rows[-2:] == [{"volume": "NA", "close": "NA"}, {"volume": 2.5, "close": 2.0}]
+
+def test_flight_sql_reports_plan_schema(tmp_path):
+    uri = write_bars(tmp_path)
+    server = EidosFlightServer("grpc://localhost:0", {"bars": lambda: Source(uri) >> SMA(window=3)})
+    assert server._schema_for("bars").names == ["symbol", "close", "volume", "sma_3"]
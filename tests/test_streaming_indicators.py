@@ -0,0 +1,58 @@
+import itertools
+import random
+import pytest
+from eidos.quant import python_impl
+from eidos.quant.streaming import STREAMING_INDICATORS
+
+def bars(n, seed=7):
+    rng = random.Random(seed)
+    close, rows = 100.0, []
+    for _ in range(n):
+        close += rng.uniform(-2, 2)
+        rows.append({
+            "close": close, "price": close,
+            "high": close + rng.uniform(0, 1), "low": close - rng.uniform(0, 1),
+            "volume": rng.randint(1, 1000)
+        })
+    return rows
+
+CASES = [
+    ("SMA", python_impl.calculate_sma, {"window": 5, "field": "close"}),
+    ("EMA", python_impl.calculate_ema, {"window": 5, "field": "close"}),
+    ("WMA", python_impl.calculate_wma, {"window": 5, "field": "close"}),
+    ("RSI", python_impl.calculate_rsi, {"window": 14, "field": "close"}),
+    ("MACD", python_impl.calculate_macd, {"fast": 12, "slow": 26, "signal": 9, "field": "close"}),
+    ("BBands", python_impl.calculate_bbands, {"window": 20, "std_dev": 2, "field": "close"}),
+    ("Stoch", python_impl.calculate_stoch, {"window": 14, "smooth": 3, "high": "high", "low": "low", "close": "close"}),
+    ("CCI", python_impl.calculate_cci, {"window": 14, "high": "high", "low": "low", "close": "close"}),
+    ("ADX", python_impl.calculate_adx, {"window": 14}),
+    ("ATR", python_impl.calculate_atr, {"window": 14}),
+    ("OBV", python_impl.calculate_obv, {}),
+    ("VWAP", python_impl.calculate_vwap, {}),
+]
+
+def assert_same_rows(actual, expected):
+    assert len(actual) == len(expected)
+    for got, want in zip(actual, expected):
+        assert got.keys() == want.keys()
+        assert got == pytest.approx(want, rel=1e-9, abs=1e-9)
+
+@pytest.mark.parametrize("kind, batch, kwargs", CASES, ids=[c[0] for c in CASES])
+def test_streaming_matches_batch_implementation(kind, batch, kwargs):
+    data = bars(300)
+    assert_same_rows(list(STREAMING_INDICATORS[kind](**kwargs)(data)), batch(data, **kwargs))
+
+@pytest.mark.parametrize("kind, batch, kwargs", CASES[:3] + CASES[5:6], ids=["SMA", "EMA", "WMA", "BBands"])
+def test_missing_values_match_batch_implementation(kind, batch, kwargs):
+    data = bars(60)
+    for i in (10, 11, 30):
+        data[i]["close"] = None
+    assert_same_rows(list(STREAMING_INDICATORS[kind](**kwargs)(data)), batch(data, **kwargs))
+
+def test_indicators_run_over_unbounded_streams():
+    ticks = ({"close": float(i % 17)} for i in itertools.count())
+    rsi = STREAMING_INDICATORS["RSI"](window=14, field="close")
+    head = list(itertools.islice(rsi(ticks), 1000))
+
+    assert head[13]["rsi_14"] is None and head[14]["rsi_14"] is not None
+    assert len(rsi.gains.values) == 14
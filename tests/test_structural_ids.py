@@ -0,0 +1,66 @@
+from eidos import Source, Map, Filter, Sink
+from eidos.quant.indicators import SMA
+from eidos.zero.symbolism import fingerprint
+
+def build(window: int = 20, offset: int = 1):
+    return (
+        Source("parquet://prices.parquet")
+        >> SMA(window=window)
+        >> Map(lambda x: x + offset)
+        >> Sink("memory")
+    )
+
+def test_identical_pipelines_share_ids():
+    g1 = build().compile()
+    g2 = build().compile()
+
+    assert set(g1.nodes) == set(g2.nodes)
+    assert g1.fingerprint == g2.fingerprint
+    # Graph.id stays a per-instance identity
+    assert g1.id != g2.id
+
+def test_config_and_closure_change_ids():
+    base = build().compile()
+
+    assert build(window=21).compile().fingerprint != base.fingerprint
+    # Same code object, different closure value
+    assert build(offset=2).compile().fingerprint != base.fingerprint
+
+def test_udf_hash_ignores_definition_site():
+    f = lambda x: x > 0
+    g = lambda x: x > 0
+    h = lambda x: x > 1
+
+    assert fingerprint(f) == fingerprint(g)
+    assert fingerprint(f) != fingerprint(h)
+
+def test_parents_are_part_of_identity():
+    a = Source("A") >> Filter(lambda x: True)
+    b = Source("B") >> Filter(lambda x: True)
+
+    assert a.node.id != b.node.id
+    assert (Source("A") + Source("B")).node.id != (Source("B") + Source("A")).node.id
+
+def test_recursive_udf_is_hashable():
+    def fact(n):
+        return 1 if n <= 1 else n * fact(n - 1)
+
+    assert fingerprint(fact) == fingerprint(fact)
+
+def test_udf_hash_includes_referenced_globals():
+    def udf(threshold):
+        namespace = {"TH": threshold}
+        exec('pred = lambda r: r["v"] > TH', namespace)
+        return namespace["pred"]
+
+    assert fingerprint(udf(5)) != fingerprint(udf(1))
+    assert fingerprint(udf(5)) == fingerprint(udf(5))
+    assert (Source("A") >> Filter(udf(5))).node.id != (Source("A") >> Filter(udf(1))).node.id
+
+if __name__ == "__main__":
+    test_identical_pipelines_share_ids()
+    test_config_and_closure_change_ids()
+    test_udf_hash_ignores_definition_site()
+    test_parents_are_part_of_identity()
+    test_recursive_udf_is_hashable()
+    test_udf_hash_includes_referenced_globals()
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+import polars as pl
+import pytest
+from eidos import Source, Window, Map, Sink
+from eidos.zero.compiler import Compiler
+from eidos.zero.runtime.window import RingBuffer, parse_duration, windows
+
+AGG = {"total": ("v", "sum"), "avg": ("v", "mean"), "n": ("v", "count"),
+       "lo": ("v", "min"), "hi": ("v", "max"), "open": ("v", "first"), "close": ("v", "last")}
+
+@pytest.fixture
+def ticks(tmp_path):
+    path = tmp_path / "ticks.csv"
+    ts = [0, 1, 2, 4, 5, 9, 10, 11, 17, 30, 31, 33, 34, 40, 52, 53]
+    pl.DataFrame({"ts": ts, "v": [float((i * 7) % 11) for i in range(len(ts))]}).write_csv(path)
+    return f"csv://{path}"
+
+def run_both(uri, *args, **kwargs):
+    python = Compiler.compile((Source(uri) >> Window(*args, **kwargs) >> Sink("memory")).compile(),
+                              target="python", use_cache=False)()
+    polars = Compiler.compile((Source(uri) >> Window(*args, **kwargs)).compile(),
+                              target="polars", use_cache=False).collect().to_dicts()
+    return python, polars
+
+@pytest.mark.parametrize("args, kwargs", [
+    ((4,), {}),                 # sliding by rows
+    ((4, 4), {}),               # tumbling
+    ((4, 3), {}),               # hopping
+    ((2, 5), {}),               # hopping with gaps
+    ((10,), {"on": "ts"}),      # trailing event-time window
+    ((10, 10), {"on": "ts"}),   # tumbling, with empty windows skipped
+    ((10, 4), {"on": "ts"}),    # hopping
+])
+def test_python_lane_matches_polars(ticks, args, kwargs):
+    python, polars = run_both(ticks, *args, **kwargs, agg=AGG)
+
+    assert len(python) == len(polars) > 0
+    for ours, theirs in zip(python, polars):
+        assert ours == pytest.approx(theirs)
+
+def test_sliding_windows_can_be_zero_copy_views():
+    rows = [{"v": i} for i in range(6)]
+    views = windows(rows, 3, views=True)
+
+    first = next(views)
+    assert [r["v"] for r in first] == [0, 1, 2]
+    assert first[0] is rows[0]
+    second = next(views)
+    assert [r["v"] for r in second[:]] == [1, 2, 3]
+    with pytest.raises(RuntimeError, match="stale"):
+        first[0]
+
+def test_windows_outlive_the_next_window(ticks):
+    plan = Compiler.compile((Source(ticks) >> Window(3, 3) >> Sink("memory")).compile(),
+                            target="python", use_cache=False)
+    result = plan()
+
+    assert [[r["ts"] for r in w] for w in result[:2]] == [[0, 1, 2], [4, 5, 9]]
+
+@pytest.mark.parametrize("target, parallel", [("python", False), ("python", True), ("columnar", False)])
+def test_downstream_operators_can_keep_windows(ticks, target, parallel):
+    def total(window):
+        return {"w": window, "total": sum(r["v"] for r in window)}
+
+    plan = Compiler.compile((Source(ticks) >> Window(3) >> Map(total, parallel=parallel) >> Sink("memory")).compile(),
+                            target=target, use_cache=False)
+    result = plan()
+    if target == "columnar":
+        result = result.to_pylist()
+
+    assert len(result) == 14
+    assert [r["ts"] for r in result[0]["w"]] == [0, 1, 2]
+    assert result[-1]["total"] == sum(r["v"] for r in result[-1]["w"])
+
+def test_datetime_windows_align_to_the_epoch():
+    start = datetime(2024, 1, 1, 9, 58)
+    rows = [{"ts": start + timedelta(minutes=m), "v": 1.0} for m in (0, 1, 3, 4, 11)]
+    result = list(windows(rows, "5m", "5m", on="ts", agg={"n": ("v", "count")}))
+
+    assert [(r["ts"].strftime("%H:%M"), r["n"]) for r in result] == [("09:55", 2), ("10:00", 2), ("10:05", 1)]
+
+def test_ring_buffer_grows_and_keeps_order():
+    buffer = RingBuffer(2)
+    for i in range(5):
+        buffer.push(i)
+    buffer.popleft()
+    buffer.push(5)
+
+    assert [buffer[i] for i in range(len(buffer))] == [1, 2, 3, 4, 5]
+    assert buffer.first_position == 1
+
+def test_durations_and_unknown_aggregates():
+    assert parse_duration("1h30m") == timedelta(minutes=90)
+    assert parse_duration(20) == 20
+    with pytest.raises(ValueError):
+        parse_duration("5 minutes")
+    with pytest.raises(ValueError, match="median"):
+        list(windows([{"v": 1}], 1, agg={"m": ("v", "median")}))